@@ -0,0 +1,67 @@
+import pytest
+
+from virtool_workflow.api.acquire import acquire_job_by_id
+from virtool_workflow.api.client import api_client
+from virtool_workflow.api.session import (
+    connections_created,
+    connections_reused,
+    get_connection_reuse_rate,
+    http_session,
+    warm_connections,
+)
+from virtool_workflow.pytest_plugin.data import Data
+from virtool_workflow.runtime.config import RunConfig
+from virtool_workflow.runtime.metrics import registry
+
+
+@pytest.fixture(autouse=True)
+def _reset_metrics():
+    registry.reset()
+    yield
+    registry.reset()
+
+
+async def test_reuse(data: Data, run_config: RunConfig):
+    """Test that acquisition and subsequent API requests share pooled connections."""
+    async with http_session(run_config) as http:
+        job = await acquire_job_by_id(
+            run_config.jobs_api_connection_string,
+            data.job.id,
+            http,
+        )
+
+        async with api_client(
+            run_config.jobs_api_connection_string,
+            job.id,
+            job.key,
+            http,
+        ) as api:
+            for _ in range(3):
+                await api.put_json(f"/jobs/{job.id}/ping", {})
+
+    assert connections_created.value() == 1
+    assert connections_reused.value() == 3
+    assert get_connection_reuse_rate() == 0.75
+
+
+def test_reuse_rate_no_connections():
+    """Test that the reuse rate is zero when no connections have been made."""
+    assert get_connection_reuse_rate() == 0.0
+
+
+async def test_warm_connections(data: Data, run_config: RunConfig):
+    """Test that warmed connections are reused by the first requests for a job."""
+    async with http_session(run_config) as http:
+        await warm_connections(http, run_config.jobs_api_connection_string, 2)
+
+        assert connections_created.value() == 2
+
+        job = await acquire_job_by_id(
+            run_config.jobs_api_connection_string,
+            data.job.id,
+            http,
+        )
+
+    assert job.id == data.job.id
+    assert connections_created.value() == 2
+    assert connections_reused.value() == 1
@@ -1,14 +1,29 @@
+import gzip
+import json
 import time
+from datetime import date
+from enum import Enum
+from uuid import UUID
 
+import numpy as np
 import pytest
 from aiohttp import (
     ClientConnectionError,
     ClientError,
+    ClientSession,
     ServerTimeoutError,
+    web,
 )
 from pytest_structlog import StructuredLogCapture
 
-from virtool_workflow.api.utils import retry
+from virtool_workflow.api.utils import (
+    decode_json_response,
+    dumps_json,
+    iter_gzip_json,
+    raise_exception_by_status_code,
+    retry,
+)
+from virtool_workflow.errors import JobsAPIConflictError, JobsAPINotFoundError
 
 
 async def test_retry_without_parameters(log: StructuredLogCapture):
@@ -162,3 +177,144 @@ class TestRetryWithParameters:
 
         # Should only be called once (no retries for non-connection errors)
         assert call_count == 1
+
+
+@pytest.mark.parametrize("chunk_size", [1, 1024 * 1024 * 2])
+def test_iter_gzip_json(chunk_size: int):
+    """Test that chunks encoded from nested data decompress to the same JSON document
+    as the standard library would produce.
+    """
+    data = {
+        "results": {
+            "hits": [
+                {"id": f"otu_{i}", "pi": i / 7, "reads": list(range(i))}
+                for i in range(100)
+            ],
+            "empty": {},
+            "none": None,
+            "nested": {"a": [[1, 2], {"b": ()}]},
+            1: "non-string key",
+        },
+    }
+
+    chunks = list(iter_gzip_json(data, chunk_size))
+
+    assert all(chunks)
+    assert json.loads(gzip.decompress(b"".join(chunks))) == json.loads(
+        json.dumps(data),
+    )
+
+
+def test_iter_gzip_json_keys():
+    """Test that non-string keys are encoded the same way as by ``dumps_json``."""
+
+    class Color(Enum):
+        RED = "red"
+
+    data = {
+        "results": {
+            "a": 1,
+            2: "int",
+            1.5: "float",
+            True: "bool",
+            None: "none",
+            date(2020, 1, 1): "date",
+            UUID(int=1): "uuid",
+            Color.RED: "enum",
+        },
+    }
+
+    chunks = iter_gzip_json(data)
+
+    assert gzip.decompress(b"".join(chunks)).decode() == dumps_json(data)
+
+
+def test_iter_gzip_json_numpy():
+    """Test that NumPy arrays and scalars are encoded."""
+    chunks = iter_gzip_json({"coverage": np.arange(3), "depth": np.float64(1.5)})
+
+    assert json.loads(gzip.decompress(b"".join(chunks))) == {
+        "coverage": [0, 1, 2],
+        "depth": 1.5,
+    }
+
+
+class TestJSONResponses:
+    @pytest.fixture
+    async def get(self, aiohttp_server):
+        """Get the response from a route that returns the given body and status."""
+
+        async def handler(request: web.Request) -> web.Response:
+            return web.Response(
+                body=request.app["body"],
+                content_type=request.app["content_type"],
+                status=request.app["status"],
+            )
+
+        app = web.Application()
+        app.router.add_get("/", handler)
+
+        server = await aiohttp_server(app)
+
+        async with ClientSession(json_serialize=dumps_json) as http:
+
+            async def func(body: bytes, status: int, content_type="application/json"):
+                app["body"] = body
+                app["content_type"] = content_type
+                app["status"] = status
+
+                async with http.get(server.make_url("/")) as resp:
+                    await raise_exception_by_status_code(resp)
+                    return await decode_json_response(resp)
+
+            yield func
+
+    async def test_ok(self, get):
+        assert await get(b'{"id": "foo", "count": 1}', 200) == {"id": "foo", "count": 1}
+
+    async def test_large(self, get):
+        """Test that bodies parsed in a thread are decoded the same way."""
+        data = [{"id": i, "name": f"sequence_{i}"} for i in range(100000)]
+
+        assert await get(json.dumps(data).encode(), 200) == data
+
+    async def test_not_json(self, get):
+        with pytest.raises(ValueError, match="was not JSON. hello"):
+            await get(b"hello", 200, "text/plain")
+
+    async def test_empty(self, get):
+        assert await get(b"", 200) is None
+
+    @pytest.mark.parametrize(
+        ("body", "content_type", "message"),
+        [
+            (
+                b'{"id": "not_found", "message": "Not found"}',
+                "application/json",
+                "Not found",
+            ),
+            (b'{"id": "not_found"}', "application/json", "{'id': 'not_found'}"),
+            (b"Not found", "text/plain", "Not found"),
+        ],
+        ids=["message", "no_message", "text"],
+    )
+    async def test_error(self, body: bytes, content_type: str, message: str, get):
+        with pytest.raises(JobsAPINotFoundError) as exc_info:
+            await get(body, 404, content_type)
+
+        assert str(exc_info.value) == message
+
+    async def test_conflict(self, get):
+        with pytest.raises(JobsAPIConflictError, match="Already finalized"):
+            await get(b'{"message": "Already finalized"}', 409)
+
+
+def test_dumps_json():
+    """Test that JSON is encoded like the standard library would encode it."""
+    data = {"id": "foo", 1: [1.5, None, True], "coverage": np.arange(2)}
+
+    assert json.loads(dumps_json(data)) == {
+        "id": "foo",
+        "1": [1.5, None, True],
+        "coverage": [0, 1],
+    }
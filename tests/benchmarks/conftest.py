@@ -0,0 +1,224 @@
+"""Fixtures and reporting for the I/O benchmarks.
+
+Benchmarks are skipped unless ``--run-benchmarks`` is passed to pytest. Results are
+printed at the end of the session and can be written to a JSON file with
+``--bench-json`` so they can be compared between commits.
+
+The number of rounds and the file sizes used by the I/O benchmarks can be set with
+``--bench-rounds`` and ``--bench-sizes``.
+"""
+
+import json
+import os
+import statistics
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from time import perf_counter
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from tests.fixtures.api.utils import custom_dumps, generate_not_found
+from virtool_workflow.pytest_plugin.data import Data
+
+MIB = 1024 * 1024
+
+_BLOCK = os.urandom(MIB)
+"""A block of random bytes repeated to build synthetic files."""
+
+SETTINGS = web.AppKey("settings", dict)
+"""Mutable settings for the synthetic API server, such as the size of sample reads."""
+
+_results_key = pytest.StashKey[list["BenchmarkResult"]]()
+
+
+@dataclass
+class BenchmarkResult:
+    """The timings recorded for a benchmark."""
+
+    name: str
+    """The ID of the benchmark test."""
+
+    timings: list[float] = field(default_factory=list)
+    """The elapsed time of each round in seconds."""
+
+    size: int = 0
+    """The number of bytes transferred in each round."""
+
+    extra: dict[str, float] = field(default_factory=dict)
+    """Additional named measurements to report with the benchmark."""
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.timings)
+
+    @property
+    def throughput(self) -> float:
+        """The median throughput in MiB/s."""
+        return self.size / MIB / self.median if self.size else 0.0
+
+
+def pytest_configure(config: pytest.Config):
+    config.stash[_results_key] = []
+
+
+def pytest_generate_tests(metafunc: pytest.Metafunc):
+    if "size" in metafunc.fixturenames:
+        sizes = metafunc.config.getoption("--bench-sizes")
+
+        metafunc.parametrize(
+            "size",
+            [size * MIB for size in sizes],
+            ids=[f"{size}M" for size in sizes],
+        )
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]):
+    if config.getoption("--run-benchmarks"):
+        return
+
+    skip = pytest.mark.skip(reason="use --run-benchmarks to run benchmarks")
+
+    for item in items:
+        if "bench" in item.keywords:
+            item.add_marker(skip)
+
+
+def pytest_terminal_summary(terminalreporter, config: pytest.Config):
+    results = config.stash.get(_results_key, [])
+
+    if not results:
+        return
+
+    terminalreporter.section("benchmarks")
+    terminalreporter.write_line(
+        f"{'name':<60} {'min (s)':>10} {'median (s)':>10} {'max (s)':>10} {'MiB/s':>10}",
+    )
+
+    for result in results:
+        terminalreporter.write_line(
+            f"{result.name:<60} {min(result.timings):>10.4f} {result.median:>10.4f} "
+            f"{max(result.timings):>10.4f} {result.throughput:>10.1f}",
+        )
+
+        for name, value in result.extra.items():
+            terminalreporter.write_line(f"    {name:<56} {value:>10.4f}")
+
+    if path := config.getoption("--bench-json"):
+        Path(path).write_text(
+            json.dumps(
+                [
+                    {**asdict(result), "median": result.median}
+                    for result in results
+                ],
+                indent=2,
+            ),
+        )
+
+
+@pytest.fixture
+def bench(request: pytest.FixtureRequest):
+    """Time an async function over ``--bench-rounds`` rounds.
+
+    The ``setup`` and ``teardown`` functions are called before and after each round and
+    are not timed. Pass ``size`` to report throughput for the number of bytes
+    transferred in each round.
+    """
+
+    async def func(
+        benchmark: Callable[[], Awaitable],
+        setup: Callable[[], Awaitable] | None = None,
+        teardown: Callable[[], Awaitable] | None = None,
+        size: int = 0,
+        rounds: int | None = None,
+    ) -> BenchmarkResult:
+        result = BenchmarkResult(request.node.name, size=size)
+
+        for _ in range(rounds or request.config.getoption("--bench-rounds")):
+            if setup:
+                await setup()
+
+            started_at = perf_counter()
+            await benchmark()
+            result.timings.append(perf_counter() - started_at)
+
+            if teardown:
+                await teardown()
+
+        request.config.stash[_results_key].append(result)
+
+        return result
+
+    return func
+
+
+def _get_size(request: web.Request) -> int:
+    if "size" in request.match_info:
+        return int(request.match_info["size"])
+
+    return request.app[SETTINGS]["read_size"]
+
+
+async def _stream_synthetic_file(request: web.Request) -> web.StreamResponse:
+    size = _get_size(request)
+
+    response = web.StreamResponse(
+        headers={"Content-Type": "application/octet-stream"},
+    )
+    response.content_length = size
+
+    await response.prepare(request)
+
+    while size > 0:
+        chunk = _BLOCK[: min(size, MIB)]
+        await response.write(chunk)
+        size -= len(chunk)
+
+    await response.write_eof()
+
+    return response
+
+
+async def _discard_upload(request: web.Request) -> web.Response:
+    reader = await request.multipart()
+    file = await reader.next()
+
+    size = 0
+
+    while chunk := await file.read_chunk(MIB):
+        size += len(chunk)
+
+    return web.json_response({"id": 1, "name": file.filename, "size": size}, status=201)
+
+
+@pytest.fixture
+async def synthetic_api_server(aiohttp_server, data: Data) -> TestServer:
+    """A stand-in for the jobs API that serves synthetic files of any size.
+
+    Files of ``size`` bytes are served at ``/files/{size}`` and uploads to ``/files``
+    are read and discarded. The reads for ``data.sample`` are served with the size set
+    in ``app[SETTINGS]["read_size"]``.
+    """
+
+    async def get_sample(request: web.Request) -> web.Response:
+        if request.match_info["sample_id"] != data.sample.id:
+            return generate_not_found()
+
+        return web.json_response(data.sample.dict(), dumps=custom_dumps)
+
+    app = web.Application()
+    app[SETTINGS] = {"read_size": MIB}
+
+    app.router.add_get("/files/{size}", _stream_synthetic_file)
+    app.router.add_post("/files", _discard_upload)
+    app.router.add_get("/samples/{sample_id}", get_sample)
+    app.router.add_get("/samples/{sample_id}/reads/{filename}", _stream_synthetic_file)
+
+    return await aiohttp_server(app)
+
+
+@pytest.fixture
+def synthetic_jobs_api_connection_string(synthetic_api_server: TestServer) -> str:
+    return f"http://{synthetic_api_server.host}:{synthetic_api_server.port}"
@@ -0,0 +1,78 @@
+"""Benchmarks for downloading and uploading files with :class:`.APIClient`."""
+
+import asyncio
+import shutil
+from pathlib import Path
+
+import pytest
+
+from tests.benchmarks.conftest import MIB
+from virtool_workflow.api.client import api_client
+from virtool_workflow.pytest_plugin.data import Data
+
+pytestmark = pytest.mark.bench
+
+
+@pytest.mark.parametrize("concurrency", [1, 4, 16])
+async def test_get_file(
+    bench,
+    concurrency: int,
+    data: Data,
+    size: int,
+    synthetic_jobs_api_connection_string: str,
+    tmp_path: Path,
+):
+    """Download ``concurrency`` files of ``size`` bytes at once."""
+    downloads_path = tmp_path / "downloads"
+
+    async def setup():
+        shutil.rmtree(downloads_path, ignore_errors=True)
+        downloads_path.mkdir()
+
+    async with api_client(
+        synthetic_jobs_api_connection_string,
+        data.job.id,
+        data.job.key,
+    ) as api:
+
+        async def download():
+            await asyncio.gather(
+                *(
+                    api.get_file(f"/files/{size}", downloads_path / str(i))
+                    for i in range(concurrency)
+                ),
+            )
+
+        await bench(download, setup=setup, size=size * concurrency)
+
+    assert (downloads_path / "0").stat().st_size == size
+
+
+@pytest.mark.parametrize("concurrency", [1, 4])
+async def test_post_file(
+    bench,
+    concurrency: int,
+    data: Data,
+    size: int,
+    synthetic_jobs_api_connection_string: str,
+    tmp_path: Path,
+):
+    """Upload ``concurrency`` files of ``size`` bytes at once."""
+    path = tmp_path / "upload.bin"
+
+    with path.open("wb") as f:
+        for _ in range(size // MIB):
+            f.write(MIB * b"A")
+
+    async with api_client(
+        synthetic_jobs_api_connection_string,
+        data.job.id,
+        data.job.key,
+    ) as api:
+
+        async def upload():
+            await asyncio.gather(
+                *(api.post_file("/files", path, "unknown") for _ in range(concurrency)),
+            )
+
+        await bench(upload, size=size * concurrency)
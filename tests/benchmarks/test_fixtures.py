@@ -0,0 +1,130 @@
+"""Benchmarks for the data fixtures that download files from the jobs API."""
+
+import asyncio
+import shutil
+from pathlib import Path
+
+import pytest
+from aiohttp.test_utils import TestServer
+from pyfixtures import FixtureScope
+
+from tests.benchmarks.conftest import SETTINGS
+from virtool_workflow.api.client import api_client
+from virtool_workflow.pytest_plugin.data import Data
+from virtool_workflow.runtime.fixtures import LazyFixtureScope
+
+pytestmark = pytest.mark.bench
+
+_SCOPE_KEYS = (
+    "_api",
+    "_config",
+    "_error",
+    "_job",
+    "_state",
+    "_status",
+    "_step",
+    "_workflow",
+    "logger",
+    "mem",
+    "proc",
+    "results",
+)
+"""The keys copied from the ``scope`` fixture into each fresh scope."""
+
+
+async def _instantiate(
+    base_scope: FixtureScope,
+    key: str,
+    work_path: Path,
+    concurrency: int,
+    **values,
+):
+    """Instantiate the fixture ``key`` in ``concurrency`` fresh scopes at once.
+
+    Each scope gets its own work path so downloads do not collide.
+    """
+
+    async def func(i: int):
+        path = work_path / str(i)
+        path.mkdir()
+
+        async with LazyFixtureScope() as scope:
+            scope.update({k: base_scope[k] for k in _SCOPE_KEYS}, **values)
+            scope["work_path"] = path
+
+            await scope.instantiate_by_key(key)
+
+    await asyncio.gather(*(func(i) for i in range(concurrency)))
+
+
+@pytest.fixture
+def fresh_work_path(tmp_path: Path):
+    """A function that empties a work path before each round."""
+    path = tmp_path / "bench"
+
+    async def setup():
+        shutil.rmtree(path, ignore_errors=True)
+        path.mkdir()
+
+    return path, setup
+
+
+@pytest.mark.parametrize("concurrency", [1, 4])
+async def test_index(bench, concurrency: int, data: Data, fresh_work_path, scope):
+    data.job.args["analysis_id"] = data.analysis.id
+
+    path, setup = fresh_work_path
+
+    await bench(
+        lambda: _instantiate(scope, "index", path, concurrency),
+        setup=setup,
+    )
+
+
+@pytest.mark.parametrize("concurrency", [1, 4])
+async def test_subtractions(
+    bench,
+    concurrency: int,
+    data: Data,
+    fresh_work_path,
+    scope,
+):
+    data.job.args["analysis_id"] = data.analysis.id
+
+    path, setup = fresh_work_path
+
+    await bench(
+        lambda: _instantiate(scope, "subtractions", path, concurrency),
+        setup=setup,
+    )
+
+
+@pytest.mark.parametrize("concurrency", [1, 4])
+async def test_sample(
+    bench,
+    concurrency: int,
+    data: Data,
+    fresh_work_path,
+    scope,
+    size: int,
+    synthetic_api_server: TestServer,
+    synthetic_jobs_api_connection_string: str,
+):
+    """Instantiate the sample fixture with paired reads of ``size`` bytes each."""
+    data.job.args["sample_id"] = data.sample.id
+    data.sample.paired = True
+
+    synthetic_api_server.app[SETTINGS]["read_size"] = size
+
+    path, setup = fresh_work_path
+
+    async with api_client(
+        synthetic_jobs_api_connection_string,
+        data.job.id,
+        data.job.key,
+    ) as api:
+        await bench(
+            lambda: _instantiate(scope, "sample", path, concurrency, _api=api),
+            setup=setup,
+            size=2 * size * concurrency,
+        )
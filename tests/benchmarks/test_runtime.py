@@ -0,0 +1,164 @@
+"""A throughput benchmark for running jobs with :func:`.start_runtime`.
+
+Jobs are run one after another against the test jobs API with an in-memory stand-in
+for Redis. The runtime's timeline is used to break each job down into phases.
+"""
+
+import asyncio
+import json
+import statistics
+from collections import defaultdict
+from pathlib import Path
+
+import pytest
+
+from virtool_workflow import Workflow
+from virtool_workflow.pytest_plugin.data import Data
+from virtool_workflow.runtime.run import start_runtime
+
+pytestmark = pytest.mark.bench
+
+REDIS_LIST_NAME = "jobs_benchmark"
+
+
+class FakeRedis:
+    """An in-memory stand-in for :class:`virtool.redis.Redis`.
+
+    All clients share the lists and channels of the instance they were created from.
+    """
+
+    def __init__(self):
+        self._lists: dict[str, asyncio.Queue] = defaultdict(asyncio.Queue)
+        self._subscribers: dict[str, list[asyncio.Queue]] = defaultdict(list)
+
+    def __call__(self, _: str) -> "FakeRedis":
+        return self
+
+    async def __aenter__(self) -> "FakeRedis":
+        return self
+
+    async def __aexit__(self, *args):
+        pass
+
+    async def blpop(self, key: str) -> str:
+        return await self._lists[key].get()
+
+    async def rpush(self, key: str, *values: str):
+        for value in values:
+            self._lists[key].put_nowait(value)
+
+    async def publish(self, channel: str, message: str):
+        for queue in self._subscribers[channel]:
+            queue.put_nowait(message)
+
+    async def subscribe(self, channel: str):
+        queue = asyncio.Queue()
+        self._subscribers[channel].append(queue)
+
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            self._subscribers[channel].remove(queue)
+
+
+def create_workflow(kind: str) -> Workflow:
+    """Create a workflow with two steps that do nothing or keep the CPU busy."""
+    workflow = Workflow()
+
+    @workflow.step
+    async def first(work_path: Path):
+        """Write a file to the work path."""
+        (work_path / "output.txt").write_text("output")
+
+        if kind == "cpu":
+            sum(i * i for i in range(2_000_000))
+
+    @workflow.step
+    async def second(proc: int, work_path: Path):
+        """Read the file back."""
+        assert (work_path / "output.txt").read_text() == "output"
+
+        if kind == "cpu":
+            sum(i * i for i in range(2_000_000))
+
+    return workflow
+
+
+@pytest.mark.parametrize("kind", ["noop", "cpu"])
+async def test_start_runtime(
+    bench,
+    data: Data,
+    jobs_api_connection_string: str,
+    kind: str,
+    monkeypatch: pytest.MonkeyPatch,
+    request: pytest.FixtureRequest,
+    tmp_path: Path,
+    work_path: Path,
+):
+    """Run ``--bench-jobs`` jobs and report jobs per minute and per-phase times.
+
+    The ``startup`` time is everything not covered by a recorded phase: loading the
+    workflow and fixtures, opening Redis and HTTP connections, and popping the job ID.
+    """
+    redis = FakeRedis()
+    monkeypatch.setattr("virtool_workflow.runtime.run.Redis", redis)
+
+    data.job.workflow = kind
+
+    timeline_path = tmp_path / "timeline.json"
+    timelines = []
+    workflow = create_workflow(kind)
+
+    async def setup():
+        await redis.rpush(REDIS_LIST_NAME, data.job.id)
+
+    async def run_job():
+        await start_runtime(
+            False,
+            jobs_api_connection_string,
+            4,
+            2,
+            "redis://localhost:6379",
+            REDIS_LIST_NAME,
+            "",
+            5,
+            work_path,
+            workflow_loader=lambda: workflow,
+            http_prewarm_connections=0,
+            status_interval=0,
+            timeline_path=timeline_path,
+        )
+
+    async def teardown():
+        timelines.append(json.loads(timeline_path.read_text()))
+
+    result = await bench(
+        run_job,
+        setup=setup,
+        teardown=teardown,
+        rounds=request.config.getoption("--bench-jobs"),
+    )
+
+    phases = defaultdict(list)
+
+    for timing, timeline in zip(result.timings, timelines, strict=True):
+        for name in ("acquisition", "execution", "teardown"):
+            phases[name].append(timeline["phases"][name])
+
+        phases["fixture_setup"].append(
+            sum(step["fixture_time"] for step in timeline["steps"]),
+        )
+        phases["startup"].append(
+            timing - sum(timeline["phases"].values()),
+        )
+
+    result.extra = {
+        "jobs_per_minute": 60 * len(result.timings) / sum(result.timings),
+        **{
+            f"{name}_median (s)": statistics.median(values)
+            for name, values in sorted(phases.items())
+        },
+    }
+
+    assert len(timelines) == len(result.timings)
@@ -14,3 +14,36 @@ def pytest_addoption(parser):
         action="store",
         default="redis://:virtool@redis:6379",
     )
+    parser.addoption(
+        "--run-benchmarks",
+        action="store_true",
+        default=False,
+        help="Run the benchmarks in tests/benchmarks.",
+    )
+    parser.addoption(
+        "--bench-jobs",
+        action="store",
+        default=20,
+        help="The number of jobs to run in runtime benchmarks.",
+        type=int,
+    )
+    parser.addoption(
+        "--bench-json",
+        action="store",
+        default=None,
+        help="A path to write benchmark results to as JSON.",
+    )
+    parser.addoption(
+        "--bench-rounds",
+        action="store",
+        default=5,
+        help="The number of times each benchmark is run.",
+        type=int,
+    )
+    parser.addoption(
+        "--bench-sizes",
+        action="store",
+        default=[1, 16],
+        help="Comma-separated file sizes in MiB to run the I/O benchmarks with.",
+        type=lambda value: [int(size) for size in value.split(",")],
+    )
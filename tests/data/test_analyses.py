@@ -75,5 +75,20 @@ async def test_delete_finalized(data: Data, scope: FixtureScope):
     assert "Analysis is finalized" in str(err)
 
 
-async def test_result_upload():
+async def test_result_upload(data: Data, scope: FixtureScope):
     """Test that the analysis fixture can be used to set the analysis result."""
+    data.job.args["analysis_id"] = data.analysis.id
+
+    analysis: WFAnalysis = await scope.instantiate_by_key("analysis")
+
+    results = {
+        "hits": [{"id": f"otu_{i}", "pi": i / 1000, 1: [i]} for i in range(1000)],
+        "read_count": 1234,
+    }
+
+    await analysis.upload_result(results)
+
+    assert data.analysis.results == {
+        "hits": [{"id": f"otu_{i}", "pi": i / 1000, "1": [i]} for i in range(1000)],
+        "read_count": 1234,
+    }
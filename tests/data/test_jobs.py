@@ -1,7 +1,9 @@
 from pyfixtures import FixtureScope
 from syrupy import SnapshotAssertion
-from virtool.jobs.models import Job
+from virtool.jobs.models import Job, JobState
 
+from virtool_workflow import Workflow
+from virtool_workflow.data.jobs import WFProgress
 from virtool_workflow.pytest_plugin.data import Data
 
 
@@ -11,3 +13,35 @@ async def test_ok(data: Data, scope: FixtureScope, snapshot: SnapshotAssertion):
     job: Job = await scope.get_or_instantiate("job")
 
     assert job.dict() == snapshot(name="pydantic")
+
+
+async def test_progress(data: Data, scope: FixtureScope):
+    """Test that fractional progress through a step is reported to the jobs API."""
+    wf = Workflow()
+
+    @wf.step
+    async def first():
+        """Description of First."""
+
+    @wf.step
+    async def second():
+        """Description of Second."""
+
+    scope["_state"] = JobState.RUNNING
+    scope["_step"] = wf.steps[1]
+    scope["_workflow"] = wf
+
+    progress: WFProgress = await scope.instantiate_by_key("progress")
+
+    progress.update(0.5)
+    await scope["_status"].flush()
+
+    assert data.job.status[-1].progress == 75
+    assert data.job.status[-1].step_name == "Second"
+
+    # This update is rate-limited, but completing the step is always reported.
+    progress.update(0.6)
+    progress.update(1.0)
+    await scope["_status"].flush()
+
+    assert [status.progress for status in data.job.status[-2:]] == [75, 100]
@@ -1,12 +1,8 @@
-from importlib import import_module
-
 import pytest
 
 from virtool_workflow import hooks
 from virtool_workflow.runtime.hook import Hook
 
-import_module("virtool_workflow.data")
-
 
 @pytest.fixture
 def clear_hooks():
@@ -1,24 +1,25 @@
-from importlib import import_module
 from pathlib import Path
 
 import pytest
-from pyfixtures import FixtureScope
 from structlog import get_logger
 
 from virtool_workflow.pytest_plugin.data import Data
 from virtool_workflow.api.client import api_client
 from virtool_workflow.runtime.config import RunConfig
+from virtool_workflow.runtime.fixtures import LazyFixtureScope
+from virtool_workflow.runtime.status import status_reporter
 
 
 @pytest.fixture
 async def scope(data: Data, jobs_api_connection_string: str, work_path: Path):
     """The same fixture scope that is used when running workflows."""
-    import_module("virtool_workflow.data")
-
     job = data.job
 
     async with api_client(jobs_api_connection_string, job.id, job.key) as api:
-        async with FixtureScope() as scope:
+        async with (
+            status_reporter(api, job.id, 0) as status,
+            LazyFixtureScope() as scope,
+        ):
             config = RunConfig(
                 dev=False,
                 jobs_api_connection_string=jobs_api_connection_string,
@@ -32,6 +33,7 @@ async def scope(data: Data, jobs_api_connection_string: str, work_path: Path):
             scope["_error"] = None
             scope["_job"] = job
             scope["_state"] = job.state
+            scope["_status"] = status
             scope["_step"] = job.stage
             scope["_workflow"] = job.workflow
 
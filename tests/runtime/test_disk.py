@@ -0,0 +1,104 @@
+import asyncio
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from virtool_workflow.errors import InsufficientDiskSpaceError
+from virtool_workflow.runtime import disk
+from virtool_workflow.runtime.config import RunConfig
+from virtool_workflow.runtime.disk import (
+    GB,
+    GZIP_EXPANSION_FACTOR,
+    ensure_disk_space,
+    estimate_size,
+    get_usage,
+    monitor_disk_usage,
+)
+
+
+def create_config(path: Path, **kwargs) -> RunConfig:
+    return RunConfig(
+        dev=False,
+        jobs_api_connection_string="",
+        mem=8,
+        proc=2,
+        work_path=path,
+        **kwargs,
+    )
+
+
+def test_get_usage(tmp_path: Path):
+    (tmp_path / "nested").mkdir()
+    (tmp_path / "a.txt").write_bytes(b"a" * 10000)
+    (tmp_path / "nested" / "b.txt").write_bytes(b"b" * 10000)
+
+    assert get_usage(tmp_path) >= 20000
+    assert get_usage(tmp_path / "missing") == 0
+
+
+def test_estimate_size():
+    files = [
+        SimpleNamespace(name="reference.fa.gz", size=100),
+        SimpleNamespace(name="reference.1.bt2", size=50),
+        SimpleNamespace(name="unknown", size=None),
+    ]
+
+    assert estimate_size(files) == 150
+    assert (
+        estimate_size(files, compressed=("reference.fa.gz",))
+        == 150 + 100 * GZIP_EXPANSION_FACTOR
+    )
+
+
+async def test_ensure_disk_space(tmp_path: Path):
+    await ensure_disk_space(create_config(tmp_path), 1024, "sample")
+
+    with pytest.raises(InsufficientDiskSpaceError) as exc_info:
+        await ensure_disk_space(
+            create_config(tmp_path, work_path_max_usage=1 / 1024**2),
+            2048,
+            "sample",
+        )
+
+    assert exc_info.value.required == 2048
+    assert exc_info.value.available <= 1024
+
+
+async def test_monitor_disk_usage(tmp_path: Path, monkeypatch):
+    """Test that the workflow is aborted when the work directory grows past the
+    limit.
+    """
+    monkeypatch.setattr(disk, "DISK_USAGE_INTERVAL", 0.01)
+
+    errors = []
+
+    async with monitor_disk_usage(
+        tmp_path,
+        create_config(tmp_path, work_path_max_usage=8192 / GB),
+        errors.append,
+    ):
+        (tmp_path / "small.txt").write_bytes(b"a" * 1024)
+        await asyncio.sleep(0.05)
+
+        assert errors == []
+
+        (tmp_path / "large.txt").write_bytes(b"a" * 16384)
+
+        for _ in range(100):
+            if errors:
+                break
+
+            await asyncio.sleep(0.01)
+
+    assert len(errors) == 1
+    assert isinstance(errors[0], InsufficientDiskSpaceError)
+
+
+async def test_monitor_disk_usage_no_limit(tmp_path: Path):
+    async with monitor_disk_usage(
+        tmp_path,
+        create_config(tmp_path),
+        pytest.fail,
+    ):
+        (tmp_path / "large.txt").write_bytes(b"a" * 16384)
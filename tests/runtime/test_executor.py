@@ -0,0 +1,59 @@
+import operator
+
+import numpy as np
+import pytest
+
+from virtool_workflow.runtime.executor import Executor, SharedArray
+
+
+def square(value: int) -> int:
+    return value * value
+
+
+def sum_shared(shared: SharedArray) -> float:
+    with shared.open() as array:
+        return float(array.sum())
+
+
+@pytest.fixture(scope="module")
+def executor():
+    executor = Executor(2)
+    yield executor
+    executor.close()
+
+
+async def test_run(executor: Executor):
+    assert await executor.run(square, 4) == 16
+
+
+@pytest.mark.parametrize("chunk_size", [None, 1, 7, 1000])
+async def test_map(chunk_size: int | None, executor: Executor):
+    assert await executor.map(square, range(100), chunk_size) == [
+        i * i for i in range(100)
+    ]
+
+
+async def test_map_iterator(executor: Executor):
+    """Test that lazy iterables of unknown length are mapped in order."""
+    assert await executor.map(square, iter(range(5000))) == [
+        i * i for i in range(5000)
+    ]
+
+
+async def test_map_reduce(executor: Executor):
+    assert await executor.map_reduce(
+        square,
+        operator.add,
+        range(1000),
+        0,
+        chunk_size=64,
+    ) == sum(i * i for i in range(1000))
+
+
+async def test_share(executor: Executor):
+    array = np.arange(1_000_000, dtype=np.float64).reshape(1000, 1000)
+
+    shared = executor.share(array)
+
+    assert shared.shape == (1000, 1000)
+    assert await executor.run(sum_shared, shared) == array.sum()
@@ -0,0 +1,115 @@
+from pathlib import Path
+
+from virtool_workflow.runtime.config import RunConfig
+from virtool_workflow.runtime.fast_path import FastPath, create_fast_directory
+
+
+def create_config(path: Path, **kwargs) -> RunConfig:
+    return RunConfig(
+        dev=False,
+        jobs_api_connection_string="",
+        mem=8,
+        proc=2,
+        work_path=path / "work",
+        **kwargs,
+    )
+
+
+def test_get(tmp_path: Path):
+    fast = tmp_path / "fast"
+    fast.mkdir()
+
+    fast_path = FastPath(fast, tmp_path / "spill", 1000)
+
+    assert fast_path.get("trimmed/reads_1.fq", 600) == fast / "trimmed" / "reads_1.fq"
+    assert (fast / "trimmed").is_dir()
+
+    assert fast_path.available == 400
+    assert fast_path.get("trimmed/reads_1.fq") == fast / "trimmed" / "reads_1.fq"
+
+    # This does not fit in the remaining budget.
+    assert fast_path.get("isolates.fa", 600) == tmp_path / "spill" / "isolates.fa"
+    assert fast_path.available == 400
+
+
+def test_get_unknown_size(tmp_path: Path):
+    """Test that files of unknown size are placed in the spill directory."""
+    fast = tmp_path / "fast"
+    fast.mkdir()
+
+    fast_path = FastPath(fast, tmp_path / "spill", 1000)
+
+    assert fast_path.get("output.txt") == tmp_path / "spill" / "output.txt"
+    assert fast_path.available == 1000
+
+
+def test_actual_usage(tmp_path: Path):
+    """Test that files larger than their reservation count towards the budget."""
+    fast = tmp_path / "fast"
+    fast.mkdir()
+
+    fast_path = FastPath(fast, tmp_path / "spill", 16384)
+
+    fast_path.get("output.txt", 0).write_bytes(b"a" * 12288)
+
+    assert fast_path.available <= 4096
+    assert fast_path.get("other.txt", 8192).parent == tmp_path / "spill"
+
+
+def test_directory_usage(tmp_path: Path):
+    """Test that directories count towards the budget with their reserved size."""
+    fast = tmp_path / "fast"
+    fast.mkdir()
+
+    fast_path = FastPath(fast, tmp_path / "spill", 16384)
+
+    directory = fast_path.get("index", 4096)
+    directory.mkdir()
+    (directory / "index.1.bt2").write_bytes(b"a" * 8192)
+
+    assert fast_path.available == 12288
+
+
+def test_remove(tmp_path: Path):
+    fast = tmp_path / "fast"
+    fast.mkdir()
+
+    fast_path = FastPath(fast, tmp_path / "spill", 1000)
+
+    fast_path.get("output", 1000).mkdir()
+    assert fast_path.available == 0
+
+    fast_path.remove("output")
+
+    assert not (fast / "output").exists()
+    assert fast_path.available == 1000
+
+
+def test_no_fast_path(tmp_path: Path):
+    fast_path = FastPath(None, tmp_path / "spill", 1000)
+
+    assert fast_path.available == 0
+    assert fast_path.get("output.txt", 0) == tmp_path / "spill" / "output.txt"
+
+
+def test_create_fast_directory(tmp_path: Path):
+    path, budget = create_fast_directory(
+        create_config(tmp_path, fast_path=tmp_path, fast_path_fraction=0.5),
+        8,
+    )
+
+    assert path.parent == tmp_path
+    assert path.is_dir()
+    assert 0 < budget <= 4 * 1024**3
+
+
+def test_create_fast_directory_unavailable(tmp_path: Path):
+    assert create_fast_directory(
+        create_config(tmp_path, fast_path=tmp_path / "missing"),
+        8,
+    ) == (None, 0)
+
+    assert create_fast_directory(
+        create_config(tmp_path, fast_path=tmp_path, fast_path_fraction=0),
+        8,
+    ) == (None, 0)
@@ -0,0 +1,118 @@
+import subprocess
+import sys
+
+import pytest
+from pyfixtures import FixtureScope, fixture, fixture_context, get_fixtures
+
+from virtool_workflow.runtime.fixtures import (
+    BUILTIN_FIXTURES,
+    SCOPE_KEYS,
+    LazyFixtureScope,
+    register_builtin_fixture,
+    set_scope_values,
+)
+
+IMPORT_TIME_BUDGET = 2.0
+"""The maximum time in seconds importing the command line interface should take."""
+
+
+@pytest.mark.parametrize("key", sorted(BUILTIN_FIXTURES))
+def test_register_builtin_fixture(key: str):
+    with fixture_context(copy_context=False):
+        registered = register_builtin_fixture(key)
+
+        assert registered.__name__ == key
+        assert get_fixtures()[key] is registered
+
+
+def test_register_builtin_fixture_not_found():
+    with fixture_context(copy_context=False):
+        assert register_builtin_fixture("not_a_fixture") is None
+        assert get_fixtures() == {}
+
+
+def test_register_builtin_fixture_custom():
+    """Test that a custom fixture with the same name as a built-in one is kept."""
+    with fixture_context(copy_context=False):
+
+        @fixture
+        def sample():
+            return "custom"
+
+        assert register_builtin_fixture("sample") is sample
+
+
+def test_register_builtin_fixture_custom_sibling(monkeypatch: pytest.MonkeyPatch):
+    """Test that loading a built-in fixture does not replace a custom fixture that
+    shares a name with another fixture in the same module.
+    """
+    # Make sure the module is imported again, registering all of its fixtures.
+    monkeypatch.delitem(sys.modules, BUILTIN_FIXTURES["run_pipeline"], raising=False)
+
+    with fixture_context(copy_context=False):
+
+        @fixture
+        def run_subprocess():
+            return "custom"
+
+        register_builtin_fixture("run_pipeline")
+
+        assert get_fixtures()["run_subprocess"] is run_subprocess
+        assert list(get_fixtures()) == ["run_subprocess", "run_pipeline"]
+
+
+def test_set_scope_values():
+    scope = FixtureScope()
+
+    set_scope_values(scope, **{key: key for key in SCOPE_KEYS - {"scope"}})
+
+    assert scope.keys() == SCOPE_KEYS - {"scope"}
+
+    with pytest.raises(ValueError, match="'work_path'"):
+        set_scope_values(scope, **{key: key for key in SCOPE_KEYS - {"work_path"}})
+
+
+async def test_lazy_fixture_scope():
+    with fixture_context(copy_context=False):
+        async with LazyFixtureScope() as scope:
+            scope["mem"] = 8
+
+            run_subprocess = await scope.instantiate_by_key("run_subprocess")
+
+        assert await run_subprocess(["true"])
+        assert list(get_fixtures()) == ["run_subprocess"]
+
+
+def test_import_time():
+    """Test that importing the command line interface is fast and does not import the
+    data and analysis modules that define built-in fixtures.
+    """
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            "import sys, virtool_workflow.cli; print(*sys.modules, sep='\\n')",
+        ],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+
+    modules = set(result.stdout.split())
+
+    assert not [
+        module
+        for module in modules
+        if module.startswith(("virtool_workflow.analysis.", "virtool_workflow.data."))
+    ]
+    assert "numpy" not in modules
+
+    cumulative = next(
+        int(line.split("|")[1])
+        for line in result.stderr.splitlines()
+        if line.split("|")[-1].strip() == "virtool_workflow.cli"
+    )
+
+    assert cumulative / 1_000_000 < IMPORT_TIME_BUDGET
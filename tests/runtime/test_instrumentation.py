@@ -0,0 +1,59 @@
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from virtool_workflow.api.client import bytes_downloaded
+from virtool_workflow.runtime.instrumentation import Instrumentation
+
+
+def test_step():
+    """Test that time, resource usage and transferred bytes are measured for a step."""
+    instrumentation = Instrumentation()
+
+    with instrumentation.step("First") as measurement:
+        with measurement.fixtures():
+            time.sleep(0.05)
+
+        subprocess.run([sys.executable, "-c", "sum(range(10**6))"], check=True)
+        bytes_downloaded.inc(1024, resource="indexes")
+
+    assert measurement.state == "complete"
+    assert measurement.wall_time >= measurement.fixture_time >= 0.05
+    assert measurement.children_cpu_time > 0
+    assert measurement.children_peak_rss > 0
+    assert measurement.peak_rss > 0
+    assert measurement.bytes_downloaded == 1024
+    assert measurement.bytes_uploaded == 0
+
+
+def test_step_failed():
+    instrumentation = Instrumentation()
+
+    with pytest.raises(ValueError), instrumentation.step("First"):
+        raise ValueError
+
+    assert instrumentation.steps[0].state == "failed"
+
+
+def test_write_timeline(tmp_path: Path):
+    """Test that phases and steps are written to a JSON timeline."""
+    instrumentation = Instrumentation()
+
+    with instrumentation.phase("execution"):
+        with instrumentation.step("First"):
+            pass
+
+        with instrumentation.step("Second"):
+            pass
+
+    instrumentation.write_timeline(tmp_path / "timeline.json", job_id="foo")
+
+    timeline = json.loads((tmp_path / "timeline.json").read_text())
+
+    assert timeline["job_id"] == "foo"
+    assert list(timeline["phases"]) == ["execution"]
+    assert [step["name"] for step in timeline["steps"]] == ["First", "Second"]
@@ -0,0 +1,65 @@
+import pytest
+
+from virtool_workflow.runtime.metrics import MetricsRegistry
+
+
+def test_counter():
+    registry = MetricsRegistry()
+
+    counter = registry.counter("requests_total", "Requests")
+    counter.inc()
+    counter.inc(2, method="get")
+    counter.inc(method="get")
+
+    assert registry.counter("requests_total", "Requests") is counter
+    assert counter.value() == 1
+    assert counter.value(method="get") == 3
+
+
+def test_gauge():
+    registry = MetricsRegistry()
+
+    gauge = registry.gauge("backlog", "Backlog")
+    gauge.set(5)
+    gauge.dec(2)
+
+    assert gauge.value() == 3
+
+
+def test_kind_conflict():
+    """Test that a metric name cannot be registered as two kinds."""
+    registry = MetricsRegistry()
+    registry.counter("things", "Things")
+
+    with pytest.raises(ValueError, match="already registered as a counter"):
+        registry.gauge("things", "Things")
+
+
+def test_reset():
+    """Test that resetting clears values but keeps references valid."""
+    registry = MetricsRegistry()
+
+    counter = registry.counter("requests_total", "Requests")
+    counter.inc(4)
+
+    registry.reset()
+
+    assert counter.value() == 0
+    assert registry.collect() == [counter]
+
+
+def test_histogram():
+    registry = MetricsRegistry()
+
+    histogram = registry.histogram("latency", "Latency", buckets=(1, 0.1, 10))
+
+    for value in (0.05, 0.5, 5, 50):
+        histogram.observe(value)
+
+    value = histogram.value()
+
+    assert histogram.buckets == (0.1, 1, 10)
+    assert value.bucket_counts == [1, 2, 3]
+    assert value.count == 4
+    assert value.max == 50
+    assert value.sum == 55.55
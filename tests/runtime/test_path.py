@@ -0,0 +1,118 @@
+import asyncio
+import errno
+import os
+from pathlib import Path
+
+import pytest
+
+from virtool_workflow.runtime.config import RunConfig
+from virtool_workflow.runtime.path import create_work_path, get_trash_path
+
+
+def create_config(path: Path, **kwargs) -> RunConfig:
+    return RunConfig(
+        dev=False,
+        jobs_api_connection_string="",
+        mem=8,
+        proc=2,
+        work_path=path,
+        **kwargs,
+    )
+
+
+async def wait_for_empty(path: Path):
+    for _ in range(100):
+        if not any(path.iterdir()):
+            return
+
+        await asyncio.sleep(0.05)
+
+    raise AssertionError(f"{path} was not emptied")
+
+
+@pytest.mark.parametrize("cleanup", ["process", "sync", "thread"])
+async def test_create_work_path(cleanup: str, tmp_path: Path):
+    path = tmp_path / "work"
+
+    async with create_work_path(
+        create_config(path, work_path_cleanup=cleanup),
+    ) as work_path:
+        assert work_path == path
+        (work_path / "output.txt").write_text("output")
+
+    assert not path.exists()
+
+    await wait_for_empty(get_trash_path(path))
+
+
+async def test_leftover(tmp_path: Path):
+    """Test that a work directory left over from an earlier run is replaced."""
+    path = tmp_path / "work"
+    path.mkdir()
+    (path / "leftover.txt").write_text("leftover")
+
+    async with create_work_path(create_config(path)) as work_path:
+        assert list(work_path.iterdir()) == []
+
+    await wait_for_empty(get_trash_path(path))
+
+
+async def test_disk_pressure(tmp_path: Path):
+    """Test that work directories are deleted before continuing when disk space is
+    low.
+    """
+    path = tmp_path / "work"
+
+    async with create_work_path(
+        create_config(path, work_path_cleanup="process", work_path_min_free=1e9),
+    ) as work_path:
+        (work_path / "output.txt").write_text("output")
+
+    assert list(get_trash_path(path).iterdir()) == []
+
+
+@pytest.mark.parametrize("error", [errno.EBUSY, errno.EXDEV])
+async def test_rename_fails(
+    error: int,
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+):
+    """Test that a work directory that cannot be moved, such as a mount point, is
+    emptied in place.
+    """
+    path = tmp_path / "work"
+    path.mkdir()
+    (path / "leftover.txt").write_text("leftover")
+
+    def rename(self, target):
+        raise OSError(error, os.strerror(error))
+
+    monkeypatch.setattr(Path, "rename", rename)
+
+    async with create_work_path(create_config(path)) as work_path:
+        assert list(work_path.iterdir()) == []
+        (work_path / "output.txt").write_text("output")
+
+    assert not (path / "output.txt").exists()
+
+
+async def test_read_only_parent(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+    """Test that the work directory is emptied in place if the trash directory cannot
+    be created.
+    """
+    path = tmp_path / "work"
+    path.mkdir()
+    (path / "leftover.txt").write_text("leftover")
+
+    mkdir = Path.mkdir
+
+    def mkdir_or_fail(self, *args, **kwargs):
+        if self == get_trash_path(path):
+            raise PermissionError(errno.EROFS, "Read-only file system")
+
+        mkdir(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "mkdir", mkdir_or_fail)
+
+    async with create_work_path(create_config(path)) as work_path:
+        assert list(work_path.iterdir()) == []
@@ -0,0 +1,140 @@
+import asyncio
+
+import pytest
+from aiohttp.web import Application, Request, Response, json_response
+
+from virtool_workflow.runtime.metrics import registry
+from virtool_workflow.runtime.ping import (
+    PING_INTERVAL,
+    get_backoff_delay,
+    get_ping_interval,
+    ping_consecutive_failures,
+    ping_failures,
+    ping_periodically,
+    ping_rtt,
+)
+
+
+@pytest.mark.parametrize(
+    ("lease", "expected"),
+    [
+        (None, PING_INTERVAL),
+        (8, 2.0),
+        (2, 1.0),
+        (3600, 60.0),
+        (10.0, 2.5),
+        ("8", PING_INTERVAL),
+        ("soon", PING_INTERVAL),
+        (True, PING_INTERVAL),
+        (-8, PING_INTERVAL),
+        ({"seconds": 8}, PING_INTERVAL),
+    ],
+)
+def test_get_ping_interval(lease: object, expected: float):
+    assert get_ping_interval(lease) == expected
+
+
+def test_get_backoff_delay():
+    """Test that the backoff doubles and is capped at the ping interval."""
+    assert [get_backoff_delay(5, failures) for failures in range(1, 6)] == [
+        1,
+        2,
+        4,
+        5,
+        5,
+    ]
+
+
+async def test_recovers_after_failures(aiohttp_server):
+    """Test that pinging continues after failures and records round-trip times."""
+    registry.reset()
+
+    pings = []
+
+    async def ping(request: Request):
+        pings.append(request.headers["Authorization"])
+
+        if len(pings) < 3:
+            return json_response({"message": "Unavailable"}, status=503)
+
+        return json_response({"pinged_at": "2020-01-01T00:00:00Z", "lease_seconds": 4})
+
+    app = Application()
+    app.router.add_put("/jobs/{job_id}/ping", ping)
+    server = await aiohttp_server(app)
+
+    async with ping_periodically(
+        f"http://{server.host}:{server.port}",
+        "foo",
+        "key",
+    ):
+        # Retries are made after 1 and 2 seconds. Pings then occur every second.
+        await asyncio.sleep(4.5)
+
+    assert len(pings) >= 4
+    assert ping_consecutive_failures.value() == 0
+    assert ping_rtt.value().count == len(pings) - 2
+
+
+async def test_empty_response(aiohttp_server):
+    """Test that a successful response without a JSON body counts as a ping."""
+    registry.reset()
+
+    async def ping(request: Request):
+        return Response(status=204)
+
+    app = Application()
+    app.router.add_put("/jobs/{job_id}/ping", ping)
+    server = await aiohttp_server(app)
+
+    async with ping_periodically(f"http://{server.host}:{server.port}", "foo", "key"):
+        await asyncio.sleep(0.5)
+
+    assert ping_failures.value() == 0
+    assert ping_rtt.value().count == 1
+
+
+@pytest.mark.parametrize("status", [404, 409])
+async def test_job_gone(status: int, aiohttp_server):
+    """Test that pinging stops when the job no longer exists."""
+    pings = []
+
+    async def ping(request: Request):
+        pings.append(request)
+        return json_response({"message": "Gone"}, status=status)
+
+    app = Application()
+    app.router.add_put("/jobs/{job_id}/ping", ping)
+    server = await aiohttp_server(app)
+
+    async with ping_periodically(f"http://{server.host}:{server.port}", "foo", "key"):
+        await asyncio.sleep(1.5)
+
+    assert len(pings) == 1
+
+
+async def test_stops_on_error(aiohttp_server):
+    """Test that the ping task is cancelled when the body of the context raises."""
+    async def ping(request: Request):
+        return json_response({})
+
+    app = Application()
+    app.router.add_put("/jobs/{job_id}/ping", ping)
+    server = await aiohttp_server(app)
+
+    with pytest.raises(ValueError):
+        async with ping_periodically(
+            f"http://{server.host}:{server.port}",
+            "foo",
+            "key",
+        ):
+            await asyncio.sleep(0.1)
+            raise ValueError
+
+    tasks = [
+        task
+        for task in asyncio.all_tasks()
+        if task.get_coro().__name__ == "_ping_periodically"
+    ]
+
+    assert tasks == []
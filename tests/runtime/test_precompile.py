@@ -0,0 +1,149 @@
+import json
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+from pyfixtures import fixture_context, get_fixtures
+
+from virtool_workflow.cli import run_workflow
+from virtool_workflow.errors import WorkflowValidationError
+from virtool_workflow.runtime import precompile
+from virtool_workflow.runtime.discover import (
+    load_custom_fixtures,
+    load_workflow_from_file,
+)
+from virtool_workflow.runtime.precompile import (
+    PRECOMPILED_PATH,
+    check_workflow,
+    load_precompiled,
+)
+
+WORKFLOW = '''
+from pathlib import Path
+
+from virtool_workflow import RunSubprocess, step
+
+
+@step
+async def first(run_subprocess: RunSubprocess, work_path: Path):
+    """The first step."""
+
+
+@step(name="Second Step")
+async def second(message: str, scope, optional: int = 1):
+    """The second step."""
+'''
+
+FIXTURES = '''
+from pyfixtures import fixture
+
+
+@fixture
+def message(proc: int, skewer) -> str:
+    return "hello"
+'''
+
+
+@pytest.fixture
+def workflow_path(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Path:
+    monkeypatch.chdir(tmp_path)
+
+    (tmp_path / "workflow.py").write_text(WORKFLOW)
+    (tmp_path / "fixtures.py").write_text(FIXTURES)
+
+    return tmp_path
+
+
+def test_precompile(workflow_path: Path):
+    result = CliRunner().invoke(run_workflow, ["precompile"])
+
+    assert result.exit_code == 0, result.output
+
+    precompiled = json.loads((workflow_path / PRECOMPILED_PATH).read_text())
+
+    assert precompiled["builtin_fixtures"] == ["run_subprocess", "skewer"]
+    assert precompiled["fixtures"]["message"] == ["proc", "skewer"]
+    assert precompiled["steps"] == [
+        {
+            "name": "First",
+            "function": "first",
+            "fixtures": ["run_subprocess", "work_path"],
+        },
+        {
+            "name": "Second Step",
+            "function": "second",
+            "fixtures": ["message", "scope", "optional"],
+        },
+    ]
+
+    assert list((workflow_path / "__pycache__").glob("workflow.*.pyc"))
+    assert load_precompiled() == precompiled
+
+    (workflow_path / "workflow.py").write_text(WORKFLOW + "\n# Changed\n")
+
+    assert load_precompiled() is None
+
+
+def test_precompile_missing_fixture(workflow_path: Path):
+    """Test that precompiling fails if a step requests a fixture that does not exist."""
+    (workflow_path / "fixtures.py").unlink()
+
+    result = CliRunner().invoke(run_workflow, ["precompile"])
+
+    assert result.exit_code == 1
+    assert "'message' requested by step 'Second Step'" in result.output
+    assert not (workflow_path / PRECOMPILED_PATH).exists()
+
+
+def test_check_workflow_precompiled(
+    monkeypatch: pytest.MonkeyPatch,
+    workflow_path: Path,
+):
+    """Test that the fixture graph is not resolved again if the precompiled workflow is
+    up to date.
+    """
+    assert CliRunner().invoke(run_workflow, ["precompile"]).exit_code == 0
+
+    def get_fixture_graph(workflow):
+        raise AssertionError("fixture graph was resolved")
+
+    monkeypatch.setattr(precompile, "get_fixture_graph", get_fixture_graph)
+
+    with fixture_context():
+        workflow = load_workflow_from_file()
+        load_custom_fixtures()
+
+        assert check_workflow(workflow) == load_precompiled()
+
+
+@pytest.mark.parametrize("outdated", [False, True])
+def test_check_workflow(outdated: bool, workflow_path: Path):
+    """Test that the fixture graph is resolved if there is no up-to-date precompiled
+    workflow and that built-in fixtures are not left in the fixture context.
+    """
+    if outdated:
+        assert CliRunner().invoke(run_workflow, ["precompile"]).exit_code == 0
+        (workflow_path / "fixtures.py").write_text(FIXTURES + "\n# Changed\n")
+
+    with fixture_context():
+        workflow = load_workflow_from_file()
+        load_custom_fixtures()
+
+        fixtures = dict(get_fixtures())
+
+        assert check_workflow(workflow) is None
+        assert get_fixtures() == fixtures
+
+
+def test_check_workflow_missing_fixture(workflow_path: Path):
+    (workflow_path / "fixtures.py").unlink()
+
+    with fixture_context(), pytest.raises(WorkflowValidationError, match="'message'"):
+        check_workflow(load_workflow_from_file())
+
+
+def test_redis_list_name_required():
+    result = CliRunner().invoke(run_workflow, [])
+
+    assert result.exit_code == 2
+    assert "--redis-list-name" in result.output
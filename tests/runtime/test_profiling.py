@@ -0,0 +1,54 @@
+import pstats
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from virtool_workflow.runtime.profiling import (
+    get_profile_path,
+    profile_step,
+    upload_profile,
+)
+
+
+def test_get_profile_path():
+    assert get_profile_path(Path("profiles"), "abc", 0, "Parse FastQC Output") == Path(
+        "profiles/abc/01_parse_fastqc_output.prof",
+    )
+
+
+def test_profile_step(tmp_path: Path):
+    def busy():
+        return sum(range(10000))
+
+    path = tmp_path / "abc" / "01_busy.prof"
+
+    with profile_step(path):
+        busy()
+
+    stats = pstats.Stats(str(path))
+
+    assert any(func[2] == "busy" for func in stats.stats)
+
+
+def test_profile_step_write_error(tmp_path: Path):
+    """Test that failing to write the profile does not mask the step's exception."""
+    (tmp_path / "abc").write_text("not a directory")
+
+    with pytest.raises(ValueError, match="step failed"), profile_step(
+        tmp_path / "abc" / "01_busy.prof",
+    ):
+        raise ValueError("step failed")
+
+
+async def test_upload_profile_error(tmp_path: Path):
+    """Test that failing to get the analysis does not fail the job."""
+
+    class Scope(dict):
+        async def instantiate_by_key(self, key: str):
+            raise KeyError(key)
+
+    await upload_profile(
+        Scope(_job=SimpleNamespace(args={"analysis_id": "foo"})),
+        tmp_path / "01_busy.prof",
+    )
@@ -0,0 +1,37 @@
+from virtool_workflow.runtime.metrics import MetricsRegistry
+from virtool_workflow.runtime.prometheus import render_metrics, write_metrics_textfile
+
+
+def test_render_metrics():
+    registry = MetricsRegistry()
+
+    registry.counter("retries_total", "Retries").inc(2, function="get_json")
+    registry.histogram("step_seconds", "Steps", buckets=(1, 10)).observe(
+        5.0,
+        step='say "hi"',
+    )
+
+    assert render_metrics(registry) == (
+        "# HELP retries_total Retries\n"
+        "# TYPE retries_total counter\n"
+        'retries_total{function="get_json"} 2\n'
+        "# HELP step_seconds Steps\n"
+        "# TYPE step_seconds histogram\n"
+        'step_seconds_bucket{step="say \\"hi\\"",le="1.0"} 0\n'
+        'step_seconds_bucket{step="say \\"hi\\"",le="10.0"} 1\n'
+        'step_seconds_bucket{step="say \\"hi\\"",le="+Inf"} 1\n'
+        'step_seconds_sum{step="say \\"hi\\""} 5.0\n'
+        'step_seconds_count{step="say \\"hi\\""} 1\n'
+    )
+
+
+def test_write_metrics_textfile(tmp_path):
+    registry = MetricsRegistry()
+    registry.gauge("pending", "Pending").set(1)
+
+    path = tmp_path / "metrics" / "workflow.prom"
+
+    write_metrics_textfile(path, registry)
+
+    assert path.read_text() == render_metrics(registry)
+    assert [p.name for p in path.parent.iterdir()] == ["workflow.prom"]
@@ -0,0 +1,65 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from virtool_workflow.runtime.resources import (
+    DEFAULT_MEM,
+    GB,
+    detect_mem,
+    detect_proc,
+    get_cgroup_cpu_limit,
+    get_cgroup_memory_limit,
+    get_total_memory,
+    limit_threads,
+)
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [("max 100000", None), ("200000 100000", 2.0), ("50000 100000", 0.5)],
+)
+def test_get_cgroup_cpu_limit(expected: float | None, tmp_path: Path, value: str):
+    (tmp_path / "cpu.max").write_text(f"{value}\n")
+
+    assert get_cgroup_cpu_limit(tmp_path) == expected
+
+
+@pytest.mark.parametrize(("value", "expected"), [("max", None), (str(GB), GB)])
+def test_get_cgroup_memory_limit(expected: int | None, tmp_path: Path, value: str):
+    (tmp_path / "memory.max").write_text(f"{value}\n")
+
+    assert get_cgroup_memory_limit(tmp_path) == expected
+
+
+def test_missing_cgroup(tmp_path: Path):
+    """Test that limits fall back to the host when there are no cgroup files."""
+    assert get_cgroup_cpu_limit(tmp_path) is None
+    assert get_cgroup_memory_limit(tmp_path) is None
+
+    assert detect_proc(tmp_path) == len(os.sched_getaffinity(0))
+    assert detect_mem(tmp_path) == min(DEFAULT_MEM, get_total_memory() // GB)
+
+
+def test_detect(tmp_path: Path):
+    """Test that fractional CPU quotas are rounded down but never below one."""
+    (tmp_path / "cpu.max").write_text("50000 100000\n")
+    (tmp_path / "memory.max").write_text(f"{2 * GB - 1}\n")
+
+    assert detect_proc(tmp_path) == 1
+    assert detect_mem(tmp_path) == 1
+
+
+def test_detect_mem_below_one_gb(tmp_path: Path):
+    """Test that memory limits are rounded down even when less than 1 GB is set."""
+    (tmp_path / "memory.max").write_text(f"{GB // 2}\n")
+
+    assert detect_mem(tmp_path) == 0
+
+
+def test_limit_threads():
+    env = limit_threads({"PATH": "/bin", "OMP_NUM_THREADS": "16"}, 2)
+
+    assert env["PATH"] == "/bin"
+    assert env["OMP_NUM_THREADS"] == "2"
+    assert env["OPENBLAS_NUM_THREADS"] == "2"
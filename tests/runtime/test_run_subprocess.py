@@ -1,6 +1,13 @@
+import asyncio
+
+import pytest
 import structlog.testing
 
-from virtool_workflow.runtime.run_subprocess import stderr_logger
+from virtool_workflow.runtime.run_subprocess import (
+    StderrLogger,
+    stderr_logger,
+    watch_pipe_batched,
+)
 
 
 def test_decodable_string():
@@ -13,3 +20,65 @@ async def test_non_decodable_string():
     with structlog.testing.capture_logs() as logs:
         stderr_logger(b"Hello, \xe2\x98")
     assert logs[0]["line"] == b"Hello, \xe2\x98"
+
+
+@pytest.mark.parametrize("block_size", [8, 1024])
+async def test_watch_pipe_batched(block_size: int):
+    """Test that lines split across blocks are reassembled and batched."""
+    stream = asyncio.StreamReader()
+    stream.feed_data(b"first\nsec")
+    stream.feed_data(b"ond\nthird\nlast")
+    stream.feed_eof()
+
+    batches = []
+
+    async def handler(lines: list[bytes]):
+        batches.append(lines)
+
+    await watch_pipe_batched(stream, handler, block_size=block_size)
+
+    assert [line for batch in batches for line in batch] == [
+        b"first\n",
+        b"second\n",
+        b"third\n",
+        b"last",
+    ]
+
+    if block_size == 1024:
+        assert batches == [[b"first\n", b"second\n", b"third\n"], [b"last"]]
+
+
+def test_stderr_logger_rate_limit():
+    """Test that lines over the limit are summarised rather than logged."""
+    log_stderr = StderrLogger(limit=2, interval=60)
+
+    with structlog.testing.capture_logs() as logs:
+        log_stderr([b"one\n", b"two\n", b"three\n"])
+        log_stderr([b"four\n"])
+        log_stderr.flush()
+
+    assert [log.get("line") for log in logs[:2]] == ["one", "two"]
+    assert logs[2]["event"] == "suppressed stderr lines"
+    assert logs[2]["count"] == 2
+    assert logs[2]["last_line"] == "four"
+    assert len(logs) == 3
+
+
+async def test_watch_pipe_batched_long_line():
+    """Test that a long line without newlines read over many blocks is kept whole."""
+    stream = asyncio.StreamReader()
+
+    for _ in range(1000):
+        stream.feed_data(b"#" * 100 + b"\r")
+
+    stream.feed_data(b"done\nnext")
+    stream.feed_eof()
+
+    batches = []
+
+    async def handler(lines: list[bytes]):
+        batches.append(lines)
+
+    await watch_pipe_batched(stream, handler, block_size=64)
+
+    assert batches == [[(b"#" * 100 + b"\r") * 1000 + b"done\n"], [b"next"]]
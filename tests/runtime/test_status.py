@@ -0,0 +1,66 @@
+import asyncio
+
+from virtool_workflow.runtime.metrics import registry
+from virtool_workflow.runtime.status import (
+    status_reporter,
+    status_updates_coalesced,
+    status_updates_sent,
+)
+
+
+class FakeAPI:
+    def __init__(self):
+        self.posted = []
+
+    async def post_json(self, path: str, data: dict) -> dict:
+        await asyncio.sleep(0.01)
+        self.posted.append((path, data))
+        return data
+
+
+def make_payload(step_name: str, state: str = "running") -> dict:
+    return {"state": state, "step_name": step_name}
+
+
+async def test_coalesce():
+    """Test that updates pushed within the interval are coalesced into the newest."""
+    registry.reset()
+
+    api = FakeAPI()
+
+    async with status_reporter(api, "job", 0.2) as reporter:
+        reporter.push(make_payload("first"))
+        await asyncio.sleep(0.05)
+
+        reporter.push(make_payload("second"))
+        reporter.push(make_payload("third"))
+        await asyncio.sleep(0.3)
+
+    assert [data["step_name"] for _, data in api.posted] == ["first", "third"]
+    assert status_updates_coalesced.value() == 1
+    assert status_updates_sent.value() == 2
+
+
+async def test_push_does_not_block():
+    """Test that pushing an update returns before it is delivered."""
+    api = FakeAPI()
+
+    async with status_reporter(api, "job", 0) as reporter:
+        reporter.push(make_payload("first"))
+        assert api.posted == []
+
+    assert api.posted == [("/jobs/job/status", make_payload("first"))]
+
+
+async def test_flush():
+    """Test that a flushed terminal update is delivered immediately."""
+    api = FakeAPI()
+
+    async with status_reporter(api, "job", 10) as reporter:
+        reporter.push(make_payload("first"))
+        await asyncio.sleep(0.05)
+
+        reporter.push(make_payload("first", "complete"))
+        await reporter.flush()
+
+        assert api.posted[-1][1]["state"] == "complete"
@@ -0,0 +1,157 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+from aiohttp.web import Application, Request, Response
+from pyfixtures import fixture, fixture_context
+
+from virtool_workflow.runtime.config import RunConfig
+from virtool_workflow.runtime.tracing import (
+    Tracer,
+    TracingFixtureScope,
+    export_traces,
+    to_chrome_trace,
+    to_otlp,
+    tracer,
+)
+
+
+@pytest.fixture
+def enabled_tracer():
+    tracer.clear()
+    tracer.enabled = True
+
+    yield tracer
+
+    tracer.enabled = False
+    tracer.clear()
+
+
+def test_disabled():
+    """Test that no spans are recorded when tracing is disabled."""
+    disabled = Tracer()
+
+    with disabled.span("outer") as span:
+        disabled.set_attributes(foo="bar")
+
+    assert span is None
+    assert disabled.spans == []
+
+
+async def test_nesting(enabled_tracer):
+    """Test that spans opened in child tasks are nested in the enclosing span."""
+
+    async def child(name: str):
+        with enabled_tracer.span(name):
+            await asyncio.sleep(0)
+
+    with enabled_tracer.span("outer", job_id="foo") as outer:
+        await asyncio.gather(child("a"), child("b"))
+
+    spans = {span.name: span for span in enabled_tracer.spans}
+
+    assert spans["a"].parent_id == outer.span_id
+    assert spans["b"].parent_id == outer.span_id
+    assert spans["a"].lane != spans["b"].lane
+    assert outer.parent_id is None
+    assert outer.attributes == {"job_id": "foo"}
+
+    chrome_trace = to_chrome_trace(enabled_tracer.spans)
+
+    assert [event["name"] for event in chrome_trace["traceEvents"]] == [
+        "outer",
+        "a",
+        "b",
+    ]
+    assert len({event["tid"] for event in chrome_trace["traceEvents"]}) == 3
+
+
+def test_error(enabled_tracer):
+    with pytest.raises(ValueError), enabled_tracer.span("fails"):
+        raise ValueError
+
+    (span,) = enabled_tracer.spans
+
+    assert span.error is True
+    assert span.attributes == {"exception": "ValueError"}
+
+    (otlp_span,) = to_otlp(enabled_tracer.spans, 1)["resourceSpans"][0][
+        "scopeSpans"
+    ][0]["spans"]
+
+    assert otlp_span["traceId"] == "0" * 31 + "1"
+    assert otlp_span["parentSpanId"] == ""
+    assert otlp_span["status"] == {"code": 2}
+    assert otlp_span["attributes"] == [
+        {"key": "exception", "value": {"stringValue": "ValueError"}},
+    ]
+
+
+async def test_export_otlp(aiohttp_server, monkeypatch: pytest.MonkeyPatch):
+    """Test that exported spans are sent with the resource attributes of the job."""
+    monkeypatch.setattr(tracer, "resource", {})
+    tracer.clear()
+
+    requests = []
+
+    async def handler(request: Request) -> Response:
+        requests.append(await request.json())
+        return Response()
+
+    app = Application()
+    app.router.add_post("/v1/traces", handler)
+
+    server = await aiohttp_server(app)
+
+    config = RunConfig(
+        dev=False,
+        jobs_api_connection_string="",
+        mem=8,
+        proc=2,
+        work_path=Path("temp"),
+        trace_otlp_endpoint=f"http://{server.host}:{server.port}/v1/traces",
+    )
+
+    async with export_traces(config):
+        tracer.set_resource(**{"virtool.job.id": "foo", "virtool.workflow": "nuvs"})
+
+        with tracer.span("step"):
+            pass
+
+    tracer.clear()
+
+    ((resource_spans,),) = [request["resourceSpans"] for request in requests]
+
+    assert resource_spans["resource"]["attributes"] == [
+        {"key": "service.name", "value": {"stringValue": "virtool-workflow"}},
+        {"key": "virtool.job.id", "value": {"stringValue": "foo"}},
+        {"key": "virtool.workflow", "value": {"stringValue": "nuvs"}},
+    ]
+    assert [
+        span["name"] for span in resource_spans["scopeSpans"][0]["spans"]
+    ] == ["step"]
+
+
+async def test_fixture_scope(enabled_tracer):
+    """Test that a span is recorded for each instantiated fixture."""
+
+    @fixture
+    def dependency():
+        return 1
+
+    @fixture
+    def dependant(dependency: int):
+        return dependency + 1
+
+    with fixture_context():
+        fixture(dependency)
+        fixture(dependant)
+
+        async with TracingFixtureScope() as scope:
+            assert await scope.instantiate_by_key("dependant") == 2
+            assert await scope.instantiate_by_key("dependant") == 2
+
+    assert sorted(span.name for span in enabled_tracer.spans) == [
+        "fixture dependant",
+        "fixture dependency",
+    ]
@@ -0,0 +1,239 @@
+import gzip
+from pathlib import Path
+
+import pytest
+
+from virtool_workflow.io import (
+    IndexedFasta,
+    build_fai,
+    compute_fasta_stats,
+    iter_fastq_batches,
+    read_fai,
+)
+from virtool_workflow.io.fasta import get_fai_path
+from virtool_workflow.runtime.executor import Executor
+
+
+def parse_fasta(text: str) -> dict[str, str]:
+    sequences = {}
+
+    for block in text.split(">")[1:]:
+        header, *lines = block.splitlines()
+        sequences[header.split()[0]] = "".join(lines)
+
+    return sequences
+
+
+@pytest.fixture
+def fasta_path(tmp_path: Path, virtool_workflow_example_path: Path) -> Path:
+    """The example reference FASTA file wrapped to 60 bases per line."""
+    with gzip.open(virtool_workflow_example_path / "reference" / "reference.fa.gz") as f:
+        sequences = parse_fasta(f.read().decode())
+
+    path = tmp_path / "reference.fa"
+
+    with open(path, "w") as f:
+        for name, sequence in sequences.items():
+            f.write(f">{name} description\n")
+
+            for i in range(0, len(sequence), 60):
+                f.write(sequence[i : i + 60] + "\n")
+
+    return path
+
+
+class TestIndexedFasta:
+    def test_fetch(self, fasta_path: Path):
+        sequences = parse_fasta(fasta_path.read_text())
+
+        with IndexedFasta(fasta_path) as fasta:
+            assert list(fasta) == list(sequences)
+            assert fasta.lengths == {
+                name: len(sequence) for name, sequence in sequences.items()
+            }
+
+            for name, sequence in sequences.items():
+                assert fasta[name] == sequence
+                assert fasta.fetch(name, 55, 125) == sequence[55:125]
+                assert fasta.fetch(name, 60, 120) == sequence[60:120]
+                assert fasta.fetch(name, len(sequence) - 5) == sequence[-5:]
+                assert fasta.fetch(name, 10, 10) == ""
+
+            with pytest.raises(KeyError):
+                fasta.fetch("missing")
+
+    def test_index_file(self, fasta_path: Path):
+        """Test that the index is written next to the FASTA file and reused."""
+        with IndexedFasta(fasta_path) as fasta:
+            records = fasta.records
+
+        fai_path = get_fai_path(fasta_path)
+
+        assert read_fai(fai_path) == records == build_fai(fasta_path)
+
+        with IndexedFasta(fasta_path) as fasta:
+            assert fasta.records == records
+
+    def test_empty(self, tmp_path: Path):
+        path = tmp_path / "empty.fa"
+        path.touch()
+
+        with IndexedFasta(path) as fasta:
+            assert len(fasta) == 0
+
+    def test_blank_lines(self, tmp_path: Path):
+        """Test that blank lines at the start of the file and the end of each sequence
+        are ignored.
+        """
+        path = tmp_path / "blank.fa"
+        path.write_bytes(b"\n\n>s1\nACG\nTA\n\n>s2\r\nGG\r\n\r\n")
+
+        with IndexedFasta(path) as fasta:
+            assert fasta.lengths == {"s1": 5, "s2": 2}
+            assert fasta["s1"] == "ACGTA"
+            assert fasta["s2"] == "GG"
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            b">s1\nACGT\n>s1\nGG\n",
+            b">s1\nACG\nTA\nCGT\n",
+            b">s1\nACG\nTACG\nT\n",
+            b">s1\nACG\n\nTAC\n",
+        ],
+        ids=["duplicate", "shorter", "longer", "blank"],
+    )
+    def test_invalid(self, data: bytes, tmp_path: Path):
+        path = tmp_path / "invalid.fa"
+        path.write_bytes(data)
+
+        with pytest.raises(ValueError):
+            build_fai(path)
+
+
+@pytest.mark.parametrize("chunk_size", [1000, 1024 * 1024 * 4])
+def test_iter_fastq_batches(chunk_size: int, virtool_workflow_example_path: Path):
+    path = virtool_workflow_example_path / "sample" / "reads_1.fq.gz"
+
+    with gzip.open(path) as f:
+        lines = f.read().splitlines()
+
+    batches = list(iter_fastq_batches(path, chunk_size))
+
+    assert sum(len(batch) for batch in batches) == len(lines) // 4
+
+    names = [name for batch in batches for name in batch.names]
+    sequences = [
+        batch.get_sequence(i) for batch in batches for i in range(len(batch))
+    ]
+    qualities = [batch.get_quality(i) for batch in batches for i in range(len(batch))]
+
+    assert names == [line[1:] for line in lines[0::4]]
+    assert sequences == [line.decode() for line in lines[1::4]]
+    assert qualities == [line.decode() for line in lines[3::4]]
+
+    assert list(batches[0].lengths[:3]) == [len(line) for line in lines[1:12:4]]
+
+
+def test_iter_fastq_batches_uncompressed(tmp_path: Path):
+    path = tmp_path / "reads.fq"
+    path.write_bytes(b"@read_1\nACGT\n+\nIIII\n@read_2\nGG\n+\nII")
+
+    first, last = iter_fastq_batches(path)
+
+    assert first.names == [b"read_1"]
+    assert first.sequences.tobytes() == b"ACGT"
+    assert list(first.offsets) == [0, 4]
+
+    # The last record has no trailing newline, so it is only read at the end of the
+    # file.
+    assert last.names == [b"read_2"]
+    assert last.qualities.tobytes() == b"II"
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        b"@read_1\nACGT\n+\nIIII\n\n",
+        b"@read_1\nACGT\n+\nIIII\n\n\n\n\n\n",
+        b"@read_1\nACGT\n+\nIIII\n@read_2\n\n+\n\n\n",
+    ],
+    ids=["blank_line", "blank_lines", "empty_read"],
+)
+def test_iter_fastq_batches_trailing_blank_lines(data: bytes, tmp_path: Path):
+    path = tmp_path / "reads.fq"
+    path.write_bytes(data)
+
+    for chunk_size in (1, 8, 1024):
+        batches = list(iter_fastq_batches(path, chunk_size))
+
+        names = [name for batch in batches for name in batch.names]
+        sequences = [
+            batch.get_sequence(i) for batch in batches for i in range(len(batch))
+        ]
+
+        assert names == [b"read_1", b"read_2"][: data.count(b"@")]
+        assert sequences == ["ACGT", ""][: data.count(b"@")]
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        b"@read_1\nACGT\n+\nIII\n",
+        b"read_1\nACGT\n+\nIIII\n",
+        b"@read_1\nACGT\n",
+        b"@read_1\nACGT\n+\n",
+        b"@read_1\nACGT\n+\nIIII\nread_2\nAC\nXX\nII\n",
+        b"@read_1\nACGT\n+\nIIII\n@read_2\nAC\nXX\nII\n",
+    ],
+    ids=["length", "header", "incomplete", "no_quality", "header_2", "separator_2"],
+)
+def test_iter_fastq_batches_invalid(data: bytes, tmp_path: Path):
+    path = tmp_path / "reads.fq"
+    path.write_bytes(data)
+
+    with pytest.raises(ValueError):
+        list(iter_fastq_batches(path))
+
+
+class TestComputeFastaStats:
+    @pytest.mark.parametrize("chunk_size", [100, 1024 * 1024 * 16])
+    async def test_ok(self, chunk_size: int, virtool_workflow_example_path: Path):
+        path = virtool_workflow_example_path / "reference" / "reference.fa.gz"
+
+        with gzip.open(path) as f:
+            sequences = parse_fasta(f.read().decode())
+
+        joined = "".join(sequences.values()).upper()
+
+        stats = await compute_fasta_stats(path, chunk_size=chunk_size)
+
+        assert stats.count == len(sequences)
+        assert stats.length == len(joined)
+        assert (stats.a, stats.c, stats.g, stats.t) == tuple(
+            joined.count(char) for char in "ACGT"
+        )
+        assert stats.gc["g"] == pytest.approx(joined.count("G") / len(joined))
+        assert sum(stats.gc.values()) == pytest.approx(1)
+
+    async def test_characters(self, tmp_path: Path):
+        """Test that header lines and line endings are not counted and that other
+        characters are counted as N.
+        """
+        path = tmp_path / "test.fa"
+        path.write_bytes(b">seq_1 GATTACA\r\nacgtN\r\nRY\r\n>seq_2\nGG\n")
+
+        stats = await compute_fasta_stats(path)
+
+        assert stats.count == 2
+        assert (stats.a, stats.c, stats.g, stats.t, stats.n) == (1, 1, 3, 1, 3)
+
+    async def test_executor(self, fasta_path: Path):
+        executor = Executor(2)
+
+        try:
+            stats = await compute_fasta_stats(fasta_path, executor, chunk_size=1000)
+        finally:
+            executor.close()
+
+        assert stats == await compute_fasta_stats(fasta_path)
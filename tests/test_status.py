@@ -28,20 +28,25 @@ async def test_ok(data: Data, run_config: RunConfig, snapshot: SnapshotAssertion
     @wf.step
     async def first():
         """Description of First."""
+        # Status updates are sent in the background.
+        await asyncio.sleep(0.1)
+
         assert data.job.status[-1].state == JobState.RUNNING
         assert data.job.status[-1].step_name == "First"
         assert data.job.status[-1].step_description == "Description of First."
 
-        await asyncio.sleep(1)
+        await asyncio.sleep(0.9)
 
     @wf.step
     async def second():
         """Description of Second."""
+        await asyncio.sleep(0.1)
+
         assert data.job.status[-1].state == JobState.RUNNING
         assert data.job.status[-1].step_name == "Second"
         assert data.job.status[-1].step_description == "Description of Second."
 
-        await asyncio.sleep(2)
+        await asyncio.sleep(1.9)
 
     on_success_called = False
 
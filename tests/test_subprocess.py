@@ -1,16 +1,22 @@
 import asyncio
 import datetime
+import os
+import sys
 from pathlib import Path
 
 import pytest
+import structlog.testing
+from pyfixtures import fixture_context
 from _pytest._py.path import LocalPath
 from structlog.testing import LogCapture
 from virtool.jobs.models import JobStatus, JobState
 from virtool.redis import Redis
 
-from virtool_workflow import RunSubprocess, Workflow
-from virtool_workflow.errors import SubprocessFailedError
+from virtool_workflow import RunPipeline, RunSubprocess, Workflow
+from virtool_workflow.errors import SubprocessFailedError, SubprocessMemoryLimitError
 from virtool_workflow.pytest_plugin.data import Data
+from virtool_workflow.runtime.fixtures import LazyFixtureScope
+from virtool_workflow.runtime.instrumentation import Instrumentation
 from virtool_workflow.runtime.redis import CANCELLATION_CHANNEL
 from virtool_workflow.runtime.run import start_runtime
 
@@ -52,6 +58,227 @@ async def test_stdout_is_handled(bash: Path, run_subprocess: RunSubprocess):
     assert lines == [b"hello world\n", b"foo bar\n"]
 
 
+async def test_stdout_is_batched(run_subprocess: RunSubprocess):
+    """Test that a function provided to ``stdout_handler`` is called with lists of
+    lines when ``batched`` is set.
+    """
+    batches = []
+
+    async def stdout_handler(lines):
+        batches.append(lines)
+
+    await run_subprocess(
+        ["seq", "100000"],
+        batched=True,
+        stdout_handler=stdout_handler,
+    )
+
+    lines = [line for batch in batches for line in batch]
+
+    assert lines == [f"{i}\n".encode() for i in range(1, 100001)]
+    assert len(batches) < len(lines)
+
+
+async def test_stdout_to_path(run_subprocess: RunSubprocess, tmp_path: Path):
+    """Test that stdout is written directly to a file when ``stdout`` is a path."""
+    path = tmp_path / "out.txt"
+
+    await run_subprocess(["seq", "3"], stdout=path)
+
+    assert path.read_bytes() == b"1\n2\n3\n"
+
+
+async def test_stdout_and_handler(run_subprocess: RunSubprocess, tmp_path: Path):
+    """Test that ``stdout`` and ``stdout_handler`` cannot be used together."""
+
+    async def stdout_handler(line):
+        pass
+
+    with pytest.raises(ValueError):
+        await run_subprocess(
+            ["seq", "3"],
+            stdout=tmp_path / "out.txt",
+            stdout_handler=stdout_handler,
+        )
+
+
+async def test_resource_limits(run_subprocess: RunSubprocess):
+    """Test that CPU affinity, niceness, and thread limits are applied."""
+    lines = []
+
+    async def stdout_handler(line):
+        lines.append(line.decode().strip())
+
+    cpu = min(os.sched_getaffinity(0))
+
+    await run_subprocess(
+        [
+            "sh",
+            "-c",
+            "grep Cpus_allowed_list /proc/self/status | cut -f2; "
+            "nice; "
+            "echo $OMP_NUM_THREADS",
+        ],
+        cpus={cpu},
+        nice=5,
+        stdout_handler=stdout_handler,
+        threads=3,
+    )
+
+    assert lines == [str(cpu), str(os.nice(0) + 5), "3"]
+
+
+async def test_usage_is_recorded(run_subprocess: RunSubprocess):
+    """Test that subprocess usage is added to the measurement for the running step."""
+    instrumentation = Instrumentation()
+
+    with instrumentation.step("Step") as measurement:
+        await run_subprocess(
+            [
+                sys.executable,
+                "-c",
+                "import time; b = bytearray(64 * 1024 ** 2); time.sleep(1)",
+            ],
+        )
+
+    (usage,) = measurement.subprocesses
+
+    assert usage.code == 0
+    assert usage.command == Path(sys.executable).name
+    assert usage.peak_rss > 64 * 1024**2
+    assert usage.wall_time >= 1
+
+
+async def test_memory_limit(run_subprocess: RunSubprocess):
+    """Test that a subprocess using more than ``memory_limit`` is terminated."""
+    with pytest.raises(SubprocessMemoryLimitError):
+        await asyncio.wait_for(
+            run_subprocess(
+                [
+                    sys.executable,
+                    "-c",
+                    "import time; b = bytearray(128 * 1024 ** 2); time.sleep(30)",
+                ],
+                memory_limit=64 * 1024**2,
+            ),
+            10,
+        )
+
+
+async def test_memory_limit_default(monkeypatch: pytest.MonkeyPatch):
+    """Test that subprocesses are limited to ``mem`` by default and that passing
+    ``memory_limit`` overrides it.
+    """
+    monkeypatch.setattr("virtool_workflow.runtime.run_subprocess.GB", 64 * 1024**2)
+
+    command = [
+        sys.executable,
+        "-c",
+        "import time; b = bytearray(128 * 1024 ** 2); time.sleep(1)",
+    ]
+
+    with fixture_context(copy_context=False):
+        async with LazyFixtureScope() as scope:
+            scope["mem"] = 1
+
+            run_subprocess = await scope.instantiate_by_key("run_subprocess")
+
+            with pytest.raises(SubprocessMemoryLimitError):
+                await asyncio.wait_for(run_subprocess(command), 10)
+
+            await run_subprocess(command, memory_limit=None)
+
+
+async def test_memory_limit_descendants(run_subprocess: RunSubprocess):
+    """Test that memory used by processes started by the subprocess counts towards
+    ``memory_limit``.
+    """
+    script = "import time; b = bytearray(128 * 1024 ** 2); time.sleep(30)"
+
+    with pytest.raises(SubprocessMemoryLimitError):
+        await asyncio.wait_for(
+            run_subprocess(
+                ["sh", "-c", f"{sys.executable} -c '{script}'; true"],
+                memory_limit=64 * 1024**2,
+            ),
+            10,
+        )
+
+
+async def test_memory_limit_sigterm_ignored(
+    monkeypatch: pytest.MonkeyPatch,
+    run_subprocess: RunSubprocess,
+):
+    """Test that a subprocess that ignores ``SIGTERM`` is killed."""
+    monkeypatch.setattr(
+        "virtool_workflow.runtime.run_subprocess.TERMINATE_TIMEOUT",
+        0.5,
+    )
+
+    with pytest.raises(SubprocessMemoryLimitError):
+        await asyncio.wait_for(
+            run_subprocess(
+                [
+                    sys.executable,
+                    "-c",
+                    "import signal, time; "
+                    "signal.signal(signal.SIGTERM, signal.SIG_IGN); "
+                    "b = bytearray(128 * 1024 ** 2); "
+                    "time.sleep(30)",
+                ],
+                memory_limit=64 * 1024**2,
+            ),
+            10,
+        )
+
+
+async def test_pipeline(run_pipeline: RunPipeline, tmp_path: Path):
+    """Test that the output of each command is piped into the next."""
+    path = tmp_path / "out.txt"
+
+    processes = await run_pipeline(
+        ["seq", "100000"],
+        ["grep", "7"],
+        ["wc", "-l"],
+        stdout=path,
+    )
+
+    assert [process.returncode for process in processes] == [0, 0, 0]
+    assert path.read_text().strip() == str(
+        sum("7" in str(i) for i in range(1, 100001)),
+    )
+
+
+async def test_pipeline_sigpipe(run_pipeline: RunPipeline):
+    """Test that earlier commands killed by SIGPIPE do not fail the pipeline."""
+    lines = []
+
+    async def stdout_handler(line):
+        lines.append(line)
+
+    await run_pipeline(["yes"], ["head", "-n", "2"], stdout_handler=stdout_handler)
+
+    assert lines == [b"y\n", b"y\n"]
+
+
+async def test_pipeline_failed(run_pipeline: RunPipeline):
+    """Test that a failure anywhere in a pipeline raises ``SubprocessFailedError``."""
+    with pytest.raises(SubprocessFailedError):
+        await run_pipeline(["ls", "-doesnotexist"], ["cat"])
+
+
+async def test_pipeline_not_found(run_pipeline: RunPipeline):
+    """Test that no file descriptors are leaked if a command in a pipeline cannot be
+    started.
+    """
+    fds = os.listdir("/proc/self/fd")
+
+    with pytest.raises(FileNotFoundError):
+        await run_pipeline(["seq", "10"], ["doesnotexist"], ["cat"])
+
+    assert os.listdir("/proc/self/fd") == fds
+
+
 async def test_stderr_is_handled(bash: Path, run_subprocess: RunSubprocess):
     """Test that a function provided to ``stderr_handler`` is called with each line of
     stderr.
@@ -67,6 +294,16 @@ async def test_stderr_is_handled(bash: Path, run_subprocess: RunSubprocess):
     assert lines == [b"bash: /foo/bar: No such file or directory\n"]
 
 
+async def test_stderr_is_not_rate_limited(run_subprocess: RunSubprocess):
+    """Test that every line of stderr is logged when output is not batched."""
+    with structlog.testing.capture_logs() as logs:
+        await run_subprocess(["bash", "-c", "for i in $(seq 50); do echo $i >&2; done"])
+
+    assert [log["line"] for log in logs if log["event"] == "stderr"] == [
+        str(i) for i in range(1, 51)
+    ]
+
+
 async def test_subprocess_failed(run_subprocess: RunSubprocess):
     """Test that a ``SubprocessFailed`` error is raised when a command fails and is not
     raised when it succeeds.
@@ -3,11 +3,16 @@ A framework for defining Virtool workflows.
 """
 
 from virtool_workflow.decorators import step
-from virtool_workflow.runtime.run_subprocess import RunSubprocess
+from virtool_workflow.runtime.executor import Executor
+from virtool_workflow.runtime.fast_path import FastPath
+from virtool_workflow.runtime.run_subprocess import RunPipeline, RunSubprocess
 from virtool_workflow.workflow import Workflow, WorkflowStep
 
 __all__ = [
     "step",
+    "Executor",
+    "FastPath",
+    "RunPipeline",
     "RunSubprocess",
     "Workflow",
     "WorkflowStep",
@@ -1,66 +1,106 @@
 import asyncio
+from time import perf_counter
 
+import orjson
 from aiohttp import ClientConnectionError, ClientSession, TCPConnector
 from structlog import get_logger
 from virtool.jobs.models import JobAcquired
 
+from virtool_workflow.api.utils import decode_json_response, dumps_json
 from virtool_workflow.errors import (
     JobAlreadyAcquiredError,
     JobsAPIError,
     JobsAPIServerError,
 )
+from virtool_workflow.runtime.metrics import registry
+from virtool_workflow.runtime.tracing import tracer
 
 logger = get_logger("api")
 
+job_acquisition_seconds = registry.histogram(
+    "job_acquisition_seconds",
+    "The time taken to acquire a job from the jobs API, including retries.",
+)
+
 
 async def acquire_job_by_id(
     jobs_api_connection_string: str,
     job_id: str,
+    http: ClientSession | None = None,
 ) -> JobAcquired:
     """Acquire the job with a given ID via the API.
 
+    If ``http`` is provided, its connection pool is used for the acquisition request so
+    the connection can be reused for the rest of the job. Otherwise, a short-lived
+    session is created.
+
     :param jobs_api_connection_string: The url for the jobs API.
     :param job_id: The id of the job to acquire
+    :param http: An optional session to make the request with
     :return: a job including its API key
     """
-    async with ClientSession(
-        connector=TCPConnector(force_close=True, limit=100),
-    ) as session:
-        attempts = 4
-
-        while attempts > 0:
-            try:
-                async with session.patch(
-                    f"{jobs_api_connection_string}/jobs/{job_id}",
-                    json={"acquired": True},
-                ) as resp:
-                    logger.info("acquiring job", remaining_attempts=attempts, id=job_id)
-
-                    if resp.status == 200:
-                        job_json = await resp.json()
-                        logger.info("acquired job", id=job_id)
-                        return JobAcquired(**job_json)
-
-                    if resp.status == 400:
-                        if "already acquired" in await resp.text():
-                            raise JobAlreadyAcquiredError(await resp.json())
-
-                    logger.critical(
-                        "unexpected api error during job acquisition",
-                        status=resp.status,
-                        body=await resp.text(),
+    started_at = perf_counter()
+
+    try:
+        with tracer.span("acquire job", job_id=job_id):
+            if http is None:
+                async with ClientSession(
+                    connector=TCPConnector(force_close=True, limit=100),
+                    json_serialize=dumps_json,
+                ) as session:
+                    return await _acquire_job_by_id(
+                        session,
+                        jobs_api_connection_string,
+                        job_id,
                     )
 
-                    raise JobsAPIError("Unexpected API error during job acquisition")
+            return await _acquire_job_by_id(http, jobs_api_connection_string, job_id)
+    finally:
+        job_acquisition_seconds.observe(perf_counter() - started_at)
 
-            except ClientConnectionError:
-                logger.warning(
-                    "unable to connect to server. retrying in 1 second.",
-                    remaining_attemtps=attempts,
-                    id=job_id,
+
+async def _acquire_job_by_id(
+    session: ClientSession,
+    jobs_api_connection_string: str,
+    job_id: str,
+) -> JobAcquired:
+    attempts = 4
+
+    while attempts > 0:
+        try:
+            async with session.patch(
+                f"{jobs_api_connection_string}/jobs/{job_id}",
+                json={"acquired": True},
+            ) as resp:
+                logger.info("acquiring job", remaining_attempts=attempts, id=job_id)
+
+                if resp.status == 200:
+                    job_json = await decode_json_response(resp)
+                    logger.info("acquired job", id=job_id)
+                    return JobAcquired(**job_json)
+
+                if resp.status == 400:
+                    body = await resp.read()
+
+                    if b"already acquired" in body:
+                        raise JobAlreadyAcquiredError(orjson.loads(body))
+
+                logger.critical(
+                    "unexpected api error during job acquisition",
+                    status=resp.status,
+                    body=await resp.text(),
                 )
-                await asyncio.sleep(1)
 
-            attempts -= 1
+                raise JobsAPIError("Unexpected API error during job acquisition")
+
+        except ClientConnectionError:
+            logger.warning(
+                "unable to connect to server. retrying in 1 second.",
+                remaining_attemtps=attempts,
+                id=job_id,
+            )
+            await asyncio.sleep(1)
+
+        attempts -= 1
 
     raise JobsAPIServerError("Unable to connect to server.")
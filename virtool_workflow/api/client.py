@@ -1,5 +1,7 @@
 from contextlib import asynccontextmanager
+from functools import wraps
 from pathlib import Path
+from time import perf_counter
 
 import aiofiles
 from aiohttp import BasicAuth, ClientSession
@@ -8,43 +10,118 @@ from structlog import get_logger
 from virtool_workflow.api.utils import (
     API_CHUNK_SIZE,
     decode_json_response,
+    dumps_json,
     raise_exception_by_status_code,
     retry,
+    stream_gzip_json,
 )
 from virtool_workflow.errors import JobsAPIError
 from virtool_workflow.files import VirtoolFileFormat
+from virtool_workflow.runtime.metrics import registry
+from virtool_workflow.runtime.tracing import tracer
 
 logger = get_logger("http")
 
+bytes_downloaded = registry.counter(
+    "api_bytes_downloaded_total",
+    "The number of file bytes downloaded from the jobs API.",
+)
+
+bytes_uploaded = registry.counter(
+    "api_bytes_uploaded_total",
+    "The number of file bytes uploaded to the jobs API.",
+)
+
+TRANSFER_BUCKETS = (0.1, 0.5, 1, 5, 10, 30, 60, 300, 900, 1800, 3600)
+"""Histogram buckets in seconds for file transfer durations."""
+
+download_seconds = registry.histogram(
+    "api_download_seconds",
+    "The time taken to download files from the jobs API.",
+    buckets=TRANSFER_BUCKETS,
+)
+
+upload_seconds = registry.histogram(
+    "api_upload_seconds",
+    "The time taken to upload files to the jobs API.",
+    buckets=TRANSFER_BUCKETS,
+)
+
+
+def get_resource_type(path: str) -> str:
+    """Get the type of resource a jobs API ``path`` refers to.
+
+    For example, ``/indexes/foo/files/reference.fa.gz`` refers to ``indexes``.
+    """
+    return path.lstrip("/").split("/", 1)[0]
+
+
+def _traced(method: str):
+    """Record a span for each attempt of the decorated request method."""
+
+    def decorator(f):
+        @wraps(f)
+        async def wrapper(self, path: str, *args, **kwargs):
+            with tracer.span(f"{method} {path}", method=method, path=path):
+                return await f(self, path, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
 
 class APIClient:
-    def __init__(self, http: ClientSession, jobs_api_connection_string: str):
+    def __init__(
+        self,
+        http: ClientSession,
+        jobs_api_connection_string: str,
+        auth: BasicAuth | None = None,
+    ):
         self.http = http
         self.jobs_api_connection_string = jobs_api_connection_string
 
+        self._auth = auth
+        """Credentials sent with each request when the session is shared."""
+
     @retry
+    @_traced("GET")
     async def get_json(self, path: str) -> dict:
         """Get the JSON response from the provided API ``path``."""
-        async with self.http.get(f"{self.jobs_api_connection_string}{path}") as resp:
+        async with self.http.get(
+            f"{self.jobs_api_connection_string}{path}",
+            auth=self._auth,
+        ) as resp:
             await raise_exception_by_status_code(resp)
             return await decode_json_response(resp)
 
     @retry
+    @_traced("GET")
     async def get_file(self, path: str, target_path: Path):
         """Download the file at URL ``path`` to the local ``target_path``."""
-        async with self.http.get(f"{self.jobs_api_connection_string}{path}") as resp:
+        started_at = perf_counter()
+
+        async with self.http.get(
+            f"{self.jobs_api_connection_string}{path}",
+            auth=self._auth,
+        ) as resp:
             if resp.status != 200:
                 raise JobsAPIError(
                     f"Encountered {resp.status} while downloading '{path}'",
                 )
 
+            resource = get_resource_type(path)
+
             async with aiofiles.open(target_path, "wb") as f:
                 async for chunk in resp.content.iter_chunked(API_CHUNK_SIZE):
                     await f.write(chunk)
+                    bytes_downloaded.inc(len(chunk), resource=resource)
+
+            download_seconds.observe(perf_counter() - started_at, resource=resource)
 
             return target_path
 
     @retry
+    @_traced("PATCH")
     async def patch_json(self, path: str, data: dict) -> dict:
         """Make a patch request against the provided API ``path`` and return the response
         as a dictionary of decoded JSON.
@@ -55,12 +132,54 @@ class APIClient:
         """
         async with self.http.patch(
             f"{self.jobs_api_connection_string}{path}",
+            auth=self._auth,
             json=data,
         ) as resp:
             await raise_exception_by_status_code(resp)
             return await decode_json_response(resp)
 
     @retry
+    @_traced("PATCH")
+    async def patch_json_streamed(self, path: str, data: dict) -> dict:
+        """Make a patch request with a large JSON body against the API ``path``.
+
+        The body is encoded with orjson and gzipped in a thread and sent in chunks as
+        it is encoded. ``data`` must not be modified until the request completes.
+
+        :param path: the API path to make the request against
+        :param data: the data to send with the request
+        :return: the response as a dictionary of decoded JSON
+        """
+        resource = get_resource_type(path)
+        started_at = perf_counter()
+        size = 0
+
+        async def body():
+            nonlocal size
+
+            async for chunk in stream_gzip_json(data):
+                size += len(chunk)
+                yield chunk
+
+        async with self.http.patch(
+            f"{self.jobs_api_connection_string}{path}",
+            auth=self._auth,
+            data=body(),
+            headers={
+                "Content-Encoding": "gzip",
+                "Content-Type": "application/json",
+            },
+        ) as resp:
+            await raise_exception_by_status_code(resp)
+            response = await decode_json_response(resp)
+
+        bytes_uploaded.inc(size, resource=resource)
+        upload_seconds.observe(perf_counter() - started_at, resource=resource)
+
+        return response
+
+    @retry
+    @_traced("POST")
     async def post_file(
         self,
         path: str,
@@ -74,23 +193,34 @@ class APIClient:
         if file_format is not None:
             params.update(format=file_format)
 
+        started_at = perf_counter()
+
         async with self.http.post(
             f"{self.jobs_api_connection_string}{path}",
+            auth=self._auth,
             data={"file": open(file_path, "rb")},
             params=params,
         ) as response:
             await raise_exception_by_status_code(response)
 
+        resource = get_resource_type(path)
+
+        bytes_uploaded.inc(file_path.stat().st_size, resource=resource)
+        upload_seconds.observe(perf_counter() - started_at, resource=resource)
+
     @retry
+    @_traced("POST")
     async def post_json(self, path: str, data: dict) -> dict:
         async with self.http.post(
             f"{self.jobs_api_connection_string}{path}",
+            auth=self._auth,
             json=data,
         ) as resp:
             await raise_exception_by_status_code(resp)
             return await decode_json_response(resp)
 
     @retry
+    @_traced("PUT")
     async def put_file(
         self,
         path: str,
@@ -104,26 +234,40 @@ class APIClient:
         if file_format is not None:
             params.update(format=file_format)
 
+        started_at = perf_counter()
+
         async with self.http.put(
             f"{self.jobs_api_connection_string}{path}",
+            auth=self._auth,
             data={"file": open(file_path, "rb")},
             params=params,
         ) as response:
             await raise_exception_by_status_code(response)
 
+        resource = get_resource_type(path)
+
+        bytes_uploaded.inc(file_path.stat().st_size, resource=resource)
+        upload_seconds.observe(perf_counter() - started_at, resource=resource)
+
     @retry
+    @_traced("PUT")
     async def put_json(self, path: str, data: dict) -> dict:
         async with self.http.put(
             f"{self.jobs_api_connection_string}{path}",
+            auth=self._auth,
             json=data,
         ) as resp:
             await raise_exception_by_status_code(resp)
             return await decode_json_response(resp)
 
     @retry
+    @_traced("DELETE")
     async def delete(self, path: str) -> dict | None:
         """Make a delete request against the provided API ``path``."""
-        async with self.http.delete(f"{self.jobs_api_connection_string}{path}") as resp:
+        async with self.http.delete(
+            f"{self.jobs_api_connection_string}{path}",
+            auth=self._auth,
+        ) as resp:
             await raise_exception_by_status_code(resp)
 
             try:
@@ -137,9 +281,17 @@ async def api_client(
     jobs_api_connection_string: str,
     job_id: str,
     key: str,
+    http: ClientSession | None = None,
 ):
-    """An authenticated :class:``APIClient`` to make requests against the jobs API."""
-    async with ClientSession(
-        auth=BasicAuth(login=f"job-{job_id}", password=key),
-    ) as http:
-        yield APIClient(http, jobs_api_connection_string)
+    """An authenticated :class:``APIClient`` to make requests against the jobs API.
+
+    If ``http`` is provided, the client shares its connection pool and sends the job
+    credentials with each request. The session is not closed when the context exits.
+    """
+    auth = BasicAuth(login=f"job-{job_id}", password=key)
+
+    if http is None:
+        async with ClientSession(auth=auth, json_serialize=dumps_json) as http:
+            yield APIClient(http, jobs_api_connection_string)
+    else:
+        yield APIClient(http, jobs_api_connection_string, auth)
@@ -0,0 +1,178 @@
+"""Create the HTTP session shared by all requests made to the jobs API."""
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from aiohttp import ClientError, ClientSession, TCPConnector, TraceConfig
+from structlog import get_logger
+
+from virtool_workflow.api.utils import dumps_json
+from virtool_workflow.runtime.config import RunConfig
+from virtool_workflow.runtime.metrics import registry
+
+logger = get_logger("http")
+
+connections_created = registry.counter(
+    "http_connections_created_total",
+    "The number of new connections opened to the jobs API.",
+)
+
+connections_reused = registry.counter(
+    "http_connections_reused_total",
+    "The number of requests that reused a pooled keep-alive connection.",
+)
+
+dns_cache_hits = registry.counter(
+    "http_dns_cache_hits_total",
+    "The number of hostname lookups served from the DNS cache.",
+)
+
+dns_cache_misses = registry.counter(
+    "http_dns_cache_misses_total",
+    "The number of hostname lookups that required DNS resolution.",
+)
+
+
+def get_connection_reuse_rate() -> float:
+    """Get the fraction of requests that reused an existing connection.
+
+    Returns ``0.0`` if no connections have been made.
+    """
+    created = connections_created.value()
+    reused = connections_reused.value()
+
+    if created + reused == 0:
+        return 0.0
+
+    return reused / (created + reused)
+
+
+def create_trace_config() -> TraceConfig:
+    """Create a :class:`TraceConfig` that records connection pool metrics."""
+    trace_config = TraceConfig()
+
+    async def on_connection_create_end(*_):
+        connections_created.inc()
+
+    async def on_connection_reuseconn(*_):
+        connections_reused.inc()
+
+    async def on_dns_cache_hit(*_):
+        dns_cache_hits.inc()
+
+    async def on_dns_cache_miss(*_):
+        dns_cache_misses.inc()
+
+    trace_config.on_connection_create_end.append(on_connection_create_end)
+    trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+    trace_config.on_dns_cache_hit.append(on_dns_cache_hit)
+    trace_config.on_dns_cache_miss.append(on_dns_cache_miss)
+
+    return trace_config
+
+
+def create_connector(config: RunConfig) -> TCPConnector:
+    """Create a connection pool tuned using the settings in ``config``."""
+    return TCPConnector(
+        keepalive_timeout=config.http_keepalive_timeout,
+        limit=config.http_connection_limit,
+        limit_per_host=config.http_connection_limit_per_host,
+        ttl_dns_cache=config.http_dns_cache_ttl,
+    )
+
+
+@asynccontextmanager
+async def http_session(config: RunConfig) -> AsyncIterator[ClientSession]:
+    """A :class:`ClientSession` with a tuned connection pool.
+
+    The same session is used for job acquisition and all subsequent requests made
+    during the job, so keep-alive connections are reused wherever possible.
+
+    Connection reuse statistics are logged when the session is closed.
+    """
+    async with ClientSession(
+        connector=create_connector(config),
+        json_serialize=dumps_json,
+        read_bufsize=config.http_read_bufsize,
+        trace_configs=[create_trace_config()],
+    ) as session:
+        yield session
+
+    logger.info(
+        "closed http session",
+        connections_created=int(connections_created.value()),
+        connections_reused=int(connections_reused.value()),
+        reuse_rate=round(get_connection_reuse_rate(), 3),
+    )
+
+
+async def warm_connections(http: ClientSession, url: str, count: int) -> None:
+    """Open ``count`` pooled connections to ``url``.
+
+    Concurrent ``HEAD`` requests are made so each one opens or refreshes a separate
+    keep-alive connection. The response status is irrelevant. The hostname is resolved
+    and cached and the TCP and TLS handshakes are completed before the first real
+    request is made.
+
+    :param http: the session whose pool should be warmed
+    :param url: the URL to make requests to
+    :param count: the number of connections to open
+    """
+
+    async def warm():
+        try:
+            async with http.head(url) as resp:
+                await resp.release()
+        except (ClientError, OSError) as e:
+            logger.info("could not warm connection", url=url, exception=str(e))
+
+    await asyncio.gather(*[warm() for _ in range(count)])
+
+
+async def _warm_connections_periodically(
+    http: ClientSession,
+    url: str,
+    count: int,
+    interval: float,
+):
+    try:
+        while True:
+            await warm_connections(http, url, count)
+            await asyncio.sleep(interval)
+    except asyncio.CancelledError:
+        logger.info("stopped warming connections")
+
+
+@asynccontextmanager
+async def keep_connections_warm(http: ClientSession, config: RunConfig):
+    """Keep pooled connections to the jobs API open while the context is open.
+
+    Connections are refreshed at half the keep-alive timeout so they are not closed
+    for being idle. This is intended to be used while the runtime waits for a job.
+
+    Nothing is done if ``config.http_prewarm_connections`` is ``0``.
+
+    :param http: the session whose pool should be kept warm
+    :param config: the run configuration
+    """
+    if config.http_prewarm_connections < 1:
+        yield
+        return
+
+    logger.info("warming connections", count=config.http_prewarm_connections)
+
+    task = asyncio.create_task(
+        _warm_connections_periodically(
+            http,
+            config.jobs_api_connection_string,
+            config.http_prewarm_connections,
+            max(config.http_keepalive_timeout / 2, 1.0),
+        ),
+    )
+
+    try:
+        yield
+    finally:
+        task.cancel()
+        await task
@@ -1,10 +1,15 @@
 import asyncio
+import zlib
+from collections.abc import AsyncIterator, Iterator
+from contextlib import closing
 from functools import wraps
+from typing import Any
+
+import orjson
 
 from aiohttp import (
     ClientError,
     ClientResponse,
-    ContentTypeError,
 )
 from structlog import get_logger
 
@@ -15,9 +20,15 @@ from virtool_workflow.errors import (
     JobsAPINotFoundError,
     JobsAPIServerError,
 )
+from virtool_workflow.runtime.metrics import registry
 
 logger = get_logger("api")
 
+api_retries = registry.counter(
+    "api_retries_total",
+    "The number of jobs API requests retried after a connection error.",
+)
+
 API_CHUNK_SIZE = 1024 * 1024 * 2
 """The size of chunks to use when downloading files from the API in bytes."""
 
@@ -27,6 +38,28 @@ API_MAX_RETRIES = 5
 API_RETRY_BASE_DELAY = 5.0
 """The base delay in seconds between retries for API requests."""
 
+GZIP_LEVEL = 1
+"""The compression level for gzipped request bodies.
+
+JSON compresses well even at the fastest level.
+"""
+
+JSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+"""Options for encoding JSON with orjson.
+
+Non-string keys are converted to strings as the standard library does, and NumPy
+values can be encoded directly.
+"""
+
+JSON_THREAD_THRESHOLD = 1024 * 1024
+"""The size in bytes above which response bodies are parsed in a thread."""
+
+JSON_STREAM_DEPTH = 3
+"""The depth to which containers are split up when streaming JSON.
+
+Values nested deeper than this are encoded in one piece.
+"""
+
 
 def retry(
     func=None,
@@ -71,6 +104,8 @@ def retry(
                     else:
                         delay = base_delay * (2**attempt)
 
+                    api_retries.inc(function=f.__name__)
+
                     log.info(
                         "retrying after connection error",
                         exception=str(e),
@@ -90,23 +125,56 @@ def retry(
     return decorator(func)
 
 
+def dumps_json(data: Any) -> str:
+    """Encode ``data`` as JSON with orjson.
+
+    This is used as the ``json_serialize`` function for :class:`ClientSession`.
+    """
+    return orjson.dumps(data, option=JSON_OPTIONS).decode()
+
+
+def _is_json_content_type(content_type: str) -> bool:
+    return content_type == "application/json" or content_type.endswith("+json")
+
+
+async def _loads(body: bytes) -> Any:
+    if len(body) > JSON_THREAD_THRESHOLD:
+        return await asyncio.to_thread(orjson.loads, body)
+
+    return orjson.loads(body)
+
+
 async def decode_json_response(resp: ClientResponse) -> dict | list | None:
     """Decode a JSON response from a :class:``ClientResponse``.
 
+    The body is parsed with orjson. Large bodies are parsed in a thread so they do not
+    block the event loop.
+
     Raise a :class:`ValueError` if the response is not JSON.
 
     :param resp: the response to decode
-    :return: the decoded JSON
+    :return: the decoded JSON or ``None`` if the body is empty
     """
-    try:
-        return await resp.json()
-    except ContentTypeError:
-        raise ValueError(f"Response from  {resp.url} was not JSON. {await resp.text()}")
+    body = await resp.read()
+
+    if not _is_json_content_type(resp.content_type):
+        raise ValueError(
+            f"Response from {resp.url} was not JSON. "
+            f"{body.decode(errors='replace')}",
+        )
+
+    if not body.strip():
+        return None
+
+    return await _loads(body)
 
 
 async def raise_exception_by_status_code(resp: ClientResponse):
     """Raise an exception based on the status code of the response.
 
+    The body of successful responses is not read, so it is only parsed once by
+    :func:`decode_json_response`.
+
     :param resp: the response to check
     :raise JobsAPIBadRequest: the response status code is 400
     :raise JobsAPIForbidden: the response status code is 403
@@ -114,6 +182,9 @@ async def raise_exception_by_status_code(resp: ClientResponse):
     :raise JobsAPIConflict: the response status code is 409
     :raise JobsAPIServerError: the response status code is 500
     """
+    if 200 <= resp.status < 300:
+        return
+
     status_exception_map = {
         400: JobsAPIBadRequestError,
         403: JobsAPIForbiddenError,
@@ -122,22 +193,104 @@ async def raise_exception_by_status_code(resp: ClientResponse):
         500: JobsAPIServerError,
     }
 
+    body = await resp.read()
+
     try:
-        resp_json: dict | None = await resp.json()
-    except ContentTypeError:
+        resp_json = (
+            await _loads(body) if _is_json_content_type(resp.content_type) else None
+        )
+    except ValueError:
         resp_json = None
 
-    if resp.status not in range(200, 299):
-        if resp_json is None:
-            try:
-                message = await resp.text()
-            except UnicodeDecodeError:
-                message = "Could not decode response message"
-        else:
-            message = resp_json["message"] if "message" in resp_json else str(resp_json)
-
-        if resp.status in status_exception_map:
-            raise status_exception_map[resp.status](message)
-        raise ValueError(
-            f"Status code {resp.status} not handled for response\n {resp}",
-        )
+    if isinstance(resp_json, dict) and "message" in resp_json:
+        message = resp_json["message"]
+    elif resp_json is not None:
+        message = str(resp_json)
+    else:
+        try:
+            message = body.decode(resp.get_encoding())
+        except (LookupError, RuntimeError, UnicodeDecodeError):
+            message = "Could not decode response message"
+
+    if resp.status in status_exception_map:
+        raise status_exception_map[resp.status](message)
+
+    raise ValueError(
+        f"Status code {resp.status} not handled for response\n {resp}",
+    )
+
+
+def _encode_key(key: Any) -> bytes:
+    if isinstance(key, str):
+        return orjson.dumps(key)
+
+    # Let orjson convert the key so it matches ``dumps_json``. Strip ``{`` and
+    # ``:null}`` from the encoded object.
+    return orjson.dumps({key: None}, option=JSON_OPTIONS)[1:-6]
+
+
+def _iter_json_pieces(value: Any, depth: int) -> Iterator[bytes]:
+    if depth and isinstance(value, dict) and value:
+        separator = b"{"
+
+        for key, item in value.items():
+            yield separator + _encode_key(key) + b":"
+            yield from _iter_json_pieces(item, depth - 1)
+            separator = b","
+
+        yield b"}"
+
+    elif depth and isinstance(value, list | tuple) and value:
+        separator = b"["
+
+        for item in value:
+            yield separator
+            yield from _iter_json_pieces(item, depth - 1)
+            separator = b","
+
+        yield b"]"
+
+    else:
+        yield orjson.dumps(value, option=JSON_OPTIONS)
+
+
+def iter_gzip_json(data: Any, chunk_size: int = API_CHUNK_SIZE) -> Iterator[bytes]:
+    """Encode ``data`` as gzipped JSON in chunks.
+
+    Dictionaries and lists near the top of ``data`` are encoded one item at a time, so
+    the complete JSON document is never held in memory.
+
+    :param data: the data to encode
+    :param chunk_size: the number of bytes of JSON to compress at once
+    :return: an iterator of gzipped chunks
+    """
+    compressor = zlib.compressobj(GZIP_LEVEL, wbits=31)
+
+    buffer = []
+    size = 0
+
+    for piece in _iter_json_pieces(data, JSON_STREAM_DEPTH):
+        buffer.append(piece)
+        size += len(piece)
+
+        if size >= chunk_size:
+            if compressed := compressor.compress(b"".join(buffer)):
+                yield compressed
+
+            buffer.clear()
+            size = 0
+
+    yield compressor.compress(b"".join(buffer)) + compressor.flush()
+
+
+async def stream_gzip_json(data: Any) -> AsyncIterator[bytes]:
+    """Encode ``data`` as gzipped JSON in a thread and yield the chunks.
+
+    ``data`` must not be modified until the stream is exhausted.
+
+    :param data: the data to encode
+    :return: an async iterator of gzipped chunks for use as a request body
+    """
+    with closing(iter_gzip_json(data)) as chunks:
+        while chunk := await asyncio.to_thread(next, chunks, None):
+            yield chunk
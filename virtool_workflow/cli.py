@@ -5,7 +5,11 @@ from pathlib import Path
 
 import click
 
+from virtool_workflow.errors import WorkflowValidationError
+from virtool_workflow.runtime.precompile import precompile as run_precompile
+from virtool_workflow.runtime.resources import detect_mem, detect_proc
 from virtool_workflow.runtime.run import start_runtime
+from virtool_workflow.utils import configure_logs
 
 
 @click.option(
@@ -13,6 +17,54 @@ from virtool_workflow.runtime.run import start_runtime
     help="Run in development mode.",
     is_flag=True,
 )
+@click.option(
+    "--fast-path",
+    default="/dev/shm",
+    help="A RAM-backed directory for intermediate files.",
+    type=click.Path(path_type=Path),
+)
+@click.option(
+    "--fast-path-fraction",
+    default=0.25,
+    help="The fraction of --mem that may be used in --fast-path. 0 disables it.",
+    type=float,
+)
+@click.option(
+    "--http-connection-limit",
+    help="The maximum number of simultaneous connections to the jobs API.",
+    type=int,
+    default=100,
+)
+@click.option(
+    "--http-connection-limit-per-host",
+    help="The maximum number of simultaneous connections per host. 0 is unlimited.",
+    type=int,
+    default=0,
+)
+@click.option(
+    "--http-dns-cache-ttl",
+    help="The number of seconds to cache resolved hostnames for.",
+    type=int,
+    default=300,
+)
+@click.option(
+    "--http-keepalive-timeout",
+    help="The number of seconds to keep idle connections open for reuse.",
+    type=float,
+    default=30.0,
+)
+@click.option(
+    "--http-prewarm-connections",
+    help="The number of connections to open to the jobs API while waiting for a job.",
+    type=int,
+    default=2,
+)
+@click.option(
+    "--http-read-bufsize",
+    help="The size of the HTTP response read buffer in bytes.",
+    type=int,
+    default=1024 * 1024 * 2,
+)
 @click.option(
     "--jobs-api-connection-string",
     help="The URL of the jobs API.",
@@ -20,15 +72,43 @@ from virtool_workflow.runtime.run import start_runtime
 )
 @click.option(
     "--mem",
-    help="The amount of memory to use in GB.",
+    help="The amount of memory to use in GB. Defaults to the cgroup memory limit or 8.",
+    type=int,
+    default=detect_mem,
+)
+@click.option(
+    "--metrics-port",
+    default=None,
+    help="A port to serve Prometheus metrics on at /metrics.",
     type=int,
-    default=8,
+)
+@click.option(
+    "--metrics-textfile-path",
+    default=None,
+    help="A path to write Prometheus metrics to when the runtime exits.",
+    type=click.Path(path_type=Path),
 )
 @click.option(
     "--proc",
-    help="The number of processes to use.",
+    help="The number of processes to use. Defaults to the cgroup CPU quota.",
     type=int,
-    default=2,
+    default=detect_proc,
+)
+@click.option(
+    "--profile",
+    help="Profile each workflow step and write the stats to --profile-path.",
+    is_flag=True,
+)
+@click.option(
+    "--profile-path",
+    default="profiles",
+    help="The path where step profiles will be stored. Must be outside --work-path.",
+    type=click.Path(path_type=Path),
+)
+@click.option(
+    "--profile-upload",
+    help="Upload step profiles as files associated with the analysis.",
+    is_flag=True,
 )
 @click.option(
     "--redis-connection-string",
@@ -37,31 +117,95 @@ from virtool_workflow.runtime.run import start_runtime
 )
 @click.option(
     "--redis-list-name",
-    help="The name of the Redis list to watch for incoming jobs.",
-    required=True,
+    help="The name of the Redis list to watch for incoming jobs. Required.",
 )
 @click.option(
     "--sentry-dsn",
     help="A Sentry DSN. Sentry will not be configured if no value is provided.",
     default=None,
 )
+@click.option(
+    "--status-interval",
+    help="The minimum number of seconds between job status updates.",
+    type=float,
+    default=0.5,
+)
 @click.option(
     "--timeout",
     help="Maximum time to wait for an incoming job",
     default=1000,
 )
+@click.option(
+    "--timeline-path",
+    default=None,
+    help="A path to write a JSON timeline of step measurements to.",
+    type=click.Path(path_type=Path),
+)
+@click.option(
+    "--trace-otlp-endpoint",
+    default=None,
+    help="An OTLP/HTTP traces endpoint to send spans to when the runtime exits.",
+)
+@click.option(
+    "--trace-path",
+    default=None,
+    help="A path to write a Chrome trace JSON file to when the runtime exits.",
+    type=click.Path(path_type=Path),
+)
 @click.option(
     "--work-path",
     default="temp",
     help="The path where temporary files will be stored.",
     type=click.Path(path_type=Path),
 )
-@click.command()
-def run_workflow(**kwargs):
+@click.option(
+    "--work-path-cleanup",
+    default="thread",
+    help="How to delete old work directories: in a background thread, a detached "
+    "process, or before continuing.",
+    type=click.Choice(["process", "sync", "thread"]),
+)
+@click.option(
+    "--work-path-max-usage",
+    default=0.0,
+    help="The disk space in GB a job may use in the work directory. 0 means no limit.",
+    type=float,
+)
+@click.option(
+    "--work-path-min-free",
+    default=0.0,
+    help="Delete old work directories before continuing if less than this many GB "
+    "are free.",
+    type=float,
+)
+@click.group(invoke_without_command=True)
+@click.pass_context
+def run_workflow(ctx: click.Context, **kwargs):
     """Run a workflow."""
+    if ctx.invoked_subcommand is not None:
+        return
+
+    if kwargs["redis_list_name"] is None:
+        raise click.UsageError("Missing option '--redis-list-name'.", ctx)
+
     asyncio.run(start_runtime(**kwargs))
 
 
+@run_workflow.command()
+def precompile():
+    """Validate and precompile the workflow in the current directory.
+
+    Checks that every requested fixture exists and compiles the workflow and framework
+    to bytecode so the runtime starts faster.
+    """
+    configure_logs(False)
+
+    try:
+        run_precompile()
+    except WorkflowValidationError as e:
+        raise click.ClickException(str(e)) from e
+
+
 def cli_main():
     """Main pip entrypoint."""
     run_workflow(auto_envvar_prefix="VT")
@@ -1,12 +1,31 @@
-from virtool_workflow.data.analyses import analysis
-from virtool_workflow.analysis.fastqc import fastqc
-from virtool_workflow.data.hmms import hmms
-from virtool_workflow.data.indexes import index
-from virtool_workflow.data.jobs import job, push_status
-from virtool_workflow.data.ml import ml
-from virtool_workflow.data.samples import sample
-from virtool_workflow.data.subtractions import subtractions
-from virtool_workflow.data.uploads import uploads
+from importlib import import_module
+
+_MODULES = {
+    "analysis": "virtool_workflow.data.analyses",
+    "fastqc": "virtool_workflow.analysis.fastqc",
+    "hmms": "virtool_workflow.data.hmms",
+    "index": "virtool_workflow.data.indexes",
+    "job": "virtool_workflow.data.jobs",
+    "ml": "virtool_workflow.data.ml",
+    "progress": "virtool_workflow.data.jobs",
+    "push_status": "virtool_workflow.data.jobs",
+    "sample": "virtool_workflow.data.samples",
+    "subtractions": "virtool_workflow.data.subtractions",
+    "uploads": "virtool_workflow.data.uploads",
+}
+"""The module each fixture is imported from when it is first accessed."""
+
+
+def __getattr__(name: str):
+    try:
+        module_name = _MODULES[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}",
+        ) from None
+
+    return getattr(import_module(module_name), name)
+
 
 __all__ = [
     "analysis",
@@ -15,6 +34,7 @@ __all__ = [
     "index",
     "job",
     "ml",
+    "progress",
     "push_status",
     "sample",
     "subtractions",
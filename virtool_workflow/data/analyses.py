@@ -76,9 +76,16 @@ class WFAnalysis:
     async def upload_result(self, results: dict[str, Any]):
         """Upload the results dict for the analysis.
 
+        The results are encoded and compressed in a thread while they are uploaded, so
+        large results do not block the workflow or need to be held in memory as JSON.
+        ``results`` must not be modified until the upload completes.
+
         :param results: the analysis results
         """
-        await self._api.patch_json(f"/analyses/{self.id}", {"results": results})
+        await self._api.patch_json_streamed(
+            f"/analyses/{self.id}",
+            {"results": results},
+        )
 
 
 @fixture
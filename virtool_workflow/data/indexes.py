@@ -14,9 +14,24 @@ from virtool.utils import decompress_file
 from virtool_workflow.api.client import APIClient
 from virtool_workflow.errors import MissingJobArgumentError
 from virtool_workflow.files import VirtoolFileFormat
+from virtool_workflow.runtime.config import RunConfig
+from virtool_workflow.runtime.disk import ensure_disk_space, estimate_size
 
 logger = get_logger("api")
 
+INDEX_FILE_NAMES = (
+    "otus.json.gz",
+    "reference.json.gz",
+    "reference.fa.gz",
+    "reference.1.bt2",
+    "reference.2.bt2",
+    "reference.3.bt2",
+    "reference.4.bt2",
+    "reference.rev.1.bt2",
+    "reference.rev.2.bt2",
+)
+"""The index files downloaded for analysis workflows."""
+
 
 @dataclass
 class WFIndex:
@@ -189,6 +204,7 @@ class WFNewIndex:
 @fixture
 async def index(
     _api: APIClient,
+    _config: RunConfig,
     analysis: Analysis,
     proc: int,
     work_path: Path,
@@ -205,22 +221,21 @@ async def index(
 
     log.info("got index json")
 
+    await ensure_disk_space(
+        _config,
+        estimate_size(
+            (file for file in index_.files if file.name in INDEX_FILE_NAMES),
+            compressed=("otus.json.gz", "reference.fa.gz"),
+        ),
+        f"index {id_}",
+    )
+
     index_work_path = work_path / "indexes" / index_.id
     await asyncio.to_thread(index_work_path.mkdir, parents=True, exist_ok=True)
 
     log.info("created index directory")
 
-    for name in (
-        "otus.json.gz",
-        "reference.json.gz",
-        "reference.fa.gz",
-        "reference.1.bt2",
-        "reference.2.bt2",
-        "reference.3.bt2",
-        "reference.4.bt2",
-        "reference.rev.1.bt2",
-        "reference.rev.2.bt2",
-    ):
+    for name in INDEX_FILE_NAMES:
         await _api.get_file(f"/indexes/{id_}/files/{name}", index_work_path / name)
         log.info("downloaded index file", name=name)
 
@@ -1,4 +1,6 @@
 import traceback
+from collections.abc import Callable
+from time import monotonic
 
 from pyfixtures import fixture
 from structlog import get_logger
@@ -6,12 +8,133 @@ from virtool.jobs.models import JobAcquired, Job, JobState
 
 from virtool_workflow import Workflow, WorkflowStep
 from virtool_workflow.api.client import APIClient
+from virtool_workflow.runtime.config import RunConfig
+from virtool_workflow.runtime.run_subprocess import LineOutputHandler
+from virtool_workflow.runtime.status import TERMINAL_STATES, StatusReporter
 
 MAX_TB = 50
 
 logger = get_logger("api")
 
 
+class WFProgress:
+    """Reports progress through the running workflow step.
+
+    Progress is expressed as a fraction of the step between ``0.0`` and ``1.0``. It is
+    added to the progress already made through the workflow and sent to the jobs API
+    with the next status update.
+
+    Updates are rate-limited, so it is safe to call :meth:`update` for every line of
+    output from a long-running tool.
+    """
+
+    def __init__(self, push: Callable[[float], None], interval: float):
+        """Create a progress reporter.
+
+        :param push: a function that sends a fractional step progress
+        :param interval: the minimum number of seconds between pushed updates
+        """
+        self._interval = interval
+        self._last_pushed_at = 0.0
+        self._push = push
+
+        self.value = 0.0
+        """The last reported fractional progress through the step."""
+
+    def update(self, fraction: float) -> None:
+        """Set the progress through the current step.
+
+        :param fraction: the fraction of the step that is complete
+        """
+        self.value = min(max(fraction, 0.0), 1.0)
+
+        now = monotonic()
+
+        if self.value < 1.0 and now - self._last_pushed_at < self._interval:
+            return
+
+        self._last_pushed_at = now
+        self._push(self.value)
+
+    def advance(self, fraction: float) -> None:
+        """Add ``fraction`` to the progress through the current step.
+
+        :param fraction: the additional fraction of the step that is complete
+        """
+        self.update(self.value + fraction)
+
+    def handler(self, parse: Callable[[bytes], float | None]) -> LineOutputHandler:
+        """Create a :class:`.LineOutputHandler` that updates progress from output lines.
+
+        ``parse`` is called with every line. It should return the fractional progress
+        described by the line, or ``None`` if the line does not describe progress.
+
+        .. code-block:: python
+
+            def parse(line: bytes) -> float | None:
+                if line.startswith(b"Progress:"):
+                    return float(line.split()[1]) / 100
+
+            await run_subprocess(command, stderr_handler=progress.handler(parse))
+
+        :param parse: a function that extracts progress from a line of output
+        :return: a handler for :func:`.run_subprocess`
+        """
+
+        async def func(line: bytes):
+            fraction = parse(line)
+
+            if fraction is not None:
+                self.update(fraction)
+
+        return func
+
+
+def create_status_payload(
+    error: Exception | None,
+    state: JobState,
+    step: WorkflowStep | None,
+    workflow: Workflow,
+    step_progress: float = 0.0,
+) -> dict:
+    """Create the request body for a job status update.
+
+    :param error: the error that caused the job to fail, if any
+    :param state: the current job state
+    :param step: the running workflow step, if any
+    :param workflow: the running workflow
+    :param step_progress: the fractional progress through ``step``
+    :return: the status update request body
+    """
+    error_ = None
+
+    if error:
+        error_ = {
+            "type": error.__class__.__name__,
+            "traceback": traceback.format_tb(error.__traceback__, MAX_TB),
+            "details": [str(arg) for arg in error.args],
+        }
+
+    if state in (JobState.WAITING, JobState.PREPARING):
+        progress = 0
+    elif state == JobState.COMPLETE:
+        progress = 100
+    else:
+        step_size = 100 // len(workflow.steps)
+        progress = step_size * workflow.steps.index(step) + int(
+            step_size * step_progress,
+        )
+
+    return {
+        "error": error_,
+        "progress": progress,
+        "stage": step.function.__name__ if step is not None else "",
+        "state": state.value,
+        "step_description": step.description if step is not None else "",
+        "step_name": step.display_name if step is not None else "",
+    }
+
+
 @fixture
 async def job(_api: APIClient, _job: JobAcquired) -> Job:
     return Job.parse_obj(_job)
@@ -19,44 +142,56 @@ async def job(_api: APIClient, _job: JobAcquired) -> Job:
 
 @fixture(scope="function")
 async def push_status(
-    _api: APIClient,
-    _job: JobAcquired,
     _error: Exception | None,
     _state: JobState,
+    _status: StatusReporter,
     _step: WorkflowStep | None,
     _workflow: Workflow,
 ):
-    error = None
+    """Push the current job status to the jobs API.
 
+    Updates are sent in the background by the :class:`.StatusReporter`. Updates for
+    terminal states are awaited until they have been delivered.
+    """
     if _error:
-        error = {
-            "type": _error.__class__.__name__,
-            "traceback": traceback.format_tb(_error.__traceback__, MAX_TB),
-            "details": [str(arg) for arg in _error.args],
-        }
-
         logger.critical("reporting error to api", error=_error)
 
-    if _state in (JobState.WAITING, JobState.PREPARING):
-        progress = 0
-    elif _state == JobState.COMPLETE:
-        progress = 100
-    else:
-        progress = (100 // len(_workflow.steps)) * _workflow.steps.index(_step)
-
-    step_name = _step.display_name if _step is not None else ""
-
-    payload = {
-        "error": error,
-        "progress": progress,
-        "stage": _step.function.__name__ if _step is not None else "",
-        "state": _state.value,
-        "step_description": _step.description if _step is not None else "",
-        "step_name": step_name,
-    }
+    payload = create_status_payload(_error, _state, _step, _workflow)
 
     async def func():
-        await _api.post_json(f"/jobs/{_job.id}/status", payload)
-        logger.info("reported status to api", step=step_name, state=_state)
+        _status.push(payload)
+
+        if _state in TERMINAL_STATES:
+            await _status.flush()
 
     return func
+
+
+@fixture(scope="function")
+async def progress(
+    _config: RunConfig,
+    _state: JobState,
+    _status: StatusReporter,
+    _step: WorkflowStep | None,
+    _workflow: Workflow,
+) -> WFProgress:
+    """A :class:`.WFProgress` for reporting progress through the running step.
+
+    Example:
+    -------
+    .. code-block:: python
+
+        @step
+        async def align(progress: WFProgress, sample: WFSample):
+            for i, path in enumerate(sample.read_paths):
+                await align_reads(path)
+                progress.update((i + 1) / len(sample.read_paths))
+
+    """
+
+    def push(fraction: float):
+        _status.push(
+            create_status_payload(None, _state, _step, _workflow, fraction),
+        )
+
+    return WFProgress(push, _config.status_interval)
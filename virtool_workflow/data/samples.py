@@ -15,6 +15,8 @@ from virtool_workflow.api.client import APIClient
 from virtool_workflow.data.uploads import WFUploads
 from virtool_workflow.errors import JobsAPINotFoundError
 from virtool_workflow.files import VirtoolFileFormat
+from virtool_workflow.runtime.config import RunConfig
+from virtool_workflow.runtime.disk import ensure_disk_space, estimate_size
 
 logger = get_logger("api")
 
@@ -85,6 +87,7 @@ class WFNewSample:
 @fixture
 async def sample(
     _api: APIClient,
+    _config: RunConfig,
     job: Job,
     uploads: WFUploads,
     work_path: Path,
@@ -101,6 +104,8 @@ async def sample(
 
     sample = Sample(**sample_json)
 
+    await ensure_disk_space(_config, estimate_size(sample.reads), f"sample {id_}")
+
     reads_path = work_path / "reads"
     await asyncio.to_thread(reads_path.mkdir, exist_ok=True, parents=True)
 
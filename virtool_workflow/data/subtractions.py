@@ -16,6 +16,8 @@ from virtool_workflow.api.client import APIClient
 from virtool_workflow.data.analyses import WFAnalysis
 from virtool_workflow.data.uploads import WFUploads
 from virtool_workflow.errors import MissingJobArgumentError
+from virtool_workflow.runtime.config import RunConfig
+from virtool_workflow.runtime.disk import ensure_disk_space, estimate_size
 
 logger = get_logger("api")
 
@@ -93,6 +95,9 @@ class WFNewSubtraction:
     This makes it impossible to further alter the files and ready state of the
     subtraction. This must be called before the workflow ends to make the subtraction
     usable.
+
+    The arguments can be calculated from :attr:`fasta_path` with
+    :func:`.compute_fasta_stats`.
     """
 
     name: str
@@ -119,6 +124,7 @@ class WFNewSubtraction:
 @fixture
 async def subtractions(
     _api: APIClient,
+    _config: RunConfig,
     analysis: WFAnalysis,
     work_path: Path,
 ) -> list[WFSubtraction]:
@@ -146,6 +152,12 @@ async def subtractions(
 
     # Do this in a separate loop in case fetching the JSON fails. This prevents
     # expensive and unnecessary file downloads.
+    await ensure_disk_space(
+        _config,
+        sum(estimate_size(subtraction.files) for subtraction in subtractions_),
+        "subtractions",
+    )
+
     for subtraction in subtractions_:
         logger.info("downloading subtraction files", id=subtraction.id)
 
@@ -60,3 +60,27 @@ class WorkflowStepsError(Exception):
 
 class SubprocessFailedError(SubprocessError):
     """Subprocess exited with non-zero status during a workflow."""
+
+
+class SubprocessMemoryLimitError(SubprocessFailedError):
+    """Subprocess was terminated for using more memory than it was allowed."""
+
+
+class WorkflowValidationError(Exception):
+    """Raised when workflow steps or fixtures request fixtures that do not exist."""
+
+    def __init__(self, missing: list[str]) -> None:
+        super().__init__("Missing fixtures: " + ", ".join(missing))
+        self.missing = missing
+
+
+class InsufficientDiskSpaceError(Exception):
+    """Raised when a job needs more disk space than it is allowed to use."""
+
+    def __init__(self, resource: str, required: int, available: int) -> None:
+        super().__init__(
+            f"Not enough disk space for {resource}: "
+            f"{required} bytes required, {available} bytes available",
+        )
+        self.available = available
+        self.required = required
@@ -0,0 +1,23 @@
+"""Fast readers for the sequence files used in workflows."""
+
+from virtool_workflow.io.fasta import (
+    FaiRecord,
+    IndexedFasta,
+    build_fai,
+    read_fai,
+    write_fai,
+)
+from virtool_workflow.io.fastq import FastqBatch, iter_fastq_batches
+from virtool_workflow.io.stats import FastaStats, compute_fasta_stats
+
+__all__ = [
+    "FaiRecord",
+    "FastaStats",
+    "FastqBatch",
+    "IndexedFasta",
+    "build_fai",
+    "compute_fasta_stats",
+    "iter_fastq_batches",
+    "read_fai",
+    "write_fai",
+]
@@ -0,0 +1,261 @@
+"""Random access to sequences in FASTA files.
+
+Sequences are read from a memory-mapped file using a ``.fai`` index in the format used
+by ``samtools faidx``, so only the requested part of a sequence is read from disk.
+"""
+
+import mmap
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from types import TracebackType
+
+
+@dataclass(frozen=True)
+class FaiRecord:
+    """The location of a sequence in a FASTA file."""
+
+    name: str
+    """The sequence ID."""
+
+    length: int
+    """The number of bases in the sequence."""
+
+    offset: int
+    """The byte offset of the first base of the sequence."""
+
+    line_bases: int
+    """The number of bases on each line of the sequence."""
+
+    line_width: int
+    """The number of bytes on each line of the sequence, including the line ending."""
+
+
+def get_fai_path(path: Path) -> Path:
+    """Get the path of the ``.fai`` index for the FASTA file at ``path``."""
+    return path.with_name(f"{path.name}.fai")
+
+
+def _build_fai(buffer: mmap.mmap | bytes) -> dict[str, FaiRecord]:
+    records = {}
+    size = len(buffer)
+    position = 0
+
+    # Skip blank lines at the start of the file.
+    while position < size and buffer[position] in b"\r\n":
+        position += 1
+
+    while position < size:
+        if buffer[position] != ord(">"):
+            raise ValueError(f"Expected FASTA header at byte {position}")
+
+        header_end = buffer.find(b"\n", position)
+
+        if header_end == -1:
+            header_end = size
+
+        name = buffer[position + 1 : header_end].split(maxsplit=1)[0].decode()
+        offset = header_end + 1
+
+        if name in records:
+            raise ValueError(f"Duplicate FASTA sequence ID {name!r}")
+
+        end = buffer.find(b"\n>", header_end)
+        end = size if end == -1 else end + 1
+
+        first_line_end = buffer.find(b"\n", offset, end)
+
+        if first_line_end == -1:
+            first_line_end = end
+
+        line_width = first_line_end - offset + 1
+        line_bases = line_width - 1
+
+        if line_bases and buffer[first_line_end - 1] == ord("\r"):
+            line_bases -= 1
+
+        # Blank lines at the end of the sequence are ignored.
+        sequence = buffer[offset:end].rstrip(b"\r\n")
+
+        # Every line but the last must end exactly every ``line_width`` bytes.
+        line_ends = sequence[line_width - 1 :: line_width]
+
+        if sequence.count(b"\n") != len(line_ends) or line_ends.strip(b"\n"):
+            raise ValueError(f"FASTA sequence {name!r} has lines of different lengths")
+
+        length = len(sequence) - sequence.count(b"\n") - sequence.count(b"\r")
+
+        records[name] = FaiRecord(name, length, offset, line_bases, line_width)
+
+        position = end
+
+    return records
+
+
+def build_fai(path: Path) -> dict[str, FaiRecord]:
+    """Build a ``.fai`` index for the uncompressed FASTA file at ``path``.
+
+    :param path: the FASTA file
+    :raise ValueError: the file is not a valid FASTA file
+    :return: the index records keyed by sequence ID
+    """
+    with open(path, "rb") as f:
+        if path.stat().st_size == 0:
+            return {}
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            return _build_fai(buffer)
+
+
+def read_fai(path: Path) -> dict[str, FaiRecord]:
+    """Read a ``.fai`` index file.
+
+    :param path: the index file
+    :raise ValueError: the index contains a sequence ID more than once
+    :return: the index records keyed by sequence ID
+    """
+    records = {}
+
+    with open(path) as f:
+        for line in f:
+            name, length, offset, line_bases, line_width = line.split("\t")[:5]
+
+            if name in records:
+                raise ValueError(f"Duplicate FASTA sequence ID {name!r}")
+
+            records[name] = FaiRecord(
+                name,
+                int(length),
+                int(offset),
+                int(line_bases),
+                int(line_width),
+            )
+
+    return records
+
+
+def write_fai(records: dict[str, FaiRecord], path: Path):
+    """Write index records to a ``.fai`` index file.
+
+    :param records: the index records
+    :param path: the path to write the index to
+    """
+    with open(path, "w") as f:
+        for record in records.values():
+            f.write(
+                f"{record.name}\t{record.length}\t{record.offset}\t"
+                f"{record.line_bases}\t{record.line_width}\n",
+            )
+
+
+class IndexedFasta:
+    """A memory-mapped FASTA file with random access to sequences by ID.
+
+    The ``.fai`` index next to the FASTA file is used if it is newer than the FASTA
+    file. Otherwise, the index is built and written next to the FASTA file if possible.
+    Gzipped FASTA files are not supported.
+
+    Example:
+
+    .. code-block:: python
+
+        with IndexedFasta(index.fasta_path) as fasta:
+            for sequence_id in fasta:
+                prefix = fasta.fetch(sequence_id, 0, 100)
+
+    :param path: the uncompressed FASTA file
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        """The path to the FASTA file."""
+
+        self.records = self._load_index()
+        """The index records keyed by sequence ID."""
+
+        self._file = open(path, "rb")
+
+        self._buffer = (
+            mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            if self.records
+            else b""
+        )
+
+    def _load_index(self) -> dict[str, FaiRecord]:
+        fai_path = get_fai_path(self.path)
+
+        try:
+            if fai_path.stat().st_mtime >= self.path.stat().st_mtime:
+                return read_fai(fai_path)
+        except FileNotFoundError:
+            pass
+
+        records = build_fai(self.path)
+
+        try:
+            write_fai(records, fai_path)
+        except OSError:
+            pass
+
+        return records
+
+    def __contains__(self, sequence_id: object) -> bool:
+        return sequence_id in self.records
+
+    def __enter__(self) -> "IndexedFasta":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ):
+        self.close()
+
+    def __getitem__(self, sequence_id: str) -> str:
+        return self.fetch(sequence_id)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.records)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    @property
+    def lengths(self) -> dict[str, int]:
+        """The length of each sequence keyed by sequence ID."""
+        return {name: record.length for name, record in self.records.items()}
+
+    def _get_offset(self, record: FaiRecord, position: int) -> int:
+        lines, column = divmod(position, record.line_bases)
+        return record.offset + lines * record.line_width + column
+
+    def fetch(self, sequence_id: str, start: int = 0, end: int | None = None) -> str:
+        """Get part of a sequence.
+
+        :param sequence_id: the sequence ID
+        :param start: the zero-based start position
+        :param end: the exclusive end position or ``None`` for the end of the sequence
+        :raise KeyError: the sequence does not exist
+        :return: the sequence between ``start`` and ``end``
+        """
+        record = self.records[sequence_id]
+
+        start, end, _ = slice(start, end).indices(record.length)
+
+        if start >= end:
+            return ""
+
+        data = self._buffer[
+            self._get_offset(record, start) : self._get_offset(record, end)
+        ]
+
+        return data.replace(b"\n", b"").replace(b"\r", b"").decode()
+
+    def close(self):
+        """Close the memory map and the file."""
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+
+        self._file.close()
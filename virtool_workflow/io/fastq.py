@@ -0,0 +1,160 @@
+"""Read FASTQ files in batches of records stored in NumPy arrays.
+
+Reading records in batches keeps per-record Python work to a minimum. The sequences and
+quality strings in a batch are each stored in a single array of bytes, so common
+calculations like base composition or mean quality can be vectorised.
+"""
+
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from virtool_workflow.io.utils import open_sequence_file
+
+if TYPE_CHECKING:
+    import numpy as np
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024 * 4
+"""The number of decompressed bytes read to make each batch."""
+
+
+@dataclass
+class FastqBatch:
+    """A batch of FASTQ records.
+
+    The sequence and quality of record ``i`` are in
+    ``sequences[offsets[i]:offsets[i + 1]]`` and
+    ``qualities[offsets[i]:offsets[i + 1]]``.
+    """
+
+    names: list[bytes]
+    """The record headers without the leading ``@``."""
+
+    sequences: "np.ndarray"
+    """The sequences of all records joined into one ``uint8`` array."""
+
+    qualities: "np.ndarray"
+    """The quality strings of all records joined into one ``uint8`` array."""
+
+    offsets: "np.ndarray"
+    """The start of each record in :attr:`sequences` followed by the total length."""
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    @property
+    def lengths(self) -> "np.ndarray":
+        """The length of each sequence."""
+        import numpy as np
+
+        return np.diff(self.offsets)
+
+    def get_sequence(self, index: int) -> str:
+        """Get the sequence of the record at ``index`` as a string."""
+        start, end = self.offsets[index], self.offsets[index + 1]
+        return self.sequences[start:end].tobytes().decode()
+
+    def get_quality(self, index: int) -> str:
+        """Get the quality string of the record at ``index`` as a string."""
+        start, end = self.offsets[index], self.offsets[index + 1]
+        return self.qualities[start:end].tobytes().decode()
+
+
+def _make_batch(lines: list[bytes]) -> FastqBatch:
+    import numpy as np
+
+    headers = lines[0::4]
+    sequences = lines[1::4]
+    separators = lines[2::4]
+    qualities = lines[3::4]
+
+    if not all(header[:1] == b"@" for header in headers):
+        header = next(header for header in headers if header[:1] != b"@")
+        raise ValueError(f"Expected FASTQ header, found {header[:50]!r}")
+
+    if not all(separator[:1] == b"+" for separator in separators):
+        separator = next(
+            separator for separator in separators if separator[:1] != b"+"
+        )
+        raise ValueError(f"Expected FASTQ separator, found {separator[:50]!r}")
+
+    count = len(headers)
+
+    lengths = np.fromiter(map(len, sequences), dtype=np.int64, count=count)
+
+    if not np.array_equal(
+        lengths,
+        np.fromiter(map(len, qualities), dtype=np.int64, count=count),
+    ):
+        raise ValueError("FASTQ sequence and quality lengths do not match")
+
+    offsets = np.zeros(count + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+
+    return FastqBatch(
+        names=[header[1:] for header in headers],
+        sequences=np.frombuffer(b"".join(sequences), dtype=np.uint8),
+        qualities=np.frombuffer(b"".join(qualities), dtype=np.uint8),
+        offsets=offsets,
+    )
+
+
+def iter_fastq_batches(
+    path: Path,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[FastqBatch]:
+    """Read the FASTQ file at ``path`` in batches of records.
+
+    Gzipped files are decompressed as they are read. Each batch holds the complete
+    records in about ``chunk_size`` bytes of the decompressed file.
+
+    Example:
+
+    .. code-block:: python
+
+        gc = 0
+
+        for batch in iter_fastq_batches(sample.read_paths[0]):
+            gc += np.isin(batch.sequences, (ord("G"), ord("C"))).sum()
+
+    :param path: a FASTQ file, optionally gzipped
+    :param chunk_size: the number of bytes to read for each batch
+    :raise ValueError: the file is not a valid FASTQ file
+    """
+    remainder = b""
+
+    with open_sequence_file(path) as f:
+        while chunk := f.read(chunk_size):
+            lines = (remainder + chunk).replace(b"\r", b"").split(b"\n")
+
+            # The last line is incomplete or empty, so it is carried over with any
+            # incomplete record. Empty lines before it are also carried over, as they
+            # may be blank lines at the end of the file rather than part of a record.
+            end = len(lines) - 1
+
+            while end and not lines[end - 1]:
+                end -= 1
+
+            complete = end // 4 * 4
+
+            remainder = b"\n".join(lines[complete:])
+
+            if complete:
+                yield _make_batch(lines[:complete])
+
+    lines = remainder.split(b"\n")
+
+    while lines and not lines[-1]:
+        lines.pop()
+
+    # The quality line of an empty read is empty, so it is removed with any blank
+    # lines at the end of the file.
+    if len(lines) % 4 == 3:
+        lines.append(b"")
+
+    if len(lines) % 4:
+        raise ValueError("FASTQ file ends with an incomplete record")
+
+    if lines:
+        yield _make_batch(lines)
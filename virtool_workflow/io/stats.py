@@ -0,0 +1,192 @@
+"""Count the nucleotides and sequences in large FASTA files.
+
+The file is decompressed and read in large chunks that end on line boundaries. Each
+chunk is counted with NumPy, optionally in the worker processes of an
+:class:`.Executor`, while the next chunk is being read.
+"""
+
+import asyncio
+from collections import deque
+from collections.abc import Iterator
+from contextlib import closing
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from virtool_workflow.io.utils import open_sequence_file
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from virtool_workflow.runtime.executor import Executor
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024 * 16
+"""The number of decompressed bytes counted at once."""
+
+
+@dataclass
+class FastaStats:
+    """The nucleotide composition and sequence count of a FASTA file.
+
+    Characters other than ``A``, ``C``, ``G``, and ``T`` are counted as ``N``.
+    """
+
+    a: int = 0
+    c: int = 0
+    g: int = 0
+    t: int = 0
+    n: int = 0
+
+    count: int = 0
+    """The number of sequences."""
+
+    @property
+    def length(self) -> int:
+        """The total length of all sequences."""
+        return self.a + self.c + self.g + self.t + self.n
+
+    @property
+    def gc(self) -> dict[str, float]:
+        """The fraction of each nucleotide in the file.
+
+        This can be passed to :attr:`.WFNewSubtraction.finalize`.
+        """
+        length = self.length or 1
+
+        return {
+            "a": self.a / length,
+            "c": self.c / length,
+            "g": self.g / length,
+            "t": self.t / length,
+            "n": self.n / length,
+        }
+
+
+def _iter_chunks(path: Path, chunk_size: int) -> Iterator[bytes]:
+    """Read the FASTA file at ``path`` in chunks of whole lines."""
+    remainder = b""
+
+    with open_sequence_file(path) as f:
+        while chunk := f.read(chunk_size):
+            chunk = remainder + chunk
+            end = chunk.rfind(b"\n") + 1
+
+            remainder = chunk[end:]
+
+            if end:
+                yield chunk[:end]
+
+    if remainder:
+        yield remainder
+
+
+def _count_chunk(chunk: bytes) -> tuple["np.ndarray", int]:
+    """Count the bytes in the sequence lines of a chunk of a FASTA file.
+
+    The chunk must start at the beginning of a line.
+
+    :param chunk: the chunk to count
+    :return: the count of each byte value and the number of sequence headers
+    """
+    import numpy as np
+
+    array = np.frombuffer(chunk, dtype=np.uint8)
+    counts = np.bincount(array, minlength=256)
+
+    if not counts[ord(">")]:
+        return counts, 0
+
+    starts = np.flatnonzero(array == ord(">"))
+    starts = starts[(starts == 0) | (array[starts - 1] == ord("\n"))]
+
+    line_ends = np.flatnonzero(array == ord("\n"))
+    line_ends = np.append(line_ends, len(array))
+
+    ends = line_ends[np.searchsorted(line_ends, starts)]
+    lengths = ends - starts
+
+    # Get the index of every byte in a header line without a Python loop.
+    indices = np.repeat(starts - np.cumsum(lengths) + lengths, lengths) + np.arange(
+        lengths.sum(),
+    )
+
+    counts -= np.bincount(array[indices], minlength=256)
+
+    return counts, len(starts)
+
+
+def _make_stats(results: list[tuple["np.ndarray", int]]) -> FastaStats:
+    import numpy as np
+
+    counts = sum(
+        (counts for counts, _ in results),
+        start=np.zeros(256, dtype=np.int64),
+    )
+
+    a = int(counts[ord("A")] + counts[ord("a")])
+    c = int(counts[ord("C")] + counts[ord("c")])
+    g = int(counts[ord("G")] + counts[ord("g")])
+    t = int(counts[ord("T")] + counts[ord("t")])
+
+    total = int(counts.sum()) - sum(int(counts[ord(char)]) for char in "\n\r\t ")
+
+    return FastaStats(
+        a=a,
+        c=c,
+        g=g,
+        t=t,
+        n=total - a - c - g - t,
+        count=sum(count for _, count in results),
+    )
+
+
+async def compute_fasta_stats(
+    path: Path,
+    executor: "Executor | None" = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> FastaStats:
+    """Count the nucleotides and sequences in the FASTA file at ``path``.
+
+    Gzipped files are decompressed as they are read. Chunks are counted in the worker
+    processes of ``executor`` if it is provided and in a thread otherwise.
+
+    Example:
+
+    .. code-block:: python
+
+        @step
+        async def finalize(executor: Executor, new_subtraction: WFNewSubtraction):
+            stats = await compute_fasta_stats(new_subtraction.fasta_path, executor)
+            await new_subtraction.finalize(stats.gc, stats.count)
+
+    :param path: a FASTA file, optionally gzipped
+    :param executor: an executor to count chunks in
+    :param chunk_size: the number of decompressed bytes to count at once
+    :return: the nucleotide composition and sequence count
+    """
+    workers = executor.workers if executor else 1
+
+    pending: deque[asyncio.Future] = deque()
+    results = []
+
+    with closing(_iter_chunks(path, chunk_size)) as chunks:
+        try:
+            while chunk := await asyncio.to_thread(next, chunks, None):
+                if len(pending) >= workers * 2:
+                    results.append(await pending.popleft())
+
+                pending.append(
+                    asyncio.ensure_future(
+                        executor.run(_count_chunk, chunk)
+                        if executor
+                        else asyncio.to_thread(_count_chunk, chunk),
+                    ),
+                )
+
+            while pending:
+                results.append(await pending.popleft())
+        finally:
+            for future in pending:
+                future.cancel()
+
+    return _make_stats(results)
@@ -0,0 +1,22 @@
+import gzip
+from pathlib import Path
+from typing import BinaryIO
+
+GZIP_MAGIC = b"\x1f\x8b"
+
+
+def open_sequence_file(path: Path) -> BinaryIO:
+    """Open a sequence file for reading bytes, decompressing it if it is gzipped.
+
+    Files are recognized as gzipped by their content, not their extension.
+
+    :param path: the file to open
+    :return: a binary file object
+    """
+    with open(path, "rb") as f:
+        magic = f.read(2)
+
+    if magic == GZIP_MAGIC:
+        return gzip.open(path, "rb")
+
+    return open(path, "rb")
@@ -3,16 +3,43 @@ from pathlib import Path
 import arrow
 import pytest
 
+import virtool_workflow.runtime.executor
+import virtool_workflow.runtime.fast_path
 import virtool_workflow.runtime.run_subprocess
 from virtool_workflow.pytest_plugin.data import (
     Data,
     data,
 )
+from virtool_workflow.runtime.resources import detect_mem, detect_proc
+
+
+@pytest.fixture()
+def executor() -> virtool_workflow.runtime.executor.Executor:
+    pool = virtool_workflow.runtime.executor.Executor(detect_proc())
+    yield pool
+    pool.close()
+
+
+@pytest.fixture()
+def fast_path(tmp_path: Path) -> virtool_workflow.runtime.fast_path.FastPath:
+    path = tmp_path / "fast"
+    path.mkdir()
+
+    return virtool_workflow.runtime.fast_path.FastPath(
+        path,
+        tmp_path / "spill",
+        1024**3,
+    )
 
 
 @pytest.fixture()
 def run_subprocess() -> virtool_workflow.runtime.run_subprocess.RunSubprocess:
-    return virtool_workflow.runtime.run_subprocess.run_subprocess()
+    return virtool_workflow.runtime.run_subprocess.run_subprocess(detect_mem())
+
+
+@pytest.fixture()
+def run_pipeline() -> virtool_workflow.runtime.run_subprocess.RunPipeline:
+    return virtool_workflow.runtime.run_subprocess.run_pipeline(detect_mem())
 
 
 @pytest.fixture()
@@ -29,6 +56,9 @@ def virtool_workflow_example_path() -> Path:
 __all__ = [
     "data",
     "Data",
+    "executor",
+    "fast_path",
+    "run_pipeline",
     "run_subprocess",
     "static_datetime",
     "virtool_workflow_example_path",
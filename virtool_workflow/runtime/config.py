@@ -19,3 +19,89 @@ class RunConfig:
 
     work_path: Path
     """The path to a directory where the workflow can store temporary files."""
+
+    http_connection_limit: int = 100
+    """The maximum number of simultaneous connections to the jobs API."""
+
+    http_connection_limit_per_host: int = 0
+    """The maximum number of simultaneous connections to a single host.
+
+    A value of ``0`` means there is no per-host limit.
+    """
+
+    http_dns_cache_ttl: int = 300
+    """The number of seconds resolved hostnames are cached for."""
+
+    http_keepalive_timeout: float = 30.0
+    """The number of seconds idle connections are kept open for reuse."""
+
+    http_prewarm_connections: int = 2
+    """The number of connections to open to the jobs API while waiting for a job."""
+
+    http_read_bufsize: int = 1024 * 1024 * 2
+    """The size of the read buffer used for HTTP responses in bytes."""
+
+    metrics_port: int | None = None
+    """A port to serve Prometheus metrics on while the runtime is running."""
+
+    metrics_textfile_path: Path | None = None
+    """A path to write Prometheus metrics to when the runtime exits.
+
+    The file can be collected by the node exporter's textfile collector.
+    """
+
+    profile: bool = False
+    """Whether to profile each step and write the stats to ``profile_path``."""
+
+    profile_path: Path = Path("profiles")
+    """The directory to write step profiles to.
+
+    This should be outside ``work_path``, which is deleted when the run ends.
+    """
+
+    profile_upload: bool = False
+    """Whether to upload step profiles as analysis files."""
+
+    status_interval: float = 0.5
+    """The minimum number of seconds between job status updates.
+
+    Status updates pushed more frequently than this are coalesced.
+    """
+
+    timeline_path: Path | None = None
+    """A path to write a JSON timeline of step measurements to when the run ends."""
+
+    trace_otlp_endpoint: str | None = None
+    """An OTLP/HTTP traces endpoint to send spans to when the runtime exits."""
+
+    trace_path: Path | None = None
+    """A path to write a Chrome trace JSON file to when the runtime exits."""
+
+    work_path_cleanup: str = "thread"
+    """How work directories are deleted after they are moved to the trash.
+
+    ``thread`` deletes them in a background daemon thread, which does not delay the
+    runtime from exiting. ``process`` deletes them in a detached ``rm`` process that
+    can outlive the runtime. ``sync`` deletes them before the run continues.
+    """
+
+    work_path_min_free: float = 0.0
+    """The free disk space in GB below which work directories are deleted before the
+    run continues, regardless of ``work_path_cleanup``.
+    """
+
+    work_path_max_usage: float = 0.0
+    """The disk space in GB a job may use in the work directory.
+
+    Jobs whose input files will not fit are refused before downloading them, and a job
+    that grows past the limit while running is stopped. ``0`` means no limit.
+    """
+
+    fast_path: Path | None = Path("/dev/shm")
+    """A RAM-backed directory for the :func:`.fast_path` fixture.
+
+    ``None`` places all fast path files in the work directory.
+    """
+
+    fast_path_fraction: float = 0.25
+    """The fraction of ``mem`` that may be used in ``fast_path``."""
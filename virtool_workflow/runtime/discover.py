@@ -1,5 +1,4 @@
 import sys
-from importlib import import_module
 from importlib.util import module_from_spec, spec_from_file_location
 from pathlib import Path
 from types import ModuleType
@@ -8,6 +7,7 @@ from structlog import get_logger
 
 from virtool_workflow import Workflow
 from virtool_workflow.decorators import collect
+from virtool_workflow.runtime.fixtures import BUILTIN_FIXTURES, register_builtin_fixture
 
 logger = get_logger("runtime")
 
@@ -31,17 +31,13 @@ def discover_workflow(path: Path) -> Workflow:
 
 
 def load_builtin_fixtures():
-    """Load built-in fixtures.
-
-    This function is called before any fixtures defined in a workflow's
-    ``fixtures.py`` file. It is used to provide built-in fixtures that are
-    required for the workflow to run.
+    """Load all built-in fixtures into the current fixture context.
 
+    The runtime does not need to call this. Built-in fixtures are loaded by
+    :class:`.LazyFixtureScope` when they are first requested.
     """
-    import_module("virtool_workflow.data")
-    import_module("virtool_workflow.analysis.fastqc")
-    import_module("virtool_workflow.analysis.skewer")
-    import_module("virtool_workflow.runtime.run_subprocess")
+    for key in BUILTIN_FIXTURES:
+        register_builtin_fixture(key)
 
 
 def load_custom_fixtures():
@@ -0,0 +1,186 @@
+"""Check and monitor the disk space used by workflows.
+
+Data fixtures estimate the space their downloads need from the file sizes reported by
+the jobs API and fail before downloading anything if it is not available. While a
+workflow runs, the size of the work directory is sampled periodically and the run is
+aborted if it exceeds ``work_path_max_usage``.
+"""
+
+import asyncio
+import os
+import shutil
+from collections.abc import AsyncIterator, Callable, Container, Iterable
+from contextlib import asynccontextmanager, suppress
+from pathlib import Path
+
+from structlog import get_logger
+
+from virtool_workflow.errors import InsufficientDiskSpaceError
+from virtool_workflow.runtime.config import RunConfig
+from virtool_workflow.runtime.metrics import registry
+
+logger = get_logger("runtime")
+
+DISK_USAGE_INTERVAL = 5.0
+"""The number of seconds between samples of the work directory size."""
+
+DISK_USAGE_WARNING_FRACTION = 0.9
+"""The fraction of ``work_path_max_usage`` at which a warning is logged."""
+
+GB = 1024**3
+
+GZIP_EXPANSION_FACTOR = 4
+"""The assumed ratio of decompressed to compressed size for gzipped files."""
+
+work_path_usage_bytes = registry.gauge(
+    "work_path_usage_bytes",
+    "The disk space used by the work directory of the running job.",
+)
+
+
+def get_usage(path: Path) -> int:
+    """Get the disk space used by the files under ``path`` in bytes."""
+    usage = 0
+    stack = [path]
+
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except FileNotFoundError:
+            continue
+
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(Path(entry.path))
+                    else:
+                        usage += entry.stat(follow_symlinks=False).st_blocks * 512
+                except FileNotFoundError:
+                    continue
+
+    return usage
+
+
+def estimate_size(files: Iterable, compressed: Container[str] = ()) -> int:
+    """Estimate the disk space needed to download ``files``.
+
+    ``files`` are file models from the jobs API with ``name`` and ``size`` attributes.
+    Files named in ``compressed`` are decompressed next to the download, so space for
+    :data:`GZIP_EXPANSION_FACTOR` times their size is added.
+
+    :param files: the files to download
+    :param compressed: the names of files that will be decompressed
+    :return: the estimated size in bytes
+    """
+    size = 0
+
+    for file in files:
+        file_size = file.size or 0
+        size += file_size
+
+        if file.name in compressed:
+            size += file_size * GZIP_EXPANSION_FACTOR
+
+    return size
+
+
+def get_available_space(config: RunConfig) -> int:
+    """Get the number of bytes that can still be written to the work directory.
+
+    This is the free space on the filesystem, further limited by the remainder of
+    ``work_path_max_usage`` if it is set.
+    """
+    work_path = Path(config.work_path).absolute()
+
+    available = shutil.disk_usage(work_path).free
+
+    if config.work_path_max_usage:
+        available = min(
+            available,
+            int(config.work_path_max_usage * GB) - get_usage(work_path),
+        )
+
+    return max(available, 0)
+
+
+async def ensure_disk_space(config: RunConfig, required: int, resource: str):
+    """Make sure there is room for ``required`` bytes in the work directory.
+
+    :param config: the run configuration
+    :param required: the estimated number of bytes needed
+    :param resource: a description of what needs the space for the log and error
+    :raise InsufficientDiskSpaceError: there is not enough space
+    """
+    available = await asyncio.to_thread(get_available_space, config)
+
+    logger.info(
+        "checked disk space",
+        available=available,
+        required=required,
+        resource=resource,
+    )
+
+    if required > available:
+        raise InsufficientDiskSpaceError(resource, required, available)
+
+
+async def _monitor_disk_usage(
+    path: Path,
+    limit: int,
+    abort: Callable[[Exception], None],
+):
+    warned = False
+
+    while True:
+        usage = await asyncio.to_thread(get_usage, path)
+        work_path_usage_bytes.set(usage)
+
+        if usage > limit:
+            logger.error("work directory exceeded size limit", limit=limit, usage=usage)
+            abort(InsufficientDiskSpaceError("work directory", usage, limit))
+            return
+
+        if not warned and usage > limit * DISK_USAGE_WARNING_FRACTION:
+            logger.warning(
+                "work directory is close to size limit",
+                limit=limit,
+                usage=usage,
+            )
+            warned = True
+
+        await asyncio.sleep(DISK_USAGE_INTERVAL)
+
+
+@asynccontextmanager
+async def monitor_disk_usage(
+    path: Path,
+    config: RunConfig,
+    abort: Callable[[Exception], None],
+) -> AsyncIterator[None]:
+    """Watch the size of the work directory at ``path`` while the context is open.
+
+    A warning is logged when the directory grows past
+    :data:`DISK_USAGE_WARNING_FRACTION` of ``config.work_path_max_usage``. If it grows
+    past the limit, ``abort`` is called with an :class:`.InsufficientDiskSpaceError`.
+    Nothing is monitored if no limit is set.
+
+    :param path: the work directory
+    :param config: the run configuration
+    :param abort: a function that stops the workflow
+    """
+    if not config.work_path_max_usage:
+        yield
+        return
+
+    task = asyncio.create_task(
+        _monitor_disk_usage(path, int(config.work_path_max_usage * GB), abort),
+    )
+
+    try:
+        yield
+    finally:
+        task.cancel()
+
+        with suppress(asyncio.CancelledError):
+            await task
@@ -5,3 +5,6 @@ class Events:
     def __init__(self):
         self.cancelled = asyncio.Event()
         self.terminated = asyncio.Event()
+
+        self.error: Exception | None = None
+        """An error that caused the runtime to stop the workflow, if any."""
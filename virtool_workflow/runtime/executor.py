@@ -0,0 +1,271 @@
+"""A process pool for running CPU-bound Python code outside the event loop.
+
+Functions passed to the pool are pickled and run in worker processes, so they must be
+defined at the top level of a module. Workers are started with the ``forkserver``
+method because forking a process that is running threads can deadlock.
+"""
+
+import asyncio
+import math
+import multiprocessing
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator, Sized
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import partial, reduce
+from itertools import islice
+from multiprocessing.shared_memory import SharedMemory
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from pyfixtures import fixture
+
+if TYPE_CHECKING:
+    import numpy as np
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+DEFAULT_CHUNK_SIZE = 1024
+"""The number of items sent to a worker at once when the input size is unknown."""
+
+CHUNKS_PER_WORKER = 4
+"""The number of chunks each worker should get when the input size is known."""
+
+
+@dataclass(frozen=True)
+class SharedArray:
+    """A handle to a NumPy array in shared memory.
+
+    Handles are small and cheap to pass to worker processes. Use :meth:`open` in the
+    worker to access the array without copying it.
+    """
+
+    name: str
+    """The name of the shared memory block."""
+
+    shape: tuple[int, ...]
+    """The shape of the array."""
+
+    dtype: str
+    """The NumPy data type of the array."""
+
+    @contextmanager
+    def open(self) -> Iterator["np.ndarray"]:
+        """Open the shared array.
+
+        Changes to the array are visible to all processes. The array must not be used
+        after the ``with`` block exits.
+        """
+        import numpy as np
+
+        shared_memory = SharedMemory(name=self.name)
+        array = np.ndarray(self.shape, dtype=self.dtype, buffer=shared_memory.buf)
+
+        try:
+            yield array
+        finally:
+            del array
+            shared_memory.close()
+
+
+def _chunk(items: Iterable[T], size: int) -> Iterator[list[T]]:
+    iterator = iter(items)
+
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def _map_chunk(func: Callable[[T], R], chunk: list[T]) -> list[R]:
+    return [func(item) for item in chunk]
+
+
+def _map_reduce_chunk(
+    mapper: Callable[[T], R],
+    reducer: Callable[[R, R], R],
+    chunk: list[T],
+) -> R:
+    return reduce(reducer, map(mapper, chunk))
+
+
+class Executor:
+    """Runs functions in a pool of worker processes.
+
+    Create executors with the :func:`executor` fixture in workflows.
+    """
+
+    def __init__(self, workers: int):
+        self.workers = workers
+        """The number of worker processes."""
+
+        self._pool = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("forkserver"),
+        )
+        self._shared: list[SharedMemory] = []
+
+    async def run(self, func: Callable[..., R], *args: Any) -> R:
+        """Call ``func`` with ``args`` in a worker process and return the result.
+
+        :param func: a module-level function
+        :param args: picklable arguments for ``func``
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            self._pool,
+            partial(func, *args),
+        )
+
+    def _get_chunk_size(self, items: Iterable, chunk_size: int | None) -> int:
+        if chunk_size is not None:
+            return chunk_size
+
+        if isinstance(items, Sized):
+            return max(math.ceil(len(items) / (self.workers * CHUNKS_PER_WORKER)), 1)
+
+        return DEFAULT_CHUNK_SIZE
+
+    async def _run_chunks(
+        self,
+        func: Callable[[list[T]], R],
+        items: Iterable[T],
+        chunk_size: int | None,
+    ) -> AsyncIterator[R]:
+        """Run ``func`` on chunks of ``items`` and yield the results in order.
+
+        At most two chunks per worker are pending at once, so ``items`` can be a lazy
+        iterable that is larger than memory.
+        """
+        chunk_size = self._get_chunk_size(items, chunk_size)
+        loop = asyncio.get_running_loop()
+        pending = deque()
+
+        for chunk in _chunk(items, chunk_size):
+            if len(pending) >= self.workers * 2:
+                yield await pending.popleft()
+
+            pending.append(loop.run_in_executor(self._pool, func, chunk))
+
+        while pending:
+            yield await pending.popleft()
+
+    async def map(
+        self,
+        func: Callable[[T], R],
+        items: Iterable[T],
+        chunk_size: int | None = None,
+    ) -> list[R]:
+        """Call ``func`` on each of ``items`` in the worker processes.
+
+        Items are sent to the workers in chunks to limit the overhead of pickling.
+
+        :param func: a module-level function that takes one item
+        :param items: the items to process
+        :param chunk_size: the number of items to send to a worker at once
+        :return: the results in the order of ``items``
+        """
+        results = []
+
+        async for chunk_results in self._run_chunks(
+            partial(_map_chunk, func),
+            items,
+            chunk_size,
+        ):
+            results.extend(chunk_results)
+
+        return results
+
+    async def map_reduce(
+        self,
+        mapper: Callable[[T], R],
+        reducer: Callable[[R, R], R],
+        items: Iterable[T],
+        initial: R,
+        chunk_size: int | None = None,
+    ) -> R:
+        """Map ``items`` with ``mapper`` and combine the results with ``reducer``.
+
+        Each chunk is reduced in a worker and only the chunk results are returned to
+        the workflow process, so ``reducer`` must be associative.
+
+        Example:
+
+        .. code-block:: python
+
+            total_length = await executor.map_reduce(
+                len,
+                operator.add,
+                sequences,
+                0,
+            )
+
+        :param mapper: a module-level function that takes one item
+        :param reducer: a module-level function that combines two results
+        :param items: the items to process
+        :param initial: the value to start reducing from
+        :param chunk_size: the number of items to send to a worker at once
+        :return: the combined result
+        """
+        result = initial
+
+        async for chunk_result in self._run_chunks(
+            partial(_map_reduce_chunk, mapper, reducer),
+            items,
+            chunk_size,
+        ):
+            result = reducer(result, chunk_result)
+
+        return result
+
+    def share(self, array: "np.ndarray") -> SharedArray:
+        """Copy ``array`` into shared memory so workers can use it without pickling.
+
+        The shared memory is released when the executor is closed.
+
+        :param array: the array to share
+        :return: a handle to pass to worker functions
+        """
+        shared_memory = SharedMemory(create=True, size=max(array.nbytes, 1))
+        self._shared.append(shared_memory)
+
+        shared = SharedArray(shared_memory.name, array.shape, array.dtype.str)
+
+        with shared.open() as shared_array:
+            shared_array[...] = array
+
+        return shared
+
+    def close(self):
+        """Stop the worker processes and release shared memory."""
+        self._pool.shutdown(wait=True, cancel_futures=True)
+
+        for shared_memory in self._shared:
+            shared_memory.close()
+            shared_memory.unlink()
+
+        self._shared.clear()
+
+
+@fixture
+def executor(proc: int) -> Iterator[Executor]:
+    """A pool of ``proc`` worker processes for running CPU-bound Python code.
+
+    Example:
+
+    .. code-block:: python
+
+        @step
+        async def count_kmers(executor: Executor, reads: Reads):
+            counts = await executor.map_reduce(
+                count_read_kmers,
+                merge_counts,
+                iter_reads(reads.left),
+                Counter(),
+            )
+
+    """
+    pool = Executor(proc)
+
+    try:
+        yield pool
+    finally:
+        pool.close()
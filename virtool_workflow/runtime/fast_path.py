@@ -0,0 +1,180 @@
+"""A fast, memory-backed tier of the work directory.
+
+Intermediate files that are written and read again within a job, such as trimmed reads
+or isolate FASTA files, can be placed on a RAM-backed filesystem like ``/dev/shm``
+instead of a slow network disk. Files on such a filesystem count towards the memory
+used by the job, so the space used is limited to a fraction of :func:`.mem`. Files
+that do not fit are placed in the regular work directory instead.
+"""
+
+import shutil
+from collections.abc import Iterator
+from pathlib import Path
+from shutil import rmtree
+from stat import S_ISREG
+from uuid import uuid4
+
+from pyfixtures import fixture
+from structlog import get_logger
+
+from virtool_workflow.runtime.config import RunConfig
+
+logger = get_logger("runtime")
+
+GB = 1024**3
+
+
+def _get_file_size(path: Path) -> int:
+    """Get the disk space used by the file at ``path`` or 0 if it is not a file."""
+    try:
+        stat_result = path.stat()
+    except FileNotFoundError:
+        return 0
+
+    return stat_result.st_blocks * 512 if S_ISREG(stat_result.st_mode) else 0
+
+
+class FastPath:
+    """Hands out paths for intermediate files on a fast filesystem within a budget.
+
+    :param path: the fast directory or ``None`` if there is no fast filesystem
+    :param spill_path: the directory used for files that do not fit in the budget
+    :param budget: the number of bytes that may be used in ``path``
+    """
+
+    def __init__(self, path: Path | None, spill_path: Path, budget: int):
+        self.path = path
+        """The fast directory or ``None`` if there is no fast filesystem."""
+
+        self.spill_path = spill_path
+        """The directory used for files that do not fit in the budget."""
+
+        self.budget = budget if path else 0
+        """The number of bytes that may be used in :attr:`path`."""
+
+        self._reservations: dict[str, tuple[Path, int]] = {}
+
+    @property
+    def available(self) -> int:
+        """The number of bytes that can still be placed in the fast directory.
+
+        Each file in the fast directory counts towards the budget with the larger of
+        the size reserved with :meth:`get` and its actual size, in case it grows larger
+        than expected. Directories count with their reserved size, so they are not
+        walked each time a path is requested.
+        """
+        if self.path is None:
+            return 0
+
+        used = sum(
+            max(size, _get_file_size(path))
+            for path, size in self._reservations.values()
+            if path.is_relative_to(self.path)
+        )
+
+        return max(self.budget - used, 0)
+
+    def get(self, name: str, size: int | None = None) -> Path:
+        """Get a path called ``name`` for an intermediate file or directory.
+
+        The path is in the fast directory if ``size`` bytes fit in the remaining budget
+        and in :attr:`spill_path` otherwise. If ``size`` is not given, the size is
+        unknown and the path is always in :attr:`spill_path`, because RAM-backed
+        filesystems are often small. Asking for the same ``name`` again returns the
+        same path. The parent directory of the path is created, but not the path itself.
+
+        :param name: a relative path for the file or directory
+        :param size: the expected size of the file or directory in bytes
+        :return: the path to write to
+        """
+        if name in self._reservations:
+            return self._reservations[name][0]
+
+        available = self.available
+
+        if self.path is not None and size is not None and size <= available:
+            path = self.path / name
+        else:
+            path = self.spill_path / name
+
+            if self.path is not None:
+                logger.info(
+                    "fast path budget exceeded",
+                    available=available,
+                    name=name,
+                    size=size,
+                )
+
+        path.parent.mkdir(exist_ok=True, parents=True)
+
+        self._reservations[name] = (path, size or 0)
+
+        return path
+
+    def remove(self, name: str):
+        """Delete the file or directory called ``name`` and release its reservation.
+
+        :param name: a name previously passed to :meth:`get`
+        """
+        path, _ = self._reservations.pop(name)
+
+        if path.is_dir():
+            rmtree(path, ignore_errors=True)
+        else:
+            path.unlink(missing_ok=True)
+
+
+def create_fast_directory(config: RunConfig, mem: int) -> tuple[Path | None, int]:
+    """Create a directory for the fast path and get its budget in bytes.
+
+    The budget is ``config.fast_path_fraction`` of ``mem`` GB, further limited by the
+    free space on the fast filesystem. No directory is created if the fast filesystem
+    does not exist or the budget is zero.
+
+    :param config: the run configuration
+    :param mem: the memory available to the job in GB
+    :return: the fast directory or ``None`` and the budget
+    """
+    budget = int(mem * GB * config.fast_path_fraction)
+
+    if config.fast_path is None or budget <= 0:
+        return None, 0
+
+    try:
+        budget = min(budget, shutil.disk_usage(config.fast_path).free)
+        path = config.fast_path / f"virtool-workflow-{uuid4().hex}"
+        path.mkdir()
+    except OSError:
+        logger.warning("fast path is not available", path=str(config.fast_path))
+        return None, 0
+
+    return path, budget
+
+
+@fixture
+def fast_path(_config: RunConfig, mem: int, work_path: Path) -> Iterator[FastPath]:
+    """Paths for intermediate files on a fast, memory-backed filesystem.
+
+    The fast directory is on ``--fast-path``, which is ``/dev/shm`` by default. It may
+    use ``--fast-path-fraction`` of :func:`.mem`. Files that do not fit are placed in
+    the work directory instead. The fast directory is deleted when the job ends.
+
+    Example:
+
+    .. code-block:: python
+
+        @step
+        async def trim(fast_path: FastPath, sample: WFSample):
+            size = sum(path.stat().st_size for path in sample.read_paths)
+            trimmed_path = fast_path.get("trimmed", size=size * 2)
+
+    """
+    path, budget = create_fast_directory(_config, mem)
+
+    logger.info("created fast path", budget=budget, path=str(path))
+
+    try:
+        yield FastPath(path, work_path / "fast", budget)
+    finally:
+        if path is not None:
+            rmtree(path, ignore_errors=True)
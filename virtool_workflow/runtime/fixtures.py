@@ -0,0 +1,112 @@
+"""Lazy loading of built-in fixtures.
+
+Built-in fixtures are spread over modules with heavy dependencies. Instead of importing
+all of them when the runtime starts, the module that defines a built-in fixture is only
+imported when the fixture is first requested.
+"""
+
+from importlib import import_module
+from typing import Any
+
+from pyfixtures import Fixture, FixtureScope, fixture_context, get_fixtures
+
+BUILTIN_FIXTURES: dict[str, str] = {
+    "analysis": "virtool_workflow.data.analyses",
+    "executor": "virtool_workflow.runtime.executor",
+    "fast_path": "virtool_workflow.runtime.fast_path",
+    "fastqc": "virtool_workflow.analysis.fastqc",
+    "hmms": "virtool_workflow.data.hmms",
+    "index": "virtool_workflow.data.indexes",
+    "job": "virtool_workflow.data.jobs",
+    "ml": "virtool_workflow.data.ml",
+    "new_index": "virtool_workflow.data.indexes",
+    "new_sample": "virtool_workflow.data.samples",
+    "new_subtraction": "virtool_workflow.data.subtractions",
+    "progress": "virtool_workflow.data.jobs",
+    "push_status": "virtool_workflow.data.jobs",
+    "run_pipeline": "virtool_workflow.runtime.run_subprocess",
+    "run_subprocess": "virtool_workflow.runtime.run_subprocess",
+    "sample": "virtool_workflow.data.samples",
+    "skewer": "virtool_workflow.analysis.skewer",
+    "subtractions": "virtool_workflow.data.subtractions",
+    "uploads": "virtool_workflow.data.uploads",
+}
+"""The name of each built-in fixture and the module that defines it."""
+
+SCOPE_KEYS = frozenset(
+    {
+        "_api",
+        "_config",
+        "_error",
+        "_instrumentation",
+        "_job",
+        "_state",
+        "_status",
+        "_step",
+        "_workflow",
+        "logger",
+        "mem",
+        "proc",
+        "results",
+        "scope",
+        "work_path",
+    },
+)
+"""Values in the fixture scope before any steps run.
+
+``scope`` is added by :class:`FixtureScope` itself. The others are added by the runtime
+with :func:`set_scope_values`.
+"""
+
+
+def register_builtin_fixture(key: str) -> Fixture | None:
+    """Import the built-in fixture named ``key`` and add it to the fixture context.
+
+    Only ``key`` is added to the context. Fixtures that are already in the context,
+    such as custom fixtures with the same name as ``key`` or as any other fixture in
+    its module, are not replaced.
+
+    :param key: the name of the fixture
+    :return: the registered fixture or ``None`` if ``key`` is not a built-in fixture
+    """
+    try:
+        module_name = BUILTIN_FIXTURES[key]
+    except KeyError:
+        return None
+
+    fixtures = get_fixtures()
+
+    if key in fixtures:
+        return fixtures[key]
+
+    # Importing a module registers all of its fixtures in the current context, so it is
+    # imported in a throwaway context.
+    with fixture_context(copy_context=False):
+        builtin = getattr(import_module(module_name), key)
+
+    fixtures[key] = builtin
+
+    return builtin
+
+
+def set_scope_values(scope: FixtureScope, /, **values: Any):
+    """Add the values the runtime provides to ``scope``.
+
+    :param scope: the scope to add the values to
+    :param values: a value for every key in :data:`SCOPE_KEYS` except ``scope``
+    :raise ValueError: ``values`` does not match :data:`SCOPE_KEYS`
+    """
+    if mismatched := values.keys() ^ (SCOPE_KEYS - {"scope"}):
+        raise ValueError(f"Scope values do not match SCOPE_KEYS: {sorted(mismatched)}")
+
+    scope.update(values)
+
+
+class LazyFixtureScope(FixtureScope):
+    """A :class:`FixtureScope` that loads built-in fixtures when they are requested."""
+
+    async def instantiate_by_key(self, key: str, *args, **kwargs):
+        if key not in self and key not in get_fixtures():
+            register_builtin_fixture(key)
+
+        return await super().instantiate_by_key(key, *args, **kwargs)
@@ -0,0 +1,228 @@
+"""Measure the time and resources used by each workflow step."""
+
+import json
+import resource
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from structlog import get_logger
+
+from virtool_workflow.api.client import bytes_downloaded, bytes_uploaded
+from virtool_workflow.runtime.metrics import registry
+
+logger = get_logger("runtime")
+
+step_duration_seconds = registry.histogram(
+    "workflow_step_duration_seconds",
+    "The time taken to run each workflow step.",
+    buckets=(1, 5, 15, 30, 60, 300, 900, 1800, 3600, 7200, 14400, 28800),
+)
+
+
+def get_peak_rss() -> int:
+    """Get the peak resident set size of the workflow process in bytes.
+
+    The value is read from ``/proc/self/status``. If that is not available, the
+    value reported by :func:`resource.getrusage` is used.
+    """
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def _get_children_cpu_time() -> float:
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return usage.ru_utime + usage.ru_stime
+
+
+def _get_children_peak_rss() -> int:
+    return resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss * 1024
+
+
+@dataclass
+class SubprocessUsage:
+    """The time and resources used by a subprocess.
+
+    CPU time and memory are sampled from ``/proc`` while the subprocess runs, so usage
+    in the moments before it exits may be missed. They include the processes the
+    subprocess starts, such as the programs run by a wrapper script.
+    """
+
+    command: str
+    """The name of the program that was run."""
+
+    pid: int
+    """The process ID of the subprocess."""
+
+    code: int | None = None
+    """The exit code of the subprocess."""
+
+    wall_time: float = 0.0
+    """The elapsed time in seconds."""
+
+    cpu_time: float = 0.0
+    """The user and system CPU time of the process tree in seconds."""
+
+    peak_rss: int = 0
+    """The peak combined resident set size of the process tree in bytes."""
+
+
+@dataclass
+class StepMeasurement:
+    """The time and resources used by a workflow step."""
+
+    name: str
+    """The display name of the step."""
+
+    started_at: float
+    """The Unix time the step started at."""
+
+    wall_time: float = 0.0
+    """The elapsed time in seconds."""
+
+    fixture_time: float = 0.0
+    """The time in seconds spent resolving fixtures for the step."""
+
+    cpu_time: float = 0.0
+    """The CPU time in seconds used by the workflow process."""
+
+    children_cpu_time: float = 0.0
+    """The CPU time in seconds used by subprocesses that exited during the step."""
+
+    peak_rss: int = 0
+    """The peak resident set size of the workflow process in bytes."""
+
+    children_peak_rss: int = 0
+    """The largest peak resident set size of any exited subprocess in bytes.
+
+    This is the largest value seen over the lifetime of the workflow process, not just
+    during this step.
+    """
+
+    bytes_downloaded: int = 0
+    """The number of file bytes downloaded from the jobs API."""
+
+    bytes_uploaded: int = 0
+    """The number of file bytes uploaded to the jobs API."""
+
+    state: str = "running"
+    """Whether the step completed or failed."""
+
+    subprocesses: list[SubprocessUsage] = field(default_factory=list)
+    """The usage of each subprocess run during the step."""
+
+    @contextmanager
+    def fixtures(self) -> Iterator[None]:
+        """Measure the time taken to resolve the fixtures for the step."""
+        started_at = time.perf_counter()
+
+        try:
+            yield
+        finally:
+            self.fixture_time += time.perf_counter() - started_at
+
+
+_current_step: ContextVar[StepMeasurement | None] = ContextVar(
+    "current_step",
+    default=None,
+)
+
+
+def get_current_step() -> StepMeasurement | None:
+    """Get the measurement for the step that is running, if any."""
+    return _current_step.get()
+
+
+class Instrumentation:
+    """Records measurements for each step and named phase of a workflow run."""
+
+    def __init__(self):
+        self.phases: dict[str, float] = {}
+        """The elapsed time in seconds for each named phase of the run."""
+
+        self.steps: list[StepMeasurement] = []
+        """The measurements for each step that has started."""
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Measure the elapsed time of a named phase of the run.
+
+        :param name: the name of the phase
+        """
+        started_at = time.perf_counter()
+
+        try:
+            yield
+        finally:
+            self.phases[name] = time.perf_counter() - started_at
+
+    @contextmanager
+    def step(self, name: str) -> Iterator[StepMeasurement]:
+        """Measure the time and resources used by a step.
+
+        :param name: the display name of the step
+        """
+        measurement = StepMeasurement(name=name, started_at=time.time())
+        self.steps.append(measurement)
+
+        token = _current_step.set(measurement)
+
+        started_at = time.perf_counter()
+        cpu_started_at = time.process_time()
+        children_cpu_started_at = _get_children_cpu_time()
+        downloaded = bytes_downloaded.total()
+        uploaded = bytes_uploaded.total()
+
+        try:
+            yield measurement
+        except BaseException:
+            measurement.state = "failed"
+            raise
+        else:
+            measurement.state = "complete"
+        finally:
+            _current_step.reset(token)
+
+            measurement.wall_time = time.perf_counter() - started_at
+            measurement.cpu_time = time.process_time() - cpu_started_at
+            measurement.children_cpu_time = (
+                _get_children_cpu_time() - children_cpu_started_at
+            )
+            measurement.peak_rss = get_peak_rss()
+            measurement.children_peak_rss = _get_children_peak_rss()
+            measurement.bytes_downloaded = int(bytes_downloaded.total() - downloaded)
+            measurement.bytes_uploaded = int(bytes_uploaded.total() - uploaded)
+
+            step_duration_seconds.observe(
+                measurement.wall_time,
+                state=measurement.state,
+                step=measurement.name,
+            )
+
+            logger.info("measured workflow step", **asdict(measurement))
+
+    def to_dict(self) -> dict:
+        """Get all measurements as a JSON-serializable dictionary."""
+        return {
+            "phases": self.phases,
+            "steps": [asdict(step) for step in self.steps],
+        }
+
+    def write_timeline(self, path: Path, **metadata: object) -> None:
+        """Write all measurements to a JSON file at ``path``.
+
+        :param path: the path to write the timeline to
+        :param metadata: additional top-level fields such as the job ID
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({**metadata, **self.to_dict()}, indent=2))
@@ -0,0 +1,213 @@
+"""Lightweight in-process metrics for the workflow runtime.
+
+Metrics are recorded in the module-level :data:`registry`. A workflow process only
+runs a single job before exiting, so metrics do not need to be scoped to a run.
+"""
+
+from collections.abc import Iterator
+from dataclasses import dataclass
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+"""The default upper bounds for histogram buckets in seconds."""
+
+LabelKey = tuple[tuple[str, str], ...]
+"""A hashable, sorted representation of a set of metric labels."""
+
+
+def _label_key(labels: dict[str, object]) -> LabelKey:
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+class Counter:
+    """A value that only ever increases, optionally split by labels."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, description: str):
+        self.name = name
+        """The name of the metric."""
+
+        self.description = description
+        """A short description of what the metric measures."""
+
+        self._values: dict[LabelKey, float] = {}
+
+    def inc(self, amount: float = 1, **labels: object) -> None:
+        """Increment the counter.
+
+        :param amount: the amount to increment by
+        :param labels: labels identifying the series to increment
+        """
+        key = _label_key(labels)
+        self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels: object) -> float:
+        """Get the current value of the series identified by ``labels``."""
+        return self._values.get(_label_key(labels), 0)
+
+    def total(self) -> float:
+        """Get the sum of the values of all series."""
+        return sum(self._values.values())
+
+    def samples(self) -> Iterator[tuple[LabelKey, float]]:
+        """Yield the labels and value of every series in the counter."""
+        yield from self._values.items()
+
+    def clear(self) -> None:
+        """Clear all recorded values."""
+        self._values.clear()
+
+
+class Gauge(Counter):
+    """A value that can go up and down, optionally split by labels."""
+
+    kind = "gauge"
+
+    def set(self, value: float, **labels: object) -> None:
+        """Set the gauge to ``value``.
+
+        :param value: the new value
+        :param labels: labels identifying the series to set
+        """
+        self._values[_label_key(labels)] = value
+
+    def dec(self, amount: float = 1, **labels: object) -> None:
+        """Decrement the gauge.
+
+        :param amount: the amount to decrement by
+        :param labels: labels identifying the series to decrement
+        """
+        self.inc(-amount, **labels)
+
+
+@dataclass
+class HistogramValue:
+    """The observations recorded for a single histogram series."""
+
+    bucket_counts: list[int]
+    """The number of observations less than or equal to each bucket bound."""
+
+    count: int = 0
+    """The total number of observations."""
+
+    sum: float = 0.0
+    """The sum of all observations."""
+
+    max: float = 0.0
+    """The largest observation."""
+
+
+class Histogram:
+    """A distribution of observed values, optionally split by labels."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        self.name = name
+        """The name of the metric."""
+
+        self.description = description
+        """A short description of what the metric measures."""
+
+        self.buckets = tuple(sorted(buckets))
+        """The upper bounds of the histogram buckets."""
+
+        self._values: dict[LabelKey, HistogramValue] = {}
+
+    def observe(self, value: float, **labels: object) -> None:
+        """Record an observation.
+
+        :param value: the observed value
+        :param labels: labels identifying the series to record in
+        """
+        key = _label_key(labels)
+
+        try:
+            series = self._values[key]
+        except KeyError:
+            series = self._values[key] = HistogramValue([0] * len(self.buckets))
+
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                series.bucket_counts[i] += 1
+
+        series.count += 1
+        series.sum += value
+        series.max = max(series.max, value)
+
+    def value(self, **labels: object) -> HistogramValue:
+        """Get the observations for the series identified by ``labels``."""
+        return self._values.get(
+            _label_key(labels),
+            HistogramValue([0] * len(self.buckets)),
+        )
+
+    def samples(self) -> Iterator[tuple[LabelKey, HistogramValue]]:
+        """Yield the labels and observations of every series in the histogram."""
+        yield from self._values.items()
+
+    def clear(self) -> None:
+        """Clear all recorded values."""
+        self._values.clear()
+
+
+Metric = Counter | Histogram
+"""Any metric that can be stored in a :class:`MetricsRegistry`."""
+
+
+class MetricsRegistry:
+    """A collection of named metrics."""
+
+    def __init__(self):
+        self._metrics: dict[str, Metric] = {}
+
+    def _get_or_create(self, cls: type, name: str, description: str, **kwargs):
+        try:
+            metric = self._metrics[name]
+        except KeyError:
+            metric = self._metrics[name] = cls(name, description, **kwargs)
+            return metric
+
+        if type(metric) is not cls:
+            raise ValueError(f"Metric {name} is already registered as a {metric.kind}")
+
+        return metric
+
+    def counter(self, name: str, description: str) -> Counter:
+        """Get or create the counter called ``name``."""
+        return self._get_or_create(Counter, name, description)
+
+    def gauge(self, name: str, description: str) -> Gauge:
+        """Get or create the gauge called ``name``."""
+        return self._get_or_create(Gauge, name, description)
+
+    def histogram(
+        self,
+        name: str,
+        description: str,
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """Get or create the histogram called ``name``."""
+        return self._get_or_create(Histogram, name, description, buckets=buckets)
+
+    def collect(self) -> list[Metric]:
+        """Get all registered metrics sorted by name."""
+        return sorted(self._metrics.values(), key=lambda metric: metric.name)
+
+    def reset(self) -> None:
+        """Clear the recorded values of all registered metrics.
+
+        The metrics themselves stay registered so module-level references to them
+        remain valid. This is used to isolate metrics between tests.
+        """
+        for metric in self._metrics.values():
+            metric.clear()
+
+
+registry = MetricsRegistry()
+"""The metrics registry for the running workflow process."""
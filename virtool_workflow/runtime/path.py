@@ -1,19 +1,154 @@
 import asyncio
+import shutil
+import subprocess
+import threading
 from contextlib import asynccontextmanager
 from pathlib import Path
 from shutil import rmtree
+from uuid import uuid4
+
+from structlog import get_logger
 
 from virtool_workflow.runtime.config import RunConfig
+from virtool_workflow.runtime.instrumentation import Instrumentation
+
+logger = get_logger("runtime")
+
+GB = 1024**3
+
+
+def get_trash_path(path: Path) -> Path:
+    """Get the trash directory for the work directory at ``path``.
+
+    The trash is a sibling of the work directory, so moving into it is a rename on the
+    same filesystem.
+    """
+    return path.with_name(f"{path.name}.trash")
+
+
+def move_to_trash(path: Path) -> Path | None:
+    """Move the directory at ``path`` into its trash directory.
+
+    If the directory cannot be moved, for example because it is a mount point or its
+    parent is read-only, its contents are deleted in place instead.
+
+    :param path: the directory to move
+    :return: the new path of the directory or ``None`` if it was not moved
+    """
+    target = get_trash_path(path) / uuid4().hex
+
+    try:
+        target.parent.mkdir(exist_ok=True, parents=True)
+        path.rename(target)
+    except FileNotFoundError:
+        return None
+    except OSError as e:
+        logger.info(
+            "could not move work directory to trash. deleting in place.",
+            exception=str(e),
+            path=str(path),
+        )
+
+        rmtree(path, ignore_errors=True)
+
+        return None
+
+    return target
+
+
+def is_under_disk_pressure(path: Path, min_free: float) -> bool:
+    """Check whether less than ``min_free`` GB are free on the filesystem of ``path``."""
+    if min_free <= 0:
+        return False
+
+    try:
+        return shutil.disk_usage(path).free < min_free * GB
+    except OSError:
+        return False
+
+
+def _delete(paths: list[Path]):
+    for path in paths:
+        rmtree(path, ignore_errors=True)
+
+
+def _delete_in_process(paths: list[Path]):
+    """Delete ``paths`` in a detached ``rm`` process and wait for it to exit."""
+    subprocess.run(
+        ["rm", "-rf", *(str(path) for path in paths)],
+        check=False,
+        start_new_session=True,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+
+async def empty_trash(trash_path: Path, config: RunConfig):
+    """Delete everything in the trash directory at ``trash_path``.
+
+    Deletion happens in the background as configured by ``config.work_path_cleanup``,
+    unless the filesystem has less than ``config.work_path_min_free`` GB free.
+
+    Background deletion runs in a daemon thread, so it does not delay the runtime from
+    exiting. Anything left in the trash is deleted when the next run starts. In
+    ``process`` mode, the detached ``rm`` process keeps running after the runtime
+    exits. The thread waits for it so it is reaped.
+    """
+    try:
+        paths = await asyncio.to_thread(lambda: list(trash_path.iterdir()))
+    except OSError:
+        return
+
+    if not paths:
+        return
+
+    cleanup = config.work_path_cleanup
+
+    if cleanup != "sync" and is_under_disk_pressure(
+        trash_path,
+        config.work_path_min_free,
+    ):
+        logger.info("deleting work directories before continuing due to low disk space")
+        cleanup = "sync"
+
+    if cleanup == "sync":
+        await asyncio.to_thread(_delete, paths)
+    else:
+        threading.Thread(
+            target=_delete_in_process if cleanup == "process" else _delete,
+            args=(paths,),
+            daemon=True,
+            name="work-path-cleanup",
+        ).start()
 
 
 @asynccontextmanager
-async def create_work_path(config: RunConfig) -> Path:
-    """A temporary working directory where all workflow files should be written."""
+async def create_work_path(
+    config: RunConfig,
+    instrumentation: Instrumentation | None = None,
+) -> Path:
+    """A temporary working directory where all workflow files should be written.
+
+    When the run ends, the directory is moved into a trash directory next to it and
+    deleted in the background. Directories left over from earlier runs are cleaned up
+    the same way when the run starts.
+
+    If ``instrumentation`` is provided, the time taken to move and start deleting the
+    directory is recorded as the ``teardown`` phase.
+    """
     path = Path(config.work_path).absolute()
+    trash_path = get_trash_path(path)
 
-    await asyncio.to_thread(rmtree, path, ignore_errors=True)
+    await asyncio.to_thread(move_to_trash, path)
+    await empty_trash(trash_path, config)
     await asyncio.to_thread(path.mkdir, exist_ok=True, parents=True)
 
     yield path
 
-    await asyncio.to_thread(rmtree, path)
+    if instrumentation is None:
+        instrumentation = Instrumentation()
+
+    with instrumentation.phase("teardown"):
+        await asyncio.to_thread(move_to_trash, path)
+        await empty_trash(trash_path, config)
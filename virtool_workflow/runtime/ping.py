@@ -2,54 +2,186 @@
 
 import asyncio
 from contextlib import asynccontextmanager
-
-from aiohttp import ClientOSError, ServerDisconnectedError
+from time import monotonic
+
+import orjson
+from aiohttp import (
+    BasicAuth,
+    ClientError,
+    ClientResponseError,
+    ClientSession,
+    ClientTimeout,
+    TCPConnector,
+)
 from structlog import get_logger
 
-from virtool_workflow.api.client import APIClient
+from virtool_workflow.api.utils import dumps_json
+from virtool_workflow.runtime.metrics import registry
 
 logger = get_logger("api")
 
+PING_INTERVAL = 5.0
+"""The default number of seconds between pings."""
+
+PING_MAX_INTERVAL = 60.0
+"""The maximum number of seconds between pings."""
+
+PING_MIN_INTERVAL = 1.0
+"""The minimum number of seconds between pings."""
+
+PING_TIMEOUT = 10.0
+"""The number of seconds to wait for a ping response before considering it failed."""
+
+PING_GONE_STATUSES = (404, 409)
+"""Response statuses that mean the job no longer exists or can no longer be pinged."""
+
+ping_rtt = registry.histogram(
+    "ping_rtt_seconds",
+    "The round-trip time of successful pings to the jobs API.",
+)
+
+ping_failures = registry.counter(
+    "ping_failures_total",
+    "The number of pings to the jobs API that failed.",
+)
+
+ping_consecutive_failures = registry.gauge(
+    "ping_consecutive_failures",
+    "The number of pings that have failed since the last successful ping.",
+)
+
 
-async def _ping_periodically(api: APIClient, job_id: str):
-    retries = 0
+def get_ping_interval(lease: object) -> float:
+    """Get the number of seconds to wait between pings.
+
+    If the server advertises how long the job is leased for without a ping, the job is
+    pinged four times per lease. Otherwise, or if the lease is not a positive number,
+    :data:`PING_INTERVAL` is used.
+
+    :param lease: the lease duration in seconds advertised by the server
+    :return: the ping interval in seconds
+    """
+    if isinstance(lease, bool) or not isinstance(lease, int | float) or lease <= 0:
+        return PING_INTERVAL
+
+    return min(max(lease / 4, PING_MIN_INTERVAL), PING_MAX_INTERVAL)
+
+
+def get_backoff_delay(interval: float, failures: int) -> float:
+    """Get the number of seconds to wait before retrying a failed ping.
+
+    The first retry is made quickly and the delay doubles with each consecutive
+    failure. The delay never exceeds the regular ping interval, so retries continue
+    often enough to renew the lease once the server is reachable again.
+
+    :param interval: the regular ping interval
+    :param failures: the number of consecutive failures
+    :return: the delay in seconds
+    """
+    return min(PING_MIN_INTERVAL * 2 ** (failures - 1), interval)
+
+
+async def _ping(http: ClientSession, url: str) -> object:
+    """Ping the jobs API and return the lease advertised in the response, if any.
+
+    Any successful response counts as a ping, even if it has no JSON body.
+    """
+    async with http.put(url, json={}) as resp:
+        resp.raise_for_status()
+        data = await resp.read()
 
     try:
-        while True:
-            if retries > 5:
-                logger.warning("failed to ping server")
-                break
+        body = orjson.loads(data)
+    except orjson.JSONDecodeError:
+        return None
+
+    return body.get("lease_seconds") if isinstance(body, dict) else None
+
 
-            await asyncio.sleep(0.1)
+async def _ping_periodically(http: ClientSession, url: str):
+    failures = 0
+    lease = None
+
+    try:
+        while True:
+            interval = get_ping_interval(lease)
+            started_at = monotonic()
 
             try:
-                await api.put_json(f"/jobs/{job_id}/ping", {})
-            except (ClientOSError, ServerDisconnectedError):
-                await asyncio.sleep(0.3)
-                retries += 1
+                lease = await _ping(http, url) or lease
+            except (ClientError, OSError, TimeoutError) as e:
+                if (
+                    isinstance(e, ClientResponseError)
+                    and e.status in PING_GONE_STATUSES
+                ):
+                    logger.warning(
+                        "stopped pinging server because the job is gone",
+                        status=e.status,
+                    )
+                    return
+
+                failures += 1
+
+                ping_failures.inc()
+                ping_consecutive_failures.set(failures)
+
+                delay = get_backoff_delay(interval, failures)
+
+                logger.warning(
+                    "failed to ping server",
+                    consecutive_failures=failures,
+                    exception=str(e),
+                    retrying_in=delay,
+                )
+
+                await asyncio.sleep(delay)
                 continue
 
-            await asyncio.sleep(5)
+            rtt = monotonic() - started_at
+            ping_rtt.observe(rtt)
+
+            if failures:
+                logger.info("recovered ping after failures", failures=failures)
+                failures = 0
+                ping_consecutive_failures.set(0)
+
+            await asyncio.sleep(max(get_ping_interval(lease) - rtt, 0))
     except asyncio.CancelledError:
         logger.info("stopped pinging server")
 
 
 @asynccontextmanager
-async def ping_periodically(api: APIClient, job_id: str):
+async def ping_periodically(jobs_api_connection_string: str, job_id: str, key: str):
     """Ping the API to keep the job alive.
 
-    While the context manager is open, a task runs that pings the API every 5 seconds.
-    When the context manager is closed, the task is cleanly cancelled.
+    While the context manager is open, a task pings the API. When the context manager
+    is closed, the task is cleanly cancelled.
+
+    Pings are sent over a dedicated single-connection session, so they never queue
+    behind large downloads or uploads.
 
-    The ping request is retried up to 5 times before the task is cancelled.
+    The interval adapts to the lease advertised by the server in the ``lease_seconds``
+    field of the ping response. Failed pings are retried with exponential backoff
+    indefinitely, unless the server responds with ``404`` or ``409``, which means the
+    job is gone and pinging stops.
 
-    :param api: The API client.
+    :param jobs_api_connection_string: The URL of the jobs API.
     :param job_id: The ID of the job to ping.
+    :param key: The job's API key.
 
     """
-    task = asyncio.create_task(_ping_periodically(api, job_id))
-
-    yield
-
-    task.cancel()
-    await task
+    async with ClientSession(
+        auth=BasicAuth(login=f"job-{job_id}", password=key),
+        connector=TCPConnector(keepalive_timeout=PING_MAX_INTERVAL * 2, limit=1),
+        json_serialize=dumps_json,
+        timeout=ClientTimeout(total=PING_TIMEOUT),
+    ) as http:
+        url = f"{jobs_api_connection_string}/jobs/{job_id}/ping"
+
+        task = asyncio.create_task(_ping_periodically(http, url))
+
+        try:
+            yield
+        finally:
+            task.cancel()
+            await task
@@ -0,0 +1,237 @@
+"""Precompile a workflow so the runtime can start faster.
+
+Precompiling validates that every fixture requested by the workflow's steps can be
+provided, records which fixtures each step and fixture depends on, and compiles the
+workflow and framework to bytecode. The result is written to
+:data:`PRECOMPILED_PATH`.
+
+When the runtime starts, it checks the workflow with :func:`check_workflow`. If the
+precompiled file is up to date, the fixture graph was already validated when the image
+was built and the runtime skips resolving it. Otherwise, the runtime resolves the graph
+itself, which imports the module of every built-in fixture the workflow uses. Either
+way, built-in fixtures are still loaded lazily as the job requests them.
+"""
+
+import compileall
+import hashlib
+import inspect
+import json
+from collections.abc import Callable
+from pathlib import Path
+
+from pyfixtures import fixture_context, get_fixtures
+from structlog import get_logger
+
+import virtool_workflow
+from virtool_workflow.errors import WorkflowValidationError
+from virtool_workflow.runtime.discover import (
+    load_custom_fixtures,
+    load_workflow_from_file,
+)
+from virtool_workflow.runtime.fixtures import (
+    BUILTIN_FIXTURES,
+    SCOPE_KEYS,
+    register_builtin_fixture,
+)
+from virtool_workflow.utils import get_virtool_workflow_version
+from virtool_workflow.workflow import Workflow
+
+logger = get_logger("runtime")
+
+FIXTURES_PATH = Path("fixtures.py")
+
+PRECOMPILED_PATH = Path("workflow.precompiled.json")
+"""The path the precompiled workflow is written to and loaded from."""
+
+WORKFLOW_PATH = Path("workflow.py")
+
+
+def _get_parameters(function: Callable) -> tuple[list[str], set[str]]:
+    """Get the parameter names of ``function`` and the names that have defaults."""
+    argspec = inspect.getfullargspec(inspect.unwrap(function))
+    defaults = argspec.args[len(argspec.args) - len(argspec.defaults or ()) :]
+
+    return argspec.args, set(defaults)
+
+
+def get_fixture_graph(workflow: Workflow) -> tuple[list[dict], dict[str, list[str]]]:
+    """Get the fixtures requested by each step of ``workflow`` and their dependencies.
+
+    Built-in fixtures are registered in the current fixture context as they are found.
+
+    :param workflow: the workflow to inspect
+    :raise WorkflowValidationError: a required fixture does not exist
+    :return: the steps and a map of each fixture to the fixtures it requests
+    """
+    fixtures = get_fixtures()
+    graph: dict[str, list[str]] = {}
+    missing: list[str] = []
+
+    def visit(name: str, requested_by: str, optional: bool):
+        if name in graph or name in SCOPE_KEYS:
+            return
+
+        function = fixtures.get(name) or register_builtin_fixture(name)
+
+        if function is None:
+            if not optional:
+                missing.append(f"{name!r} requested by {requested_by}")
+
+            return
+
+        parameters, defaults = _get_parameters(function)
+        graph[name] = parameters
+
+        for parameter in parameters:
+            visit(parameter, f"fixture {name!r}", parameter in defaults)
+
+    steps = []
+
+    for step in workflow.steps:
+        parameters, defaults = _get_parameters(step.function)
+
+        for parameter in parameters:
+            visit(parameter, f"step {step.display_name!r}", parameter in defaults)
+
+        steps.append(
+            {
+                "name": step.display_name,
+                "function": inspect.unwrap(step.function).__qualname__,
+                "fixtures": parameters,
+            },
+        )
+
+    if missing:
+        raise WorkflowValidationError(missing)
+
+    return steps, graph
+
+
+def _hash_file(path: Path) -> str | None:
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except FileNotFoundError:
+        return None
+
+
+def _get_sources() -> dict[str, str | None]:
+    return {
+        str(path): _hash_file(path) for path in (WORKFLOW_PATH, FIXTURES_PATH)
+    }
+
+
+def compile_bytecode() -> bool:
+    """Compile the workflow, its fixtures, and the framework to bytecode.
+
+    :return: whether all files compiled successfully
+    """
+    success = compileall.compile_dir(
+        Path(virtool_workflow.__file__).parent,
+        quiet=1,
+    )
+
+    for path in (WORKFLOW_PATH, FIXTURES_PATH):
+        if path.exists():
+            success = compileall.compile_file(path, quiet=1) and success
+
+    return bool(success)
+
+
+def precompile(path: Path = PRECOMPILED_PATH) -> dict:
+    """Validate and precompile the workflow in the current directory.
+
+    :param path: the path to write the precompiled workflow to
+    :raise WorkflowValidationError: a required fixture does not exist
+    :return: the precompiled workflow
+    """
+    with fixture_context():
+        workflow = load_workflow_from_file()
+        load_custom_fixtures()
+
+        steps, graph = get_fixture_graph(workflow)
+
+        fixtures = get_fixtures()
+
+        builtin_fixtures = {
+            name
+            for name, module_name in BUILTIN_FIXTURES.items()
+            if name in fixtures and fixtures[name].__module__ == module_name
+        }
+
+    if not compile_bytecode():
+        logger.warning("could not compile all files to bytecode")
+
+    precompiled = {
+        "version": get_virtool_workflow_version(),
+        "sources": _get_sources(),
+        "builtin_fixtures": sorted(
+            name for name in graph if name in builtin_fixtures
+        ),
+        "fixtures": graph,
+        "steps": steps,
+    }
+
+    path.write_text(json.dumps(precompiled, indent=2))
+
+    logger.info(
+        "precompiled workflow",
+        fixtures=len(graph),
+        path=str(path),
+        steps=len(steps),
+    )
+
+    return precompiled
+
+
+def load_precompiled(path: Path = PRECOMPILED_PATH) -> dict | None:
+    """Load a precompiled workflow if it is up to date.
+
+    The precompiled workflow is ignored if ``workflow.py`` or ``fixtures.py`` has
+    changed or it was created by a different version of virtool-workflow.
+
+    :param path: the path to the precompiled workflow
+    :return: the precompiled workflow or ``None``
+    """
+    try:
+        precompiled = json.loads(path.read_text())
+    except FileNotFoundError:
+        return None
+    except ValueError:
+        logger.warning("could not read precompiled workflow", path=str(path))
+        return None
+
+    if (
+        precompiled.get("version") != get_virtool_workflow_version()
+        or precompiled.get("sources") != _get_sources()
+    ):
+        logger.warning("ignoring outdated precompiled workflow", path=str(path))
+        return None
+
+    return precompiled
+
+
+
+def check_workflow(workflow: Workflow, path: Path = PRECOMPILED_PATH) -> dict | None:
+    """Check that every fixture requested by ``workflow`` can be provided.
+
+    The check is skipped if the precompiled workflow at ``path`` is up to date and has
+    the same steps as ``workflow``. Built-in fixtures registered while resolving the
+    fixture graph are discarded, so they are still loaded lazily during the job.
+
+    :param workflow: the loaded workflow
+    :param path: the path to the precompiled workflow
+    :raise WorkflowValidationError: a required fixture does not exist
+    :return: the precompiled workflow or ``None`` if it was not used
+    """
+    precompiled = load_precompiled(path)
+
+    if precompiled and [step["name"] for step in precompiled["steps"]] == [
+        step.display_name for step in workflow.steps
+    ]:
+        logger.info("using precompiled workflow", path=str(path))
+        return precompiled
+
+    with fixture_context():
+        get_fixture_graph(workflow)
+
+    return None
@@ -0,0 +1,88 @@
+"""Profile the Python code run by each workflow step."""
+
+import cProfile
+import re
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+from pyfixtures import FixtureScope
+from structlog import get_logger
+
+logger = get_logger("runtime")
+
+
+def get_profile_path(path: Path, job_id: str, index: int, name: str) -> Path:
+    """Get the path to write the profile for a step to.
+
+    Profiles are grouped by job so runs sharing ``path`` do not overwrite each other.
+    They are numbered so they sort in the order the steps ran in.
+
+    :param path: the directory to write profiles to
+    :param job_id: the ID of the running job
+    :param index: the position of the step in the workflow
+    :param name: the display name of the step
+    :return: the profile path
+    """
+    slug = re.sub(r"[^a-z0-9]+", "_", name.lower()).strip("_")
+    return path / job_id / f"{index + 1:02}_{slug}.prof"
+
+
+@contextmanager
+def profile_step(path: Path) -> Iterator[None]:
+    """Profile the workflow process while the context is open.
+
+    The stats are written to ``path`` in the :mod:`pstats` format, which can be read
+    with tools such as ``snakeviz`` or ``python -m pstats``.
+
+    Only code running on the event loop thread is profiled. Work done in other threads
+    or in subprocesses is not included.
+
+    :param path: the path to write the profile to
+    """
+    profiler = cProfile.Profile()
+
+    try:
+        profiler.enable()
+    except ValueError as e:
+        # Only one profiler can be active at a time.
+        logger.warning("could not start profiler", exception=str(e))
+        yield
+        return
+
+    try:
+        yield
+    finally:
+        profiler.disable()
+
+        # Failing to write the profile must not mask an exception raised by the step.
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            profiler.dump_stats(path)
+        except OSError as e:
+            logger.warning("could not write profile", exception=str(e), path=str(path))
+        else:
+            logger.info("wrote step profile", path=str(path))
+
+
+async def upload_profile(scope: FixtureScope, path: Path) -> None:
+    """Upload a step profile as a file associated with the job's analysis.
+
+    Profiles are only uploaded for analysis jobs. Failures to get the analysis or upload
+    the profile are logged rather than raised so profiling never fails a job.
+
+    :param scope: the fixture scope for the running workflow
+    :param path: the path to the profile
+    """
+    if "analysis_id" not in scope["_job"].args:
+        logger.info("not uploading profile for job without analysis", path=str(path))
+        return
+
+    try:
+        analysis = await scope.instantiate_by_key("analysis")
+        await analysis.upload_file(path)
+    except Exception as e:
+        logger.warning("could not upload profile", exception=str(e), path=str(path))
+        return
+
+    logger.info("uploaded step profile", path=str(path))
@@ -0,0 +1,154 @@
+"""Expose runtime metrics in the Prometheus text exposition format.
+
+Metrics can be served over HTTP for scraping, or written to a file for collection by
+the node exporter's textfile collector when pods are too short-lived to be scraped.
+"""
+
+import asyncio
+import math
+import os
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+from aiohttp import web
+from structlog import get_logger
+
+from virtool_workflow.runtime.config import RunConfig
+from virtool_workflow.runtime.metrics import (
+    Histogram,
+    LabelKey,
+    MetricsRegistry,
+    registry,
+)
+
+logger = get_logger("runtime")
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+"""The content type of the Prometheus text exposition format."""
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", r"\\").replace('"', r"\"").replace("\n", r"\n")
+
+
+def _format_labels(labels: LabelKey, extra: tuple[tuple[str, str], ...] = ()) -> str:
+    pairs = (*labels, *extra)
+
+    if not pairs:
+        return ""
+
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in pairs) + "}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def render_metrics(registry_: MetricsRegistry = registry) -> str:
+    """Render all metrics in ``registry_`` in the Prometheus text exposition format.
+
+    :param registry_: the registry to render
+    :return: the rendered metrics
+    """
+    lines = []
+
+    for metric in registry_.collect():
+        lines.append(f"# HELP {metric.name} {metric.description}")
+        lines.append(f"# TYPE {metric.name} {metric.kind}")
+
+        if isinstance(metric, Histogram):
+            for labels, value in metric.samples():
+                for bound, count in zip(metric.buckets, value.bucket_counts):
+                    le = (("le", _format_value(float(bound))),)
+                    lines.append(
+                        f"{metric.name}_bucket{_format_labels(labels, le)} {count}",
+                    )
+
+                inf = (("le", "+Inf"),)
+                lines.append(
+                    f"{metric.name}_bucket{_format_labels(labels, inf)} {value.count}",
+                )
+                lines.append(
+                    f"{metric.name}_sum{_format_labels(labels)} "
+                    f"{_format_value(value.sum)}",
+                )
+                lines.append(
+                    f"{metric.name}_count{_format_labels(labels)} {value.count}",
+                )
+        else:
+            for labels, value in metric.samples():
+                lines.append(
+                    f"{metric.name}{_format_labels(labels)} {_format_value(value)}",
+                )
+
+    return "\n".join(lines) + "\n"
+
+
+def write_metrics_textfile(path: Path, registry_: MetricsRegistry = registry) -> None:
+    """Write all metrics to ``path`` for the node exporter's textfile collector.
+
+    The file is written to a temporary path and renamed, so the collector never reads
+    a partially written file.
+
+    :param path: the path to write the metrics to
+    :param registry_: the registry to render
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}")
+    tmp_path.write_text(render_metrics(registry_))
+    tmp_path.replace(path)
+
+
+async def _handle_metrics(_: web.Request) -> web.Response:
+    return web.Response(body=render_metrics().encode(), content_type=CONTENT_TYPE)
+
+
+@asynccontextmanager
+async def serve_metrics(port: int) -> AsyncIterator[None]:
+    """Serve metrics at ``/metrics`` on ``port`` while the context is open.
+
+    :param port: the port to listen on
+    """
+    app = web.Application()
+    app.router.add_get("/metrics", _handle_metrics)
+
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+
+    await web.TCPSite(runner, port=port).start()
+    logger.info("serving metrics", port=port)
+
+    try:
+        yield
+    finally:
+        await runner.cleanup()
+
+
+@asynccontextmanager
+async def export_metrics(config: RunConfig) -> AsyncIterator[None]:
+    """Export metrics as configured in ``config`` while the context is open.
+
+    If ``config.metrics_port`` is set, metrics are served over HTTP. If
+    ``config.metrics_textfile_path`` is set, metrics are written to the file when the
+    context exits.
+
+    :param config: the run configuration
+    """
+    try:
+        if config.metrics_port:
+            async with serve_metrics(config.metrics_port):
+                yield
+        else:
+            yield
+    finally:
+        if config.metrics_textfile_path:
+            await asyncio.to_thread(
+                write_metrics_textfile,
+                config.metrics_textfile_path,
+            )
+            logger.info("wrote metrics", path=str(config.metrics_textfile_path))
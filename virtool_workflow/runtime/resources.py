@@ -0,0 +1,149 @@
+"""Detection of the CPU and memory available to the runtime.
+
+Containers often limit the CPU time and memory of a process with cgroups without
+changing what :func:`os.cpu_count` or the total system memory report. The limits are
+read from the cgroup v2 interface files so ``proc`` and ``mem`` can default to what is
+actually available.
+"""
+
+import math
+import os
+from pathlib import Path
+
+CGROUP_PATH = Path("/sys/fs/cgroup")
+"""The mount point of the cgroup v2 hierarchy."""
+
+DEFAULT_MEM = 8
+"""The memory limit in GB used when no cgroup memory limit is set."""
+
+GB = 1024**3
+
+THREAD_ENV_VARS = (
+    "MKL_NUM_THREADS",
+    "NUMEXPR_NUM_THREADS",
+    "OMP_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+    "VECLIB_MAXIMUM_THREADS",
+)
+"""Environment variables that common libraries read to size their thread pools."""
+
+
+def _read_cgroup_file(name: str, cgroup_path: Path) -> str | None:
+    try:
+        return (cgroup_path / name).read_text().strip()
+    except OSError:
+        return None
+
+
+def get_cgroup_cpu_limit(cgroup_path: Path = CGROUP_PATH) -> float | None:
+    """Get the number of CPUs the cgroup quota allows, or ``None`` if unlimited.
+
+    The quota is read from ``cpu.max``, which contains the allowed run time and the
+    period it applies to in microseconds (eg. ``200000 100000`` for two CPUs).
+
+    :param cgroup_path: the path to the cgroup v2 hierarchy
+    :return: the number of CPUs, which may be fractional
+    """
+    value = _read_cgroup_file("cpu.max", cgroup_path)
+
+    if value is None:
+        return None
+
+    quota, _, period = value.partition(" ")
+
+    if quota == "max":
+        return None
+
+    try:
+        return int(quota) / int(period or 100000)
+    except (ValueError, ZeroDivisionError):
+        return None
+
+
+def get_cgroup_memory_limit(cgroup_path: Path = CGROUP_PATH) -> int | None:
+    """Get the cgroup memory limit in bytes, or ``None`` if unlimited.
+
+    :param cgroup_path: the path to the cgroup v2 hierarchy
+    :return: the limit from ``memory.max``
+    """
+    value = _read_cgroup_file("memory.max", cgroup_path)
+
+    if value is None or value == "max":
+        return None
+
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+
+def get_available_cpus() -> int:
+    """Get the number of CPUs the process is allowed to run on."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def get_total_memory() -> int | None:
+    """Get the total physical memory of the host in bytes."""
+    try:
+        return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+def detect_proc(cgroup_path: Path = CGROUP_PATH) -> int:
+    """Detect the number of processors the workflow can use.
+
+    This is the smaller of the cgroup CPU quota, rounded down, and the number of CPUs
+    in the process' affinity mask. It is always at least one.
+
+    :param cgroup_path: the path to the cgroup v2 hierarchy
+    """
+    cpus = get_available_cpus()
+
+    if quota := get_cgroup_cpu_limit(cgroup_path):
+        cpus = min(cpus, math.floor(quota))
+
+    return max(cpus, 1)
+
+
+def detect_mem(cgroup_path: Path = CGROUP_PATH) -> int:
+    """Detect the memory in GB the workflow can use.
+
+    This is the cgroup memory limit, capped at the host's physical memory. If no cgroup
+    limit is set, :data:`DEFAULT_MEM` is used instead of all of the host's memory, which
+    is likely shared with other processes.
+
+    The value is rounded down so it never exceeds the real limit. It is ``0`` if less
+    than 1 GB is available.
+
+    :param cgroup_path: the path to the cgroup v2 hierarchy
+    """
+    limit = get_cgroup_memory_limit(cgroup_path)
+    total = get_total_memory()
+
+    if limit is None:
+        limit = DEFAULT_MEM * GB
+
+    if total is not None:
+        limit = min(limit, total)
+
+    return limit // GB
+
+
+def limit_threads(env: dict | None, threads: int) -> dict:
+    """Return a copy of ``env`` that caps library thread pools at ``threads``.
+
+    The current environment is used if ``env`` is ``None``.
+
+    :param env: the environment to copy
+    :param threads: the maximum number of threads
+    """
+    env = dict(os.environ if env is None else env)
+
+    for name in THREAD_ENV_VARS:
+        env[name] = str(threads)
+
+    return env
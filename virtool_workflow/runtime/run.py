@@ -3,8 +3,10 @@ import signal
 import sys
 from asyncio import CancelledError
 from collections.abc import Callable
+from contextlib import nullcontext
 from pathlib import Path
 
+from aiohttp import ClientSession
 from pyfixtures import FixtureScope, runs_in_new_fixture_context
 from structlog import get_logger
 from virtool.jobs.models import JobState
@@ -12,6 +14,8 @@ from virtool.redis import Redis
 
 from virtool_workflow.api.acquire import acquire_job_by_id
 from virtool_workflow.api.client import api_client
+from virtool_workflow.api.session import http_session, keep_connections_warm
+from virtool_workflow.errors import WorkflowValidationError
 from virtool_workflow.hooks import (
     cleanup_builtin_status_hooks,
     on_cancelled,
@@ -27,18 +31,29 @@ from virtool_workflow.hooks import (
 )
 from virtool_workflow.runtime.config import RunConfig
 from virtool_workflow.runtime.discover import (
-    load_builtin_fixtures,
     load_custom_fixtures,
     load_workflow_from_file,
 )
+from virtool_workflow.runtime.disk import monitor_disk_usage
 from virtool_workflow.runtime.events import Events
+from virtool_workflow.runtime.fixtures import set_scope_values
+from virtool_workflow.runtime.instrumentation import Instrumentation
 from virtool_workflow.runtime.path import create_work_path
 from virtool_workflow.runtime.ping import ping_periodically
+from virtool_workflow.runtime.precompile import check_workflow
+from virtool_workflow.runtime.profiling import (
+    get_profile_path,
+    profile_step,
+    upload_profile,
+)
+from virtool_workflow.runtime.prometheus import export_metrics
 from virtool_workflow.runtime.redis import (
     get_next_job_with_timeout,
     wait_for_cancellation,
 )
 from virtool_workflow.runtime.sentry import configure_sentry, set_workflow_context
+from virtool_workflow.runtime.status import status_reporter
+from virtool_workflow.runtime.tracing import TracingFixtureScope, export_traces, tracer
 from virtool_workflow.utils import configure_logs, get_virtool_workflow_version
 from virtool_workflow.workflow import Workflow
 
@@ -71,34 +86,73 @@ def configure_status_hooks():
         await push_status()
 
 
-async def execute(workflow: Workflow, scope: FixtureScope, events: Events, logger):
+async def execute(
+    workflow: Workflow,
+    scope: FixtureScope,
+    events: Events,
+    logger,
+    instrumentation: Instrumentation | None = None,
+):
     """Execute a workflow.
 
     :param workflow: The workflow to execute
     :param scope: The :class:`FixtureScope` to use for fixture injection
     :param events: The events object for cancellation/termination
     :param logger: The configured logger instance
+    :param instrumentation: Records time and resource usage for each step
 
     """
+    if instrumentation is None:
+        instrumentation = Instrumentation()
+
+    config: RunConfig | None = scope.get("_config")
+
     await on_workflow_start.trigger(scope)
 
     scope["_state"] = JobState.RUNNING
 
     try:
-        for step in workflow.steps:
+        for index, step in enumerate(workflow.steps):
             scope["_step"] = step
 
-            bound_step = await scope.bind(step.function)
+            profile_path = (
+                get_profile_path(
+                    config.profile_path,
+                    scope["_job"].id,
+                    index,
+                    step.display_name,
+                )
+                if config and config.profile
+                else None
+            )
 
-            await on_step_start.trigger(scope)
-            logger.info("running workflow step", name=step.display_name)
-            await bound_step()
-            await on_step_finish.trigger(scope)
+            with (
+                tracer.span(f"step {step.display_name}", step=step.display_name),
+                instrumentation.step(step.display_name) as measurement,
+                profile_step(profile_path) if profile_path else nullcontext(),
+            ):
+                with measurement.fixtures():
+                    bound_step = await scope.bind(step.function)
+
+                await on_step_start.trigger(scope)
+                logger.info("running workflow step", name=step.display_name)
+                await bound_step()
+                await on_step_finish.trigger(scope)
+
+            if profile_path and config.profile_upload:
+                await upload_profile(scope, profile_path)
 
     except CancelledError:
         logger.info("cancellation or termination interrupted workflow execution")
 
-        if events.cancelled.is_set():
+        if events.error is not None:
+            logger.error("workflow aborted", error=str(events.error))
+
+            scope["_error"] = events.error
+            scope["_state"] = JobState.ERROR
+
+            await asyncio.gather(on_error.trigger(scope), on_failure.trigger(scope))
+        elif events.cancelled.is_set():
             logger.info("workflow cancelled")
 
             scope["_state"] = JobState.CANCELLED
@@ -152,46 +206,90 @@ async def run_workflow(
     workflow: Workflow,
     events: Events,
     logger,
+    http: ClientSession | None = None,
 ):
+    """Acquire the job with ID ``job_id`` and run ``workflow`` for it.
+
+    If ``http`` is provided, it is used for all requests to the jobs API. Otherwise, a
+    new session is created for the run.
+    """
     # Configure hooks here so that they can be tested when using `run_workflow`.
     configure_status_hooks()
 
-    load_builtin_fixtures()
-
-    job = await acquire_job_by_id(config.jobs_api_connection_string, job_id)
-
-    async with (
-        api_client(
-            config.jobs_api_connection_string,
-            job.id,
-            job.key,
-        ) as api,
-        FixtureScope() as scope,
-    ):
-        # These fixtures should not be used directly by the workflow. They are used
-        # by other built-in fixtures.
-        scope["_api"] = api
-        scope["_config"] = config
-        scope["_error"] = None
-        scope["_job"] = job
-        scope["_state"] = JobState.WAITING
-        scope["_step"] = None
-        scope["_workflow"] = workflow
+    instrumentation = Instrumentation()
 
-        scope["logger"] = get_logger("workflow")
-        scope["mem"] = config.mem
-        scope["proc"] = config.proc
-        scope["results"] = {}
+    async with nullcontext(http) if http else http_session(config) as http:
+        with instrumentation.phase("acquisition"):
+            job = await acquire_job_by_id(
+                config.jobs_api_connection_string,
+                job_id,
+                http,
+            )
 
-        # Set Sentry context with workflow metadata
-        set_workflow_context(job.workflow, job.id)
+        async with (
+            api_client(
+                config.jobs_api_connection_string,
+                job.id,
+                job.key,
+                http,
+            ) as api,
+            status_reporter(api, job.id, config.status_interval) as status,
+            TracingFixtureScope() as scope,
+        ):
+            # Set Sentry context with workflow metadata
+            set_workflow_context(job.workflow, job.id)
+
+            tracer.set_resource(
+                **{"virtool.job.id": job.id, "virtool.workflow": job.workflow},
+            )
 
-        async with create_work_path(config) as work_path:
-            scope["work_path"] = work_path
+            async with create_work_path(config, instrumentation) as work_path:
+                # The values prefixed with an underscore should not be used directly by
+                # the workflow. They are used by other built-in fixtures.
+                set_scope_values(
+                    scope,
+                    _api=api,
+                    _config=config,
+                    _error=None,
+                    _instrumentation=instrumentation,
+                    _job=job,
+                    _state=JobState.WAITING,
+                    _status=status,
+                    _step=None,
+                    _workflow=workflow,
+                    logger=get_logger("workflow"),
+                    mem=config.mem,
+                    proc=config.proc,
+                    results={},
+                    work_path=work_path,
+                )
 
-            async with ping_periodically(api, job_id):
-                await execute(workflow, scope, events, logger)
-                cleanup_builtin_status_hooks()
+                run_task = asyncio.current_task()
+
+                def abort(error: Exception):
+                    events.error = error
+                    run_task.cancel()
+
+                async with (
+                    ping_periodically(
+                        config.jobs_api_connection_string,
+                        job.id,
+                        job.key,
+                    ),
+                    monitor_disk_usage(work_path, config, abort),
+                ):
+                    with instrumentation.phase("execution"):
+                        await execute(workflow, scope, events, logger, instrumentation)
+
+                    cleanup_builtin_status_hooks()
+
+        if config.timeline_path:
+            await asyncio.to_thread(
+                instrumentation.write_timeline,
+                config.timeline_path,
+                job_id=job.id,
+                workflow=job.workflow,
+            )
 
 
 @runs_in_new_fixture_context()
@@ -206,13 +304,38 @@ async def start_runtime(
     timeout: int,
     work_path: Path,
     workflow_loader: Callable[[], Workflow] = load_workflow_from_file,
+    http_connection_limit: int = 100,
+    http_connection_limit_per_host: int = 0,
+    http_dns_cache_ttl: int = 300,
+    http_keepalive_timeout: float = 30.0,
+    http_prewarm_connections: int = 2,
+    http_read_bufsize: int = 1024 * 1024 * 2,
+    status_interval: float = 0.5,
+    timeline_path: Path | None = None,
+    metrics_port: int | None = None,
+    metrics_textfile_path: Path | None = None,
+    trace_otlp_endpoint: str | None = None,
+    trace_path: Path | None = None,
+    profile: bool = False,
+    profile_path: Path = Path("profiles"),
+    profile_upload: bool = False,
+    work_path_cleanup: str = "thread",
+    work_path_min_free: float = 0.0,
+    work_path_max_usage: float = 0.0,
+    fast_path: Path | None = Path("/dev/shm"),
+    fast_path_fraction: float = 0.25,
 ):
     """Start the workflow runtime.
 
-    The runtime loads the workflow and fixtures. It then waits for a job ID to be pushed
-    to the configured Redis list.
+    The runtime loads the workflow and fixtures and checks that every fixture the
+    workflow requests exists. It then waits for a job ID to be pushed to the configured
+    Redis list.
 
     When a job ID is received, the runtime acquires the job from the jobs API and
+    runs the workflow.
+
+    While waiting for a job ID, connections to the jobs API and Redis are opened and
+    kept warm.
     """
     configure_logs(bool(sentry_dsn))
 
@@ -224,53 +347,88 @@ async def start_runtime(
 
     workflow = workflow_loader()
 
-    load_builtin_fixtures()
     load_custom_fixtures()
 
+    try:
+        check_workflow(workflow)
+    except WorkflowValidationError as e:
+        logger.critical("invalid workflow", error=str(e))
+        sys.exit(1)
+
     configure_sentry(sentry_dsn)
 
-    async with Redis(redis_connection_string) as redis:
-        try:
-            job_id = await get_next_job_with_timeout(redis_list_name, redis, timeout)
-        except TimeoutError:
-            # This happens due to Kubernetes scheduling issues or job cancellations. It
-            # is not an error.
-            logger.warning("timed out while waiting for job id")
-            return
-
-    events = Events()
-
-    run_workflow_task = asyncio.create_task(
-        run_workflow(
-            RunConfig(
-                dev,
-                jobs_api_connection_string,
-                mem,
-                proc,
-                work_path,
-            ),
-            job_id,
-            workflow,
-            events,
-            logger,
-        ),
+    config = RunConfig(
+        dev=dev,
+        jobs_api_connection_string=jobs_api_connection_string,
+        mem=mem,
+        proc=proc,
+        work_path=work_path,
+        http_connection_limit=http_connection_limit,
+        http_connection_limit_per_host=http_connection_limit_per_host,
+        http_dns_cache_ttl=http_dns_cache_ttl,
+        http_keepalive_timeout=http_keepalive_timeout,
+        http_prewarm_connections=http_prewarm_connections,
+        http_read_bufsize=http_read_bufsize,
+        metrics_port=metrics_port,
+        metrics_textfile_path=metrics_textfile_path,
+        profile=profile,
+        profile_path=profile_path,
+        profile_upload=profile_upload,
+        status_interval=status_interval,
+        timeline_path=timeline_path,
+        trace_otlp_endpoint=trace_otlp_endpoint,
+        trace_path=trace_path,
+        work_path_cleanup=work_path_cleanup,
+        work_path_min_free=work_path_min_free,
+        work_path_max_usage=work_path_max_usage,
+        fast_path=fast_path,
+        fast_path_fraction=fast_path_fraction,
     )
 
-    def terminate_workflow(*_):
-        logger.info("received sigterm. terminating workflow.")
-        events.terminated.set()
-        run_workflow_task.cancel()
+    # The cancellation Redis client and the HTTP connection pool are opened before
+    # waiting for a job, so the job starts on established connections.
+    async with (
+        export_metrics(config),
+        export_traces(config),
+        Redis(redis_connection_string) as cancellation_redis,
+        http_session(config) as http,
+    ):
+        async with (
+            Redis(redis_connection_string) as redis,
+            keep_connections_warm(http, config),
+        ):
+            try:
+                job_id = await get_next_job_with_timeout(
+                    redis_list_name,
+                    redis,
+                    timeout,
+                )
+            except TimeoutError:
+                # This happens due to Kubernetes scheduling issues or job
+                # cancellations. It is not an error.
+                logger.warning("timed out while waiting for job id")
+                return
+
+        events = Events()
+
+        run_workflow_task = asyncio.create_task(
+            run_workflow(config, job_id, workflow, events, logger, http),
+        )
+
+        def terminate_workflow(*_):
+            logger.info("received sigterm. terminating workflow.")
+            events.terminated.set()
+            run_workflow_task.cancel()
 
-    signal.signal(signal.SIGTERM, terminate_workflow)
+        signal.signal(signal.SIGTERM, terminate_workflow)
 
-    def cancel_workflow(*_):
-        logger.info("received cancellation signal from redis")
-        events.cancelled.set()
-        run_workflow_task.cancel()
+        def cancel_workflow(*_):
+            logger.info("received cancellation signal from redis")
+            events.cancelled.set()
+            run_workflow_task.cancel()
 
-    async with Redis(redis_connection_string) as redis:
         cancellation_task = asyncio.create_task(
-            wait_for_cancellation(redis, job_id, cancel_workflow),
+            wait_for_cancellation(cancellation_redis, job_id, cancel_workflow),
         )
 
         await run_workflow_task
@@ -1,19 +1,69 @@
 """Code for running and managing subprocesses."""
 
 import asyncio
+import io
+import os
+import signal
 from asyncio.subprocess import Process
-from collections.abc import Callable, Coroutine
+from collections import deque
+from collections.abc import Callable, Coroutine, Iterator
+from contextlib import contextmanager
+from dataclasses import asdict
+from functools import partial
 from pathlib import Path
-from typing import Protocol
+from time import monotonic, perf_counter
+from typing import IO, Protocol
 
 from pyfixtures import fixture
 from structlog import get_logger
 from virtool.utils import timestamp
 
-from virtool_workflow.errors import SubprocessFailedError
+from virtool_workflow.errors import SubprocessFailedError, SubprocessMemoryLimitError
+from virtool_workflow.runtime.instrumentation import SubprocessUsage, get_current_step
+from virtool_workflow.runtime.metrics import registry
+from virtool_workflow.runtime.resources import limit_threads
+from virtool_workflow.runtime.tracing import tracer
 
 logger = get_logger("subprocess")
 
+subprocess_exits = registry.counter(
+    "subprocess_exits_total",
+    "The number of subprocesses that have exited by command and exit code.",
+)
+
+subprocess_cpu_seconds = registry.counter(
+    "subprocess_cpu_seconds_total",
+    "The CPU time used by subprocesses by command.",
+)
+
+subprocess_peak_rss_bytes = registry.histogram(
+    "subprocess_peak_rss_bytes",
+    "The peak resident set size of subprocesses by command.",
+    buckets=tuple(2**i * 1024**2 for i in range(0, 18, 2)),
+)
+
+PIPE_BLOCK_SIZE = 1024 * 1024
+"""The maximum number of bytes read from a pipe at once in batched mode."""
+
+PIPE_LINE_LIMIT = 1024 * 1024 * 128
+"""The maximum length of a line of subprocess output in bytes."""
+
+STDERR_LOG_INTERVAL = 1.0
+"""The length in seconds of the window :data:`STDERR_LOG_LIMIT` applies to."""
+
+STDERR_LOG_LIMIT = 20
+"""The maximum number of stderr lines logged per :data:`STDERR_LOG_INTERVAL`."""
+
+TERMINATE_TIMEOUT = 5.0
+"""The number of seconds to wait after ``SIGTERM`` before sending ``SIGKILL``."""
+
+GB = 1024**3
+
+USAGE_SAMPLE_INTERVAL = 0.5
+"""The number of seconds between samples of subprocess CPU and memory usage."""
+
+_CLOCK_TICKS = os.sysconf("SC_CLK_TCK")
+
 
 class LineOutputHandler(Protocol):
     async def __call__(self, line: bytes):
@@ -24,28 +74,109 @@ class LineOutputHandler(Protocol):
         raise NotImplementedError
 
 
+class BatchOutputHandler(Protocol):
+    async def __call__(self, lines: list[bytes]):
+        """Handle output from stdout or stderr in batches of lines.
+
+        :param lines: The complete lines read from the stream in one block.
+        """
+        raise NotImplementedError
+
+
 class RunSubprocess(Protocol):
     async def __call__(
         self,
         command: list[str],
         cwd: str | Path | None = None,
         env: dict | None = None,
-        stderr_handler: LineOutputHandler | None = None,
-        stdout_handler: LineOutputHandler | None = None,
+        stderr_handler: LineOutputHandler | BatchOutputHandler | None = None,
+        stdout_handler: LineOutputHandler | BatchOutputHandler | None = None,
+        batched: bool = False,
+        stdout: Path | int | None = None,
+        cpus: set[int] | None = None,
+        nice: int | None = None,
+        threads: int | None = None,
+        memory_limit: int | None = None,
     ) -> Process:
         """Run a shell command in a subprocess.
 
+        Set ``batched`` for commands that write a lot of output. Output is then read in
+        large blocks and the handlers are called with a list of the lines in each block
+        instead of once per line.
+
+        Use ``cpus``, ``nice``, and ``threads`` to keep tools that run at the same time
+        from competing for the same cores.
+
         :param command: A shell command
         :param stdout_handler: A function to handle stdout output line by line
         :param stderr_handler: A function to handle stderr output line by line
         :param env: environment variables which should be available to the subprocess
         :param cwd: The current working directory
+        :param batched: Pass lists of lines to the handlers instead of single lines
+        :param stdout: A file path or descriptor to write stdout to directly
+        :param cpus: The CPUs the subprocess is allowed to run on
+        :param nice: A niceness increment to apply to the subprocess
+        :param threads: A value for ``OMP_NUM_THREADS`` and similar variables
+        :param memory_limit: Terminate the subprocess if it uses more bytes of memory.
+            Defaults to :func:`.mem` GB. ``None`` disables the limit.
         :raise SubprocessFailed: The subprocess has exited with a non-zero exit code
+        :raise SubprocessMemoryLimitError: The subprocess exceeded ``memory_limit``
         :return: An :class:`.Process` instance
         """
         raise NotImplementedError
 
 
+class RunPipeline(Protocol):
+    async def __call__(
+        self,
+        *commands: list[str],
+        cwd: str | Path | None = None,
+        env: dict | None = None,
+        stderr_handler: LineOutputHandler | BatchOutputHandler | None = None,
+        stdout_handler: LineOutputHandler | BatchOutputHandler | None = None,
+        batched: bool = False,
+        stdout: Path | int | None = None,
+        cpus: set[int] | None = None,
+        nice: int | None = None,
+        threads: int | None = None,
+        memory_limit: int | None = None,
+    ) -> list[Process]:
+        """Run shell commands with the stdout of each connected to the stdin of the next.
+
+        The commands are connected with operating system pipes, so data passed between
+        them is never read into Python. Only the stdout of the last command is handled
+        by ``stdout_handler`` or written to ``stdout``.
+
+        Example:
+
+        .. code-block:: python
+
+            await run_pipeline(
+                ["bowtie2", "-p", str(proc), "-x", index_path, "-U", reads_path],
+                ["samtools", "view", "-b", "-"],
+                stdout=work_path / "mapped.bam",
+            )
+
+        :param commands: The shell commands to connect
+        :param stdout_handler: A function to handle the last command's stdout
+        :param stderr_handler: A function to handle the stderr of every command
+        :param env: environment variables which should be available to the subprocesses
+        :param cwd: The current working directory
+        :param batched: Pass lists of lines to the handlers instead of single lines
+        :param stdout: A file path or descriptor to write the last command's stdout to
+        :param cpus: The CPUs the subprocesses are allowed to run on
+        :param nice: A niceness increment to apply to the subprocesses
+        :param threads: A value for ``OMP_NUM_THREADS`` and similar variables
+        :param memory_limit: Terminate the pipeline if its subprocesses use more bytes
+            of memory between them. Defaults to :func:`.mem` GB. ``None`` disables the
+            limit.
+        :raise SubprocessFailed: A subprocess has exited with a non-zero exit code
+        :raise SubprocessMemoryLimitError: The subprocesses exceeded ``memory_limit``
+        :return: The :class:`.Process` instances in the order of ``commands``
+        """
+        raise NotImplementedError
+
+
 async def watch_pipe(
     stream: asyncio.StreamReader,
     handler: LineOutputHandler,
@@ -65,6 +196,52 @@ async def watch_pipe(
         await handler(line)
 
 
+async def watch_pipe_batched(
+    stream: asyncio.StreamReader,
+    handler: BatchOutputHandler,
+    block_size: int = PIPE_BLOCK_SIZE,
+):
+    """Watch the stdout or stderr stream and pass batches of lines to ``handler``.
+
+    The stream is read in blocks of up to ``block_size`` bytes. The complete lines in
+    each block are passed to ``handler`` together. A partial line at the end of a block
+    is held until the rest of it is read.
+
+    :param stream: a stdout or stderr file object
+    :param handler: a handler coroutine for lists of output lines
+    :param block_size: the maximum number of bytes to read at once
+    """
+    partial = bytearray()
+
+    while True:
+        block = await stream.read(block_size)
+
+        if not block:
+            if partial:
+                await handler([bytes(partial)])
+
+            return
+
+        # Only the new block is searched, so long output without newlines, like
+        # progress bars drawn with ``\r``, is not rescanned or copied on every read.
+        end = block.rfind(b"\n") + 1
+
+        if end == 0:
+            partial += block
+
+            if len(partial) < PIPE_LINE_LIMIT:
+                continue
+
+            lines = [bytes(partial)]
+            partial.clear()
+        else:
+            partial += block[:end]
+            lines = io.BytesIO(partial).readlines()
+            partial = bytearray(block[end:])
+
+        await handler(lines)
+
+
 def stderr_logger(line: bytes):
     """Log a line of stderr output and try to decode it as UTF-8.
 
@@ -80,45 +257,512 @@ def stderr_logger(line: bytes):
         logger.info("stderr", line=line)
 
 
+class StderrLogger:
+    """Logs batched stderr output without flooding the logs.
+
+    At most ``limit`` lines are logged per ``interval`` seconds. Lines over the limit
+    are counted and summarised in a single log entry when the window ends or
+    :meth:`flush` is called.
+
+    This is only used in batched mode. In line mode, every line of stderr is logged.
+    """
+
+    def __init__(
+        self,
+        limit: int = STDERR_LOG_LIMIT,
+        interval: float = STDERR_LOG_INTERVAL,
+    ):
+        self._interval = interval
+        self._limit = limit
+
+        self._last_suppressed: bytes = b""
+        self._logged = 0
+        self._suppressed = 0
+        self._window_started_at = monotonic()
+
+    def __call__(self, lines: list[bytes]):
+        """Log ``lines`` if the rate limit allows it, otherwise count them.
+
+        :param lines: lines of stderr output
+        """
+        now = monotonic()
+
+        if now - self._window_started_at >= self._interval:
+            self.flush()
+            self._logged = 0
+            self._window_started_at = now
+
+        allowed = max(self._limit - self._logged, 0)
+
+        for line in lines[:allowed]:
+            stderr_logger(line)
+
+        self._logged += min(allowed, len(lines))
+
+        if len(lines) > allowed:
+            self._last_suppressed = lines[-1]
+            self._suppressed += len(lines) - allowed
+
+    def flush(self):
+        """Log a summary of the lines suppressed since the last summary."""
+        if not self._suppressed:
+            return
+
+        last_line = self._last_suppressed.rstrip()
+
+        try:
+            last_line = last_line.decode()
+        except UnicodeDecodeError:
+            pass
+
+        logger.info(
+            "suppressed stderr lines",
+            count=self._suppressed,
+            last_line=last_line,
+        )
+
+        self._suppressed = 0
+
+
+def _format_command(command: list[str]) -> str:
+    return " ".join(str(arg) for arg in command)
+
+
+@contextmanager
+def _open_stdout(stdout: Path | int | None) -> Iterator[int | IO | None]:
+    """Open ``stdout`` for a subprocess to write to, if it is a path."""
+    if isinstance(stdout, Path):
+        with open(stdout, "wb") as f:
+            yield f
+    else:
+        yield stdout
+
+
 async def _run_subprocess(
     command: list[str],
-    stdout_handler: LineOutputHandler | None = None,
+    stdout_handler: LineOutputHandler | BatchOutputHandler | None = None,
     stderr_handler: Callable[[str], Coroutine] | None = None,
     env: dict | None = None,
     cwd: str | None = None,
+    batched: bool = False,
+    stdout: Path | int | None = None,
+    cpus: set[int] | None = None,
+    nice: int | None = None,
+    threads: int | None = None,
+    memory_limit: int | None = None,
 ) -> asyncio.subprocess.Process:
     """An implementation of :class:`RunSubprocess` using `asyncio.subprocess`."""
+    with tracer.span(
+        f"subprocess {Path(command[0]).name}",
+        command=_format_command(command),
+    ):
+        (process,) = await _exec_pipeline(
+            [command],
+            stdout_handler,
+            stderr_handler,
+            env,
+            cwd,
+            batched,
+            stdout,
+            cpus,
+            nice,
+            threads,
+            memory_limit,
+        )
+
+        return process
+
+
+async def _run_pipeline(
+    *commands: list[str],
+    stdout_handler: LineOutputHandler | BatchOutputHandler | None = None,
+    stderr_handler: Callable[[str], Coroutine] | None = None,
+    env: dict | None = None,
+    cwd: str | None = None,
+    batched: bool = False,
+    stdout: Path | int | None = None,
+    cpus: set[int] | None = None,
+    nice: int | None = None,
+    threads: int | None = None,
+    memory_limit: int | None = None,
+) -> list[asyncio.subprocess.Process]:
+    """An implementation of :class:`RunPipeline` using `asyncio.subprocess`."""
+    if not commands:
+        raise ValueError("At least one command is required")
+
+    with tracer.span(
+        "pipeline " + " | ".join(Path(command[0]).name for command in commands),
+        command=" | ".join(_format_command(command) for command in commands),
+    ):
+        return await _exec_pipeline(
+            list(commands),
+            stdout_handler,
+            stderr_handler,
+            env,
+            cwd,
+            batched,
+            stdout,
+            cpus,
+            nice,
+            threads,
+            memory_limit,
+        )
+
+
+def _terminate(process: asyncio.subprocess.Process):
+    if process.returncode is None:
+        process.terminate()
+
+    # Have to do this in Python 3.10 to avoid Event loop closed error.
+    # https://github.com/python/cpython/issues/88050
+    try:
+        process._transport.close()
+    except AttributeError:
+        pass
+
+
+def _apply_cpu_limits(
+    command: list[str],
+    cpus: set[int] | None,
+    nice: int | None,
+) -> list[str]:
+    """Prefix ``command`` with ``taskset`` and ``nice`` to set its CPU affinity and
+    niceness.
+
+    The prefixes apply the settings and then exec the command, so it starts with them
+    and they are inherited by any threads it creates. Setting them in a ``preexec_fn``
+    could deadlock the child, because the runtime has threads of its own when it forks.
+    """
+    prefix = []
+
+    if cpus is not None:
+        prefix += ["taskset", "--cpu-list", ",".join(str(cpu) for cpu in sorted(cpus))]
+
+    if nice is not None:
+        prefix += ["nice", "-n", str(nice)]
+
+    return [*prefix, *command]
+
+
+async def _start_pipeline(
+    commands: list[list[str]],
+    env: dict | None,
+    cwd: str | None,
+    stdout: int | IO,
+    cpus: set[int] | None = None,
+    nice: int | None = None,
+) -> list[asyncio.subprocess.Process]:
+    """Start each command with its stdout connected to the stdin of the next.
+
+    The pipes are created with :func:`os.pipe`, so data passes directly between the
+    subprocesses. The parent's copies of the pipe ends are closed once each process
+    has started.
+    """
+    processes = []
+    stdin = None
+
+    try:
+        for i, command in enumerate(commands):
+            if i == len(commands) - 1:
+                read_fd, write_fd = None, stdout
+            else:
+                read_fd, write_fd = os.pipe()
+
+            try:
+                process = await asyncio.create_subprocess_exec(
+                    *_apply_cpu_limits([str(arg) for arg in command], cpus, nice),
+                    cwd=cwd,
+                    env=env,
+                    limit=PIPE_LINE_LIMIT,
+                    stderr=asyncio.subprocess.PIPE,
+                    stdin=stdin,
+                    stdout=write_fd,
+                )
+            except BaseException:
+                if read_fd is not None:
+                    os.close(read_fd)
+
+                raise
+            finally:
+                if stdin is not None:
+                    os.close(stdin)
+                    stdin = None
+
+                if read_fd is not None:
+                    os.close(write_fd)
+
+            stdin = read_fd
+            processes.append(process)
+    except BaseException:
+        if stdin is not None:
+            os.close(stdin)
+
+        for process in processes:
+            _terminate(process)
+            await process.wait()
+
+        raise
+
+    return processes
+
+
+def _get_process_tree(pid: int) -> list[int]:
+    """Get ``pid`` followed by the IDs of all of its living descendants.
+
+    Descendants are found through ``/proc/<pid>/task/<tid>/children``, so processes
+    started by wrapper scripts and shells are included.
+    """
+    pids = [pid]
+    pending = deque(pids)
+
+    while pending:
+        parent = pending.popleft()
+
+        try:
+            tasks = os.listdir(f"/proc/{parent}/task")
+        except OSError:
+            continue
+
+        for task in tasks:
+            try:
+                with open(f"/proc/{parent}/task/{task}/children") as f:
+                    children = [int(child) for child in f.read().split()]
+            except (OSError, ValueError):
+                continue
+
+            pids.extend(children)
+            pending.extend(children)
+
+    return pids
+
+
+def _read_process_usage(pid: int) -> tuple[float, int, int] | None:
+    """Read the CPU time, RSS, and peak RSS of a single process from ``/proc``.
+
+    The CPU time includes the time of children the process has waited for. Returns
+    ``None`` if the process has already been reaped.
+    """
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            # The command name can contain spaces, so split after it.
+            fields = f.read().rsplit(")", 1)[1].split()
+
+        rss = peak_rss = 0
+
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    rss = int(line.split()[1]) * 1024
+                elif line.startswith("VmHWM:"):
+                    peak_rss = int(line.split()[1]) * 1024
+    except (OSError, IndexError, ValueError):
+        return None
+
+    cpu_time = sum(int(field) for field in fields[11:15]) / _CLOCK_TICKS
+
+    return cpu_time, rss, peak_rss
+
+
+def _sample_usage(pid: int) -> tuple[float, int, int] | None:
+    """Sample the CPU time, RSS, and peak RSS of a process and its descendants.
+
+    The CPU time and RSS are summed over the process tree. The peak RSS is the largest
+    of the current combined RSS and the peak RSS of any single process in the tree.
+
+    Returns ``None`` if the process has already been reaped.
+    """
+    if (sample := _read_process_usage(pid)) is None:
+        return None
+
+    cpu_time, rss, peak_rss = sample
+
+    for descendant in _get_process_tree(pid)[1:]:
+        if sample := _read_process_usage(descendant):
+            cpu_time += sample[0]
+            rss += sample[1]
+            peak_rss = max(peak_rss, sample[2])
+
+    return cpu_time, rss, max(peak_rss, rss)
+
+
+def _signal_process_trees(processes: list[asyncio.subprocess.Process], sig: int):
+    """Send ``sig`` to each running process in ``processes`` and its descendants."""
+    for process in processes:
+        if process.returncode is not None:
+            continue
+
+        for pid in _get_process_tree(process.pid):
+            try:
+                os.kill(pid, sig)
+            except OSError:
+                pass
+
+
+async def _kill_process_trees(processes: list[asyncio.subprocess.Process]):
+    """Terminate ``processes`` and their descendants.
+
+    ``SIGTERM`` is sent first. Any process still running after
+    :data:`TERMINATE_TIMEOUT` seconds is sent ``SIGKILL``.
+    """
+    _signal_process_trees(processes, signal.SIGTERM)
+
+    try:
+        await asyncio.wait_for(
+            asyncio.gather(*(process.wait() for process in processes)),
+            TERMINATE_TIMEOUT,
+        )
+    except TimeoutError:
+        logger.warning(
+            "killing subprocess that ignored SIGTERM",
+            timeout=TERMINATE_TIMEOUT,
+        )
+
+        _signal_process_trees(processes, signal.SIGKILL)
+
+
+async def _monitor_usage(
+    processes: list[asyncio.subprocess.Process],
+    usages: list[SubprocessUsage],
+    memory_limit: int | None,
+    exceeded_memory_limit: asyncio.Event,
+):
+    """Sample the usage of ``processes`` and their descendants until they exit.
+
+    If the combined RSS of the process trees exceeds ``memory_limit``,
+    ``exceeded_memory_limit`` is set and the processes are killed.
+    """
+    while any(process.returncode is None for process in processes):
+        rss = 0
+
+        for process, usage in zip(processes, usages):
+            if process.returncode is None and (sample := _sample_usage(process.pid)):
+                usage.cpu_time, current_rss, peak_rss = sample
+                usage.peak_rss = max(usage.peak_rss, peak_rss)
+                rss += current_rss
+
+        if memory_limit is not None and rss > memory_limit:
+            logger.warning(
+                "terminating subprocess for exceeding memory limit",
+                limit=memory_limit,
+                rss=rss,
+            )
+
+            # Set before killing, as the processes may be reaped and this task
+            # cancelled before the kill finishes.
+            exceeded_memory_limit.set()
+
+            await _kill_process_trees(processes)
+
+            return
+
+        await asyncio.sleep(USAGE_SAMPLE_INTERVAL)
+
+
+def _record_usage(usages: list[SubprocessUsage]):
+    """Log and record the usage of subprocesses that have exited."""
+    step = get_current_step()
+
+    for usage in usages:
+        logger.info("subprocess usage", **asdict(usage))
+
+        subprocess_cpu_seconds.inc(usage.cpu_time, command=usage.command)
+        subprocess_peak_rss_bytes.observe(usage.peak_rss, command=usage.command)
+
+        if step is not None:
+            step.subprocesses.append(usage)
+
+
+async def _exec_pipeline(
+    commands: list[list[str]],
+    stdout_handler: LineOutputHandler | BatchOutputHandler | None,
+    stderr_handler: Callable[[str], Coroutine] | None,
+    env: dict | None,
+    cwd: str | None,
+    batched: bool,
+    stdout: Path | int | None,
+    cpus: set[int] | None = None,
+    nice: int | None = None,
+    threads: int | None = None,
+    memory_limit: int | None = None,
+) -> list[asyncio.subprocess.Process]:
+    if stdout is not None and stdout_handler:
+        raise ValueError("Only one of stdout and stdout_handler can be provided")
+
+    if threads is not None:
+        env = limit_threads(env, threads)
+
     log = logger.bind()
-    log.info("running subprocess", command=command)
 
-    stdout = asyncio.subprocess.PIPE if stdout_handler else asyncio.subprocess.DEVNULL
+    for command in commands:
+        log.info("running subprocess", command=command)
 
-    if stderr_handler:
+    watch = watch_pipe_batched if batched else watch_pipe
 
-        async def _stderr_handler(line):
-            stderr_logger(line)
-            await stderr_handler(line)
+    def create_stderr_handler(log_stderr: StderrLogger):
+        if batched:
 
-    else:
+            async def _stderr_handler(lines: list[bytes]):
+                log_stderr(lines)
 
-        async def _stderr_handler(line):
-            stderr_logger(line)
+                if stderr_handler:
+                    await stderr_handler(lines)
+
+        else:
+
+            async def _stderr_handler(line: bytes):
+                stderr_logger(line)
 
-    process = await asyncio.create_subprocess_exec(
-        *(str(arg) for arg in command),
-        cwd=cwd,
-        env=env,
-        limit=1024 * 1024 * 128,
-        stderr=asyncio.subprocess.PIPE,
-        stdout=stdout,
+                if stderr_handler:
+                    await stderr_handler(line)
+
+        return _stderr_handler
+
+    with _open_stdout(stdout) as stdout_target:
+        if stdout_target is None:
+            stdout_target = (
+                asyncio.subprocess.PIPE
+                if stdout_handler
+                else asyncio.subprocess.DEVNULL
+            )
+
+        processes = await _start_pipeline(
+            commands,
+            env,
+            cwd,
+            stdout_target,
+            cpus,
+            nice,
+        )
+
+    stderr_loggers = [StderrLogger() for _ in processes]
+
+    started_at = perf_counter()
+
+    usages = [
+        SubprocessUsage(command=Path(command[0]).name, pid=process.pid)
+        for command, process in zip(commands, processes)
+    ]
+
+    exceeded_memory_limit = asyncio.Event()
+
+    monitor = asyncio.create_task(
+        _monitor_usage(processes, usages, memory_limit, exceeded_memory_limit),
     )
 
-    log.info("started subprocess", pid=process.pid, timestamp=timestamp().isoformat())
+    for process in processes:
+        log.info(
+            "started subprocess",
+            pid=process.pid,
+            timestamp=timestamp().isoformat(),
+        )
 
-    aws = [watch_pipe(process.stderr, _stderr_handler)]
+    aws = [
+        watch(process.stderr, create_stderr_handler(log_stderr))
+        for process, log_stderr in zip(processes, stderr_loggers)
+    ]
 
     if stdout_handler:
-        aws.append(watch_pipe(process.stdout, stdout_handler))
+        aws.append(watch(processes[-1].stdout, stdout_handler))
 
     watcher_future = asyncio.gather(*aws)
 
@@ -127,42 +771,101 @@ async def _run_subprocess(
     except asyncio.CancelledError:
         logger.info("terminating subprocess")
 
-        process.terminate()
+        monitor.cancel()
 
-        # Have to do this in Python 3.10 to avoid Event loop closed error.
-        # https://github.com/python/cpython/issues/88050
-        try:
-            process._transport.close()
-        except AttributeError:
-            pass
+        for process in processes:
+            _terminate(process)
 
-        await process.wait()
-        logger.info("subprocess exited", code=process.returncode)
+        for command, process, usage in zip(commands, processes, usages):
+            await process.wait()
+            logger.info("subprocess exited", code=process.returncode)
+
+            usage.code = process.returncode
+            usage.wall_time = perf_counter() - started_at
+
+            subprocess_exits.inc(
+                command=Path(command[0]).name,
+                code=process.returncode,
+            )
+
+        _record_usage(usages)
+
+        tracer.set_attributes(code=processes[-1].returncode)
 
         await watcher_future
 
-        return process
+        for log_stderr in stderr_loggers:
+            log_stderr.flush()
+
+        return processes
+
+    for log_stderr in stderr_loggers:
+        log_stderr.flush()
+
+    for command, process, usage in zip(commands, processes, usages):
+        await process.wait()
+
+        usage.code = process.returncode
+        usage.wall_time = perf_counter() - started_at
+
+        subprocess_exits.inc(command=Path(command[0]).name, code=process.returncode)
 
-    await process.wait()
+    monitor.cancel()
 
-    # Exit code 15 indicates that the process was terminated. This is expected
-    # when the workflow fails for some other reason, hence not an exception
-    if process.returncode not in [0, 15, -15]:
-        raise SubprocessFailedError(
-            f"{command[0]} failed with exit code {process.returncode}\n"
-            f"arguments: {command}\n",
+    _record_usage(usages)
+
+    tracer.set_attributes(code=processes[-1].returncode)
+
+    if exceeded_memory_limit.is_set():
+        raise SubprocessMemoryLimitError(
+            f"{commands[-1][0]} was terminated for exceeding the memory limit of "
+            f"{memory_limit} bytes\n"
+            f"arguments: {commands}\n",
         )
 
+    for i, (command, process) in enumerate(zip(commands, processes)):
+        # Exit code 15 indicates that the process was terminated. This is expected
+        # when the workflow fails for some other reason, hence not an exception.
+        # Commands earlier in a pipeline are killed by SIGPIPE (-13) if a later
+        # command exits without reading all of their output.
+        expected = [0, 15, -15] if i == len(commands) - 1 else [0, 15, -15, -13]
+
+        if process.returncode not in expected:
+            raise SubprocessFailedError(
+                f"{command[0]} failed with exit code {process.returncode}\n"
+                f"arguments: {command}\n",
+            )
+
     log.info(
         "subprocess finished",
-        return_code=process.returncode,
+        return_code=processes[-1].returncode,
         timestamp=timestamp().isoformat(),
     )
 
-    return process
+    return processes
 
 
 @fixture(protocol=RunSubprocess)
-def run_subprocess() -> RunSubprocess:
-    """Fixture to run subprocesses and handle stdin and stderr output line-by-line."""
-    return _run_subprocess
+def run_subprocess(mem: int) -> RunSubprocess:
+    """Fixture to run subprocesses and handle stdin and stderr output line-by-line.
+
+    Subprocesses that use more than ``mem`` GB of memory are terminated unless
+    another ``memory_limit`` is passed.
+    """
+    if not mem:
+        return _run_subprocess
+
+    return partial(_run_subprocess, memory_limit=mem * GB)
+
+
+@fixture(protocol=RunPipeline)
+def run_pipeline(mem: int) -> RunPipeline:
+    """Fixture to run subprocesses with the output of each piped into the next.
+
+    Pipelines whose subprocesses use more than ``mem`` GB of memory between them are
+    terminated unless another ``memory_limit`` is passed.
+    """
+    if not mem:
+        return _run_pipeline
+
+    return partial(_run_pipeline, memory_limit=mem * GB)
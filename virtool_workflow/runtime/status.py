@@ -0,0 +1,161 @@
+"""Report job status updates to the jobs API without blocking workflow execution."""
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from time import monotonic
+
+from structlog import get_logger
+from virtool.jobs.models import JobState
+
+from virtool_workflow.api.client import APIClient
+from virtool_workflow.runtime.metrics import registry
+
+logger = get_logger("api")
+
+TERMINAL_STATES = (
+    JobState.CANCELLED,
+    JobState.COMPLETE,
+    JobState.ERROR,
+    JobState.TERMINATED,
+)
+"""Job states after which no further status updates are expected."""
+
+status_updates_pending = registry.gauge(
+    "status_updates_pending",
+    "The number of status updates waiting to be sent to the jobs API.",
+)
+
+status_updates_coalesced = registry.counter(
+    "status_updates_coalesced_total",
+    "The number of status updates replaced by a newer update before being sent.",
+)
+
+status_updates_sent = registry.counter(
+    "status_updates_sent_total",
+    "The number of status updates delivered to the jobs API.",
+)
+
+status_update_latency = registry.histogram(
+    "status_update_latency_seconds",
+    "The time between a status update being pushed and it being delivered.",
+)
+
+
+class StatusReporter:
+    """Sends job status updates to the jobs API from a background task.
+
+    Updates pushed within ``interval`` seconds of the last delivered update are
+    coalesced so only the newest one is sent. Pushing an update never waits on the
+    network. Call :meth:`flush` to wait for the newest update to be delivered.
+    """
+
+    def __init__(self, api: APIClient, job_id: str, interval: float):
+        """Create a reporter for the job identified by ``job_id``.
+
+        :param api: the client to send updates with
+        :param job_id: the ID of the job to report status for
+        :param interval: the minimum number of seconds between sent updates
+        """
+        self._api = api
+        self._job_id = job_id
+        self._interval = interval
+
+        self._last_sent_at = 0.0
+        self._lock = asyncio.Lock()
+        self._pending: dict | None = None
+        self._pending_since = 0.0
+        self._wake = asyncio.Event()
+
+    def push(self, payload: dict) -> None:
+        """Queue a status update to be sent.
+
+        Any update that is waiting to be sent is replaced by ``payload``.
+
+        :param payload: the status update request body
+        """
+        if self._pending is None:
+            self._pending_since = monotonic()
+        else:
+            status_updates_coalesced.inc()
+
+        self._pending = payload
+        status_updates_pending.set(1)
+
+        self._wake.set()
+
+    async def flush(self) -> None:
+        """Send the waiting status update, if any, and wait for it to be delivered."""
+        async with self._lock:
+            await self._send_pending()
+
+    async def run(self) -> None:
+        """Send status updates as they are pushed until cancelled."""
+        while True:
+            await self._wake.wait()
+
+            elapsed = monotonic() - self._last_sent_at
+
+            if elapsed < self._interval:
+                await asyncio.sleep(self._interval - elapsed)
+
+            self._wake.clear()
+
+            async with self._lock:
+                try:
+                    await self._send_pending()
+                except Exception:
+                    logger.exception("failed to report status to api")
+
+    async def _send_pending(self) -> None:
+        payload = self._pending
+
+        if payload is None:
+            return
+
+        self._pending = None
+        status_updates_pending.set(0)
+
+        await self._api.post_json(f"/jobs/{self._job_id}/status", payload)
+
+        self._last_sent_at = monotonic()
+
+        status_updates_sent.inc()
+        status_update_latency.observe(self._last_sent_at - self._pending_since)
+
+        logger.info(
+            "reported status to api",
+            step=payload["step_name"],
+            state=payload["state"],
+        )
+
+
+@asynccontextmanager
+async def status_reporter(
+    api: APIClient,
+    job_id: str,
+    interval: float,
+) -> AsyncIterator[StatusReporter]:
+    """A :class:`StatusReporter` whose background task runs while the context is open.
+
+    Any waiting update is delivered before the context exits.
+
+    :param api: the client to send updates with
+    :param job_id: the ID of the job to report status for
+    :param interval: the minimum number of seconds between sent updates
+    """
+    reporter = StatusReporter(api, job_id, interval)
+
+    task = asyncio.create_task(reporter.run())
+
+    try:
+        yield reporter
+    finally:
+        task.cancel()
+
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+        await reporter.flush()
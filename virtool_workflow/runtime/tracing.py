@@ -0,0 +1,337 @@
+"""Record nested spans describing where a workflow run spends its time.
+
+Spans are recorded by the module-level :data:`tracer`. Tracing is disabled by default,
+in which case :meth:`Tracer.span` returns a shared no-op context manager and nothing is
+recorded.
+
+Recorded spans can be written to a Chrome trace file, which can be opened in
+``chrome://tracing`` or Perfetto, or sent to an OpenTelemetry collector using OTLP over
+HTTP.
+"""
+
+import asyncio
+import json
+import os
+import random
+import threading
+import time
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager, nullcontext
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from aiohttp import ClientError, ClientSession, ClientTimeout
+from structlog import get_logger
+
+from virtool_workflow.runtime.config import RunConfig
+from virtool_workflow.runtime.fixtures import LazyFixtureScope
+
+logger = get_logger("runtime")
+
+OTLP_SERVICE_NAME = "virtool-workflow"
+"""The service name reported to OpenTelemetry collectors."""
+
+OTLP_TIMEOUT = 10.0
+"""The number of seconds to wait for a collector to accept exported spans."""
+
+_NOOP_SPAN = nullcontext()
+
+
+@dataclass
+class Span:
+    """A named, timed operation that may be nested in another span."""
+
+    name: str
+    """The name of the operation."""
+
+    span_id: int
+    """A random 64-bit identifier for the span."""
+
+    parent_id: int | None
+    """The identifier of the enclosing span, if any."""
+
+    lane: int
+    """An identifier for the task or thread the span was recorded in."""
+
+    started_at: int
+    """The Unix time the span started at in nanoseconds."""
+
+    ended_at: int = 0
+    """The Unix time the span ended at in nanoseconds."""
+
+    attributes: dict[str, object] = field(default_factory=dict)
+    """Additional information about the operation."""
+
+    error: bool = False
+    """Whether the operation raised an exception."""
+
+
+_current_span: ContextVar[Span | None] = ContextVar("current_span", default=None)
+
+
+def _get_lane() -> int:
+    try:
+        task = asyncio.current_task()
+    except RuntimeError:
+        task = None
+
+    return id(task) if task else threading.get_ident()
+
+
+class Tracer:
+    """Records spans while enabled."""
+
+    def __init__(self):
+        self.enabled = False
+        """Whether spans are being recorded."""
+
+        self.spans: list[Span] = []
+        """The spans that have finished."""
+
+        self.trace_id = random.getrandbits(128)
+        """A random 128-bit identifier shared by all spans in the process."""
+
+        self.resource: dict[str, object] = {}
+        """Attributes describing the process, such as the job ID."""
+
+    def span(self, name: str, **attributes: object):
+        """Record a span for the duration of the context.
+
+        Spans opened while another span is open are nested in it. This includes spans
+        opened in tasks and threads started from within the context.
+
+        :param name: the name of the operation
+        :param attributes: additional information about the operation
+        """
+        if not self.enabled:
+            return _NOOP_SPAN
+
+        return self._span(name, attributes)
+
+    @contextmanager
+    def _span(self, name: str, attributes: dict[str, object]) -> Iterator[Span]:
+        parent = _current_span.get()
+
+        span = Span(
+            name=name,
+            span_id=random.getrandbits(64),
+            parent_id=parent.span_id if parent else None,
+            lane=_get_lane(),
+            started_at=time.time_ns(),
+            attributes=attributes,
+        )
+
+        token = _current_span.set(span)
+
+        try:
+            yield span
+        except BaseException as e:
+            span.error = True
+            span.attributes["exception"] = type(e).__name__
+            raise
+        finally:
+            span.ended_at = time.time_ns()
+            _current_span.reset(token)
+            self.spans.append(span)
+
+    def set_attributes(self, **attributes: object) -> None:
+        """Add attributes to the innermost open span, if tracing is enabled."""
+        if self.enabled and (span := _current_span.get()):
+            span.attributes.update(attributes)
+
+    def set_resource(self, **attributes: object) -> None:
+        """Add attributes describing the process to exported traces.
+
+        Unlike span attributes, these are recorded even if tracing is disabled, as they
+        are usually known before tracing starts.
+        """
+        self.resource.update(attributes)
+
+    def clear(self) -> None:
+        """Discard all recorded spans."""
+        self.spans.clear()
+
+
+tracer = Tracer()
+"""The tracer for the running workflow process."""
+
+
+class TracingFixtureScope(LazyFixtureScope):
+    """A :class:`.LazyFixtureScope` that records a span for each fixture it instantiates.
+
+    Fixtures that already have a value in the scope are not traced.
+    """
+
+    async def instantiate_by_key(self, key: str, *args, **kwargs):
+        span = (
+            _NOOP_SPAN if key in self else tracer.span(f"fixture {key}", fixture=key)
+        )
+
+        with span:
+            return await super().instantiate_by_key(key, *args, **kwargs)
+
+
+def to_chrome_trace(spans: list[Span]) -> dict:
+    """Convert ``spans`` to the Chrome trace event format.
+
+    Each task or thread spans were recorded in is shown as a separate track.
+
+    :param spans: the spans to convert
+    :return: a JSON-serializable trace
+    """
+    lanes: dict[int, int] = {}
+
+    events = []
+
+    for span in sorted(spans, key=lambda s: s.started_at):
+        tid = lanes.setdefault(span.lane, len(lanes) + 1)
+
+        events.append(
+            {
+                "name": span.name,
+                "cat": "error" if span.error else "workflow",
+                "ph": "X",
+                "ts": span.started_at / 1000,
+                "dur": (span.ended_at - span.started_at) / 1000,
+                "pid": os.getpid(),
+                "tid": tid,
+                "args": {key: str(value) for key, value in span.attributes.items()},
+            },
+        )
+
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+def write_chrome_trace(path: Path, spans: list[Span]) -> None:
+    """Write ``spans`` to a Chrome trace JSON file at ``path``.
+
+    :param path: the path to write the trace to
+    :param spans: the spans to write
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(to_chrome_trace(spans)))
+
+
+def _to_otlp_attributes(attributes: dict[str, object]) -> list[dict]:
+    otlp_attributes = []
+
+    for key, value in attributes.items():
+        if isinstance(value, bool):
+            otlp_value = {"boolValue": value}
+        elif isinstance(value, int):
+            otlp_value = {"intValue": str(value)}
+        elif isinstance(value, float):
+            otlp_value = {"doubleValue": value}
+        else:
+            otlp_value = {"stringValue": str(value)}
+
+        otlp_attributes.append({"key": key, "value": otlp_value})
+
+    return otlp_attributes
+
+
+def to_otlp(spans: list[Span], trace_id: int, **resource: object) -> dict:
+    """Convert ``spans`` to an OTLP/JSON trace export request.
+
+    :param spans: the spans to convert
+    :param trace_id: the 128-bit trace identifier shared by the spans
+    :param resource: attributes describing the process, such as the job ID
+    :return: a JSON-serializable export request
+    """
+    trace_id_hex = f"{trace_id:032x}"
+
+    return {
+        "resourceSpans": [
+            {
+                "resource": {
+                    "attributes": _to_otlp_attributes(
+                        {"service.name": OTLP_SERVICE_NAME, **resource},
+                    ),
+                },
+                "scopeSpans": [
+                    {
+                        "scope": {"name": "virtool_workflow"},
+                        "spans": [
+                            {
+                                "traceId": trace_id_hex,
+                                "spanId": f"{span.span_id:016x}",
+                                "parentSpanId": (
+                                    f"{span.parent_id:016x}" if span.parent_id else ""
+                                ),
+                                "name": span.name,
+                                "kind": 1,
+                                "startTimeUnixNano": str(span.started_at),
+                                "endTimeUnixNano": str(span.ended_at),
+                                "attributes": _to_otlp_attributes(span.attributes),
+                                "status": {"code": 2 if span.error else 1},
+                            }
+                            for span in spans
+                        ],
+                    },
+                ],
+            },
+        ],
+    }
+
+
+async def send_otlp(
+    endpoint: str,
+    spans: list[Span],
+    trace_id: int,
+    **resource: object,
+) -> None:
+    """Send ``spans`` to an OpenTelemetry collector using OTLP/JSON over HTTP.
+
+    Failures are logged rather than raised, so an unavailable collector does not fail
+    the job.
+
+    :param endpoint: the collector traces endpoint (eg. ``http://localhost:4318/v1/traces``)
+    :param spans: the spans to send
+    :param trace_id: the 128-bit trace identifier shared by the spans
+    :param resource: attributes describing the process, such as the job ID
+    """
+    try:
+        async with (
+            ClientSession(timeout=ClientTimeout(total=OTLP_TIMEOUT)) as http,
+            http.post(endpoint, json=to_otlp(spans, trace_id, **resource)) as resp,
+        ):
+            resp.raise_for_status()
+    except (ClientError, OSError, TimeoutError) as e:
+        logger.warning("could not export spans", endpoint=endpoint, exception=str(e))
+        return
+
+    logger.info("exported spans", count=len(spans), endpoint=endpoint)
+
+
+@asynccontextmanager
+async def export_traces(config: RunConfig) -> AsyncIterator[None]:
+    """Record spans while the context is open and export them when it exits.
+
+    Tracing is only enabled if ``config.trace_path`` or ``config.trace_otlp_endpoint``
+    is set.
+
+    :param config: the run configuration
+    """
+    if not (config.trace_path or config.trace_otlp_endpoint):
+        yield
+        return
+
+    tracer.enabled = True
+
+    try:
+        yield
+    finally:
+        tracer.enabled = False
+
+        if config.trace_path:
+            await asyncio.to_thread(write_chrome_trace, config.trace_path, tracer.spans)
+            logger.info("wrote trace", path=str(config.trace_path))
+
+        if config.trace_otlp_endpoint:
+            await send_otlp(
+                config.trace_otlp_endpoint,
+                tracer.spans,
+                tracer.trace_id,
+                **tracer.resource,
+            )